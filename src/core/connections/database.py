@@ -11,16 +11,78 @@
 """
 
 import asyncio
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Dict, Optional
 
-from sqlalchemy import text
+import orjson
+from pgvector.asyncpg import register_vector
+from sqlalchemy import event, text
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
                                     async_sessionmaker, create_async_engine)
+from sqlalchemy.orm import ORMExecuteState, Session
 
 from src.core.connections.base import BaseClient, BaseContextManager
 from src.core.settings import Settings, settings
 
 
+def _orjson_dumps(value: Any) -> str:
+    """Сериализует значение JSON/JSONB колонки через orjson (str для драйвера)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _json_engine_params() -> Dict[str, Any]:
+    """
+    Сериализатор/десериализатор JSON/JSONB колонок для engine (orjson,
+    C-реализация, вместо стандартного json SQLAlchemy).
+    """
+    return {"json_serializer": _orjson_dumps, "json_deserializer": orjson.loads}
+
+
+def _register_vector_codecs(dbapi_connection: Any, connection_record: Any) -> None:
+    """
+    Регистрирует бинарные кодеки pgvector (vector, halfvec, sparsevec) на новом
+    соединении пула.
+
+    Embedding передаются и читаются в бинарном формате вместо текста '[...]':
+    для halfvec(1536) это 3KB вместо ~25KB на строку и без разбора float в Python.
+    Типы колонок должны отдавать драйверу объекты pgvector (см. BinaryHalfVec).
+    """
+    dbapi_connection.run_async(register_vector)
+
+
+def _raise_on_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    """
+    Запрещает ленивую загрузку relationship (включается DB_RAISE_ON_LAZY_LOAD).
+
+    Срабатывает только на lazy="select"-загрузки (lazy_loaded_from), явные
+    selectinload/joinedload и запросы репозиториев проходят как обычно.
+    Используется в dev/CI, чтобы N+1 обнаруживался до продакшена.
+
+    Пропускаются:
+        - ORM INSERT/UPDATE/DELETE (lazy_loaded_from доступен только для SELECT);
+        - загрузки eager-relationship (lazy="selectin"/"joined"/...) через
+          immediateload, которые порождает session.refresh().
+
+    Raises:
+        InvalidRequestError: Если запрос порождён ленивой загрузкой атрибута.
+    """
+    if not orm_execute_state.is_select:
+        return
+
+    state = orm_execute_state.lazy_loaded_from
+    if state is None:
+        return
+
+    prop = getattr(orm_execute_state.loader_strategy_path, "prop", None)
+    if prop is not None and prop.lazy not in ("select", True):
+        return
+
+    raise InvalidRequestError(
+        f"Ленивая загрузка {orm_execute_state.loader_strategy_path} "
+        f"для {state.class_.__name__}: добавьте selectinload/joinedload в запрос"
+    )
+
+
 class DatabaseClient(BaseClient):
     """
     Singleton клиент для работы с базой данных.
@@ -112,8 +174,14 @@ class DatabaseClient(BaseClient):
 
             self._engine = create_async_engine(
                 url=self._settings.database_url,
+                **_json_engine_params(),
                 **self._settings.engine_params,
             )
+            event.listen(self._engine.sync_engine, "connect", _register_vector_codecs)
+            if self._settings.DB_RAISE_ON_LAZY_LOAD and not event.contains(
+                Session, "do_orm_execute", _raise_on_lazy_load
+            ):
+                event.listen(Session, "do_orm_execute", _raise_on_lazy_load)
 
             self._session_factory = async_sessionmaker(
                 bind=self._engine, **self._settings.session_params
@@ -0,0 +1,84 @@
+"""
+Модуль периодического обновления статистики Knowledge Base для FastAPI-приложения.
+
+Назначение:
+- Запускает фоновую задачу, которая раз в KB_STATS_REFRESH_INTERVAL секунд
+  выполняет REFRESH MATERIALIZED VIEW CONCURRENTLY mv_kb_stats.
+- Останавливает задачу при завершении работы приложения.
+
+Используемые механизмы:
+- Декораторы register_startup_handler и register_shutdown_handler регистрируют функции для событий старта и остановки FastAPI.
+- Модуль импортируется до src.core.lifespan.database: обработчики выполняются
+  в порядке регистрации, поэтому задача останавливается раньше, чем закрывается
+  подключение к PostgreSQL. Сессии берутся из app.state.pg_client при каждом
+  обновлении, к этому моменту клиент уже инициализирован.
+
+Экспортируемые функции:
+- start_kb_stats_refresh: Запуск фоновой задачи обновления mv_kb_stats.
+- stop_kb_stats_refresh: Остановка фоновой задачи.
+"""
+
+import asyncio
+import logging
+
+from fastapi import FastAPI
+
+from src.core.lifespan.base import register_shutdown_handler, register_startup_handler
+from src.core.settings import settings
+from src.repository.v1.knowledge_bases import KnowledgeBaseRepository
+
+logger = logging.getLogger("src.core.lifespan.kb_stats")
+
+
+async def _refresh_kb_stats_loop(app: FastAPI, interval: int) -> None:
+    """
+    Обновляет mv_kb_stats каждые interval секунд до отмены задачи.
+
+    Ошибка одного обновления логируется и не останавливает цикл.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            session_factory = app.state.pg_client.get_session_factory()
+            async with session_factory() as session:
+                await KnowledgeBaseRepository(session).refresh_stats()
+        except Exception as e:
+            logger.error("Ошибка обновления mv_kb_stats: %s", e)
+
+
+@register_startup_handler
+async def start_kb_stats_refresh(app: FastAPI) -> None:
+    """
+    Запуск фоновой задачи обновления mv_kb_stats при старте приложения.
+
+    Args:
+        app (FastAPI): Экземпляр приложения FastAPI.
+    """
+    interval = settings.KB_STATS_REFRESH_INTERVAL
+    if interval <= 0:
+        logger.info("Обновление mv_kb_stats отключено в настройках")
+        return
+
+    app.state.kb_stats_task = asyncio.create_task(_refresh_kb_stats_loop(app, interval))
+    logger.info("Обновление mv_kb_stats запущено (каждые %d с)", interval)
+
+
+@register_shutdown_handler
+async def stop_kb_stats_refresh(app: FastAPI) -> None:
+    """
+    Остановка фоновой задачи обновления mv_kb_stats.
+
+    Выполняется до закрытия подключения к PostgreSQL; текущее обновление
+    прерывается отменой задачи (транзакция откатывается при закрытии сессии).
+
+    Args:
+        app (FastAPI): Экземпляр приложения FastAPI.
+    """
+    task = getattr(app.state, "kb_stats_task", None)
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
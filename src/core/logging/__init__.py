@@ -45,9 +45,12 @@ def setup_logging():
         for handler in root.handlers:
             root.removeHandler(handler)
 
+    # Форматтеры создаются один раз и переиспользуются всеми хендлерами
+    json_formatter = CustomJsonFormatter()
+
     # Консольный хендлер с pretty/json форматом из конфига
     console_formatter = (
-        CustomJsonFormatter()
+        json_formatter
         if settings.logging.LOG_FORMAT == "json"
         else PrettyFormatter()
     )
@@ -79,7 +82,7 @@ def setup_logging():
                 mode=settings.logging.FILE_MODE,
                 encoding=settings.logging.ENCODING,
             )
-            file_handler.setFormatter(CustomJsonFormatter())
+            file_handler.setFormatter(json_formatter)
             root.addHandler(file_handler)
             print(f"✅ Логи будут писаться в: {log_path}")
         except (PermissionError, OSError) as e:
@@ -100,7 +103,7 @@ def setup_logging():
                 mode=settings.logging.FILE_MODE,
                 encoding=settings.logging.ENCODING,
             )
-            file_handler.setFormatter(CustomJsonFormatter())
+            file_handler.setFormatter(json_formatter)
             root.addHandler(file_handler)
             print(f"✅ Используем резервный путь для логов: {fallback_path}")
         except (PermissionError, OSError) as e:
@@ -47,6 +47,11 @@ class PrettyFormatter(logging.Formatter):
 
     RESET = "\033[0m"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Шаблон в {}-стиле разбирается один раз, а не на каждую запись
+        self._template = settings.logging.PRETTY_FORMAT.format_map
+
     def format(self, record):
         """
         Форматирует запись лога с цветами и эмодзи.
@@ -92,12 +97,14 @@ class PrettyFormatter(logging.Formatter):
 
         emoji = self.EMOJIS.get(record.levelname, "")
 
-        base_msg = settings.logging.PRETTY_FORMAT % {
-            "asctime": self.formatTime(record),
-            "name": record.name,
-            "levelname": f"{self.COLORS.get(record.levelname, '')}{record.levelname} {self.RESET}",
-            "message": f"{emoji} {record.getMessage()}",
-        }
+        base_msg = self._template(
+            {
+                "asctime": self.formatTime(record),
+                "name": record.name,
+                "levelname": f"{self.COLORS.get(record.levelname, '')}{record.levelname} {self.RESET}",
+                "message": f"{emoji} {record.getMessage()}",
+            }
+        )
 
         return f"{base_msg} {extra_msg}" if extra_msg else base_msg
 
@@ -116,6 +123,14 @@ class CustomJsonFormatter(logging.Formatter):
         logger.addHandler(handler)
     """
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Пары (ключ, шаблон) подготавливаются один раз при создании форматтера
+        self._fields = tuple(
+            (key, value.format_map)
+            for key, value in settings.logging.JSON_FORMAT.items()
+        )
+
     def format(self, record):
         """
         Форматирует запись лога в JSON формате.
@@ -126,20 +141,21 @@ class CustomJsonFormatter(logging.Formatter):
         Returns:
             str: Отформатированная строка лога в JSON формате
         """
-        log_data = settings.logging.JSON_FORMAT.copy()
+        values = {
+            "asctime": self.formatTime(record),
+            "levelname": record.levelname,
+            "module": record.module,
+            "funcName": record.funcName,
+            "message": record.getMessage(),
+        }
 
-        for key, value in log_data.items():
+        log_data = {}
+        for key, render in self._fields:
             if key == "timestamp":
                 # Используем datetime для форматирования с микросекундами
                 dt = datetime.fromtimestamp(record.created)
                 log_data[key] = dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
             else:
-                log_data[key] = value % {
-                    "asctime": self.formatTime(record),
-                    "levelname": record.levelname,
-                    "module": record.module,
-                    "funcName": record.funcName,
-                    "message": record.getMessage(),
-                }
+                log_data[key] = render(values)
 
         return json.dumps(log_data, ensure_ascii=False)
@@ -8,6 +8,10 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from src.core.settings import settings
 from src.models import BaseModel
+from src.models.v1 import load_models
+
+# Пакет моделей импортируется лениво — для autogenerate нужны все таблицы
+load_models()
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,79 @@
+"""timestamptz for last_triggered_at and indexed_at
+
+Revision ID: 03eaca2ec919
+Revises: 6f5736468bf2
+Create Date: 2026-10-17 02:05:20.215122
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '03eaca2ec919'
+down_revision: Union[str, Sequence[str], None] = '6f5736468bf2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Переводит n8n_workflows.last_triggered_at (VARCHAR) и documents.indexed_at
+    (TIMESTAMP) на TIMESTAMP WITH TIME ZONE.
+
+    Существующие значения считаются UTC. Добавляет частичный индекс
+    ix_n8n_workflows_active_triggered для выборок планировщика.
+    """
+    op.alter_column(
+        'n8n_workflows',
+        'last_triggered_at',
+        existing_type=sa.String(),
+        type_=sa.DateTime(timezone=True),
+        existing_nullable=True,
+        existing_comment='Дата последнего запуска workflow',
+        postgresql_using="last_triggered_at::timestamp AT TIME ZONE 'UTC'",
+    )
+    op.alter_column(
+        'documents',
+        'indexed_at',
+        existing_type=sa.DateTime(),
+        type_=sa.DateTime(timezone=True),
+        existing_nullable=True,
+        existing_comment='Дата завершения индексации',
+        postgresql_using="indexed_at AT TIME ZONE 'UTC'",
+    )
+    op.create_index(
+        'ix_n8n_workflows_active_triggered',
+        'n8n_workflows',
+        ['is_active', 'last_triggered_at'],
+        unique=False,
+        postgresql_where=sa.text('is_active = true'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_n8n_workflows_active_triggered',
+        table_name='n8n_workflows',
+        postgresql_where=sa.text('is_active = true'),
+    )
+    op.alter_column(
+        'documents',
+        'indexed_at',
+        existing_type=sa.DateTime(timezone=True),
+        type_=sa.DateTime(),
+        existing_nullable=True,
+        existing_comment='Дата завершения индексации',
+        postgresql_using="indexed_at AT TIME ZONE 'UTC'",
+    )
+    op.alter_column(
+        'n8n_workflows',
+        'last_triggered_at',
+        existing_type=sa.DateTime(timezone=True),
+        type_=sa.String(),
+        existing_nullable=True,
+        existing_comment='Дата последнего запуска workflow',
+        postgresql_using='last_triggered_at::text',
+    )
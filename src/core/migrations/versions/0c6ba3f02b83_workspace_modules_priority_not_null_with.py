@@ -0,0 +1,54 @@
+"""workspace_modules priority not null with ranking index
+
+Revision ID: 0c6ba3f02b83
+Revises: f72872285c60
+Create Date: 2026-10-17 01:44:10.196928
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0c6ba3f02b83'
+down_revision: Union[str, Sequence[str], None] = 'f72872285c60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Делает workspace_modules.priority NOT NULL DEFAULT 0.
+
+    Существующие NULL приводятся к 0. Добавляет индекс (workspace_id, priority DESC)
+    для выборки модулей workspace в порядке приоритета без сортировки.
+    """
+    op.execute("UPDATE workspace_modules SET priority = 0 WHERE priority IS NULL")
+    op.alter_column(
+        'workspace_modules',
+        'priority',
+        existing_type=sa.Integer(),
+        nullable=False,
+        server_default='0',
+        existing_comment='Приоритет для ранжирования (выше = важнее)',
+    )
+    op.create_index(
+        'ix_workspace_modules_ws_prio',
+        'workspace_modules',
+        ['workspace_id', sa.text('priority DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_workspace_modules_ws_prio', table_name='workspace_modules')
+    op.alter_column(
+        'workspace_modules',
+        'priority',
+        existing_type=sa.Integer(),
+        nullable=True,
+        server_default=None,
+        existing_comment='Приоритет для ранжирования (выше = важнее)',
+    )
@@ -0,0 +1,80 @@
+"""document_chunks denormalized kb_id
+
+Revision ID: 13cdec9c7175
+Revises: f8521c827547
+Create Date: 2026-10-17 02:07:52.567987
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '13cdec9c7175'
+down_revision: Union[str, Sequence[str], None] = 'f8521c827547'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Денормализует documents.kb_id в document_chunks.kb_id.
+
+    - Колонка заполняется для существующих чанков и становится NOT NULL + FK.
+    - Триггер BEFORE INSERT OR UPDATE OF document_id копирует kb_id из documents
+      (работает и для COPY, и для INSERT без kb_id).
+    - Индекс ix_document_chunks_kb_covering (kb_id) INCLUDE (document_id)
+      для фильтрации RAG поиска по KB без JOIN.
+    """
+    op.add_column(
+        'document_chunks',
+        sa.Column(
+            'kb_id',
+            sa.UUID(),
+            nullable=True,
+            comment='UUID knowledge base (копия documents.kb_id)',
+        ),
+    )
+    op.execute(
+        "UPDATE document_chunks c SET kb_id = d.kb_id "
+        "FROM documents d WHERE d.id = c.document_id"
+    )
+    op.alter_column('document_chunks', 'kb_id', nullable=False)
+    op.create_foreign_key(
+        'document_chunks_kb_id_fkey',
+        'document_chunks',
+        'knowledge_bases',
+        ['kb_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION document_chunks_set_kb_id() RETURNS trigger AS $$
+        BEGIN
+            SELECT kb_id INTO NEW.kb_id FROM documents WHERE id = NEW.document_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER document_chunks_set_kb_id
+        BEFORE INSERT OR UPDATE OF document_id ON document_chunks
+        FOR EACH ROW EXECUTE FUNCTION document_chunks_set_kb_id()
+    """)
+    op.create_index(
+        'ix_document_chunks_kb_covering',
+        'document_chunks',
+        ['kb_id'],
+        unique=False,
+        postgresql_include=['document_id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_document_chunks_kb_covering', table_name='document_chunks')
+    op.execute('DROP TRIGGER IF EXISTS document_chunks_set_kb_id ON document_chunks')
+    op.execute('DROP FUNCTION IF EXISTS document_chunks_set_kb_id()')
+    op.drop_constraint('document_chunks_kb_id_fkey', 'document_chunks', type_='foreignkey')
+    op.drop_column('document_chunks', 'kb_id')
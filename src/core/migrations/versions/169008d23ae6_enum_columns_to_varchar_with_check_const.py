@@ -0,0 +1,137 @@
+"""enum columns to varchar with check constraints
+
+Revision ID: 169008d23ae6
+Revises: ad73c8ca9f8f
+Create Date: 2026-10-17 01:50:48.145905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '169008d23ae6'
+down_revision: Union[str, Sequence[str], None] = 'ad73c8ca9f8f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Переводит PG ENUM колонки на VARCHAR(16) + CHECK.
+
+    - issues.status: метки 'RED'/'GREEN' (имена членов) переводятся в значения 'red'/'green'.
+    - issues.visibility, document_services.file_type/cover_type: значения сохраняются как есть.
+    Типы issue_status, issue_visibility, documentfiletype, covertype удаляются.
+    """
+    op.alter_column('issues', 'visibility', server_default=None)
+    op.alter_column('document_services', 'cover_type', server_default=None)
+
+    op.alter_column(
+        'issues', 'status',
+        existing_type=postgresql.ENUM('RED', 'GREEN', name='issue_status'),
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using='lower(status::text)',
+    )
+    op.alter_column(
+        'issues', 'visibility',
+        existing_type=postgresql.ENUM('public', 'workspace', 'private', name='issue_visibility'),
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using='visibility::text',
+    )
+    op.alter_column(
+        'document_services', 'file_type',
+        existing_type=postgresql.ENUM(name='documentfiletype'),
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using='file_type::text',
+    )
+    op.alter_column(
+        'document_services', 'cover_type',
+        existing_type=postgresql.ENUM('generated', 'icon', 'image', name='covertype'),
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using='cover_type::text',
+    )
+
+    op.alter_column('issues', 'visibility', server_default='public')
+    op.alter_column('document_services', 'cover_type', server_default='generated')
+
+    op.execute('DROP TYPE IF EXISTS issue_status')
+    op.execute('DROP TYPE IF EXISTS issue_visibility')
+    op.execute('DROP TYPE IF EXISTS documentfiletype')
+    op.execute('DROP TYPE IF EXISTS covertype')
+
+    op.create_check_constraint(
+        'check_issues_status_valid', 'issues', "status IN ('red', 'green')"
+    )
+    op.create_check_constraint(
+        'check_issues_visibility_valid',
+        'issues',
+        "visibility IN ('public', 'workspace', 'private')",
+    )
+    op.create_check_constraint(
+        'check_document_services_file_type_valid',
+        'document_services',
+        "file_type IN ('pdf', 'doc', 'docx', 'txt', 'md', 'spreadsheet', 'text', 'image')",
+    )
+    op.create_check_constraint(
+        'check_document_services_cover_type_valid',
+        'document_services',
+        "cover_type IN ('generated', 'icon', 'image')",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('check_document_services_cover_type_valid', 'document_services', type_='check')
+    op.drop_constraint('check_document_services_file_type_valid', 'document_services', type_='check')
+    op.drop_constraint('check_issues_visibility_valid', 'issues', type_='check')
+    op.drop_constraint('check_issues_status_valid', 'issues', type_='check')
+
+    op.execute("CREATE TYPE issue_status AS ENUM ('RED', 'GREEN')")
+    op.execute("CREATE TYPE issue_visibility AS ENUM ('public', 'workspace', 'private')")
+    op.execute(
+        "CREATE TYPE documentfiletype AS ENUM "
+        "('pdf', 'spreadsheet', 'text', 'image', 'doc', 'docx', 'txt', 'md')"
+    )
+    op.execute("CREATE TYPE covertype AS ENUM ('generated', 'icon', 'image')")
+
+    op.alter_column('issues', 'visibility', server_default=None)
+    op.alter_column('document_services', 'cover_type', server_default=None)
+
+    op.alter_column(
+        'issues', 'status',
+        existing_type=sa.String(length=16),
+        type_=postgresql.ENUM(name='issue_status', create_type=False),
+        existing_nullable=False,
+        postgresql_using='upper(status)::issue_status',
+    )
+    op.alter_column(
+        'issues', 'visibility',
+        existing_type=sa.String(length=16),
+        type_=postgresql.ENUM(name='issue_visibility', create_type=False),
+        existing_nullable=False,
+        postgresql_using='visibility::issue_visibility',
+    )
+    op.alter_column(
+        'document_services', 'file_type',
+        existing_type=sa.String(length=16),
+        type_=postgresql.ENUM(name='documentfiletype', create_type=False),
+        existing_nullable=False,
+        postgresql_using='file_type::documentfiletype',
+    )
+    op.alter_column(
+        'document_services', 'cover_type',
+        existing_type=sa.String(length=16),
+        type_=postgresql.ENUM(name='covertype', create_type=False),
+        existing_nullable=False,
+        postgresql_using='cover_type::covertype',
+    )
+
+    op.alter_column('issues', 'visibility', server_default='public')
+    op.alter_column('document_services', 'cover_type', server_default='generated')
@@ -0,0 +1,51 @@
+"""workspace_modules unique workspace module pair
+
+Revision ID: 199d8e71466b
+Revises: 0c6ba3f02b83
+Create Date: 2026-10-17 01:44:30.413055
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '199d8e71466b'
+down_revision: Union[str, Sequence[str], None] = '0c6ba3f02b83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Добавляет UNIQUE (workspace_id, module_id) на workspace_modules.
+
+    Перед созданием ограничения удаляет дубликаты пар, оставляя самую свежую
+    запись. Индекс ix_workspace_modules_workspace_id удаляется: его покрывает
+    уникальный индекс, где workspace_id — ведущая колонка.
+    """
+    op.execute(
+        """
+        DELETE FROM workspace_modules a
+        USING workspace_modules b
+        WHERE a.workspace_id = b.workspace_id
+          AND a.module_id = b.module_id
+          AND (a.updated_at, a.id) < (b.updated_at, b.id)
+        """
+    )
+    op.create_unique_constraint(
+        'uq_workspace_module', 'workspace_modules', ['workspace_id', 'module_id']
+    )
+    op.drop_index(op.f('ix_workspace_modules_workspace_id'), table_name='workspace_modules')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f('ix_workspace_modules_workspace_id'),
+        'workspace_modules',
+        ['workspace_id'],
+        unique=False,
+    )
+    op.drop_constraint('uq_workspace_module', 'workspace_modules', type_='unique')
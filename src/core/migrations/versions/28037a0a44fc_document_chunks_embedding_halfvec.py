@@ -0,0 +1,83 @@
+"""document_chunks embedding halfvec
+
+Revision ID: 28037a0a44fc
+Revises: da16401a4ee1
+Create Date: 2026-10-17 02:00:36.548931
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import HALFVEC, Vector
+
+# revision identifiers, used by Alembic.
+revision: str = '28037a0a44fc'
+down_revision: Union[str, Sequence[str], None] = 'da16401a4ee1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Переводит document_chunks.embedding с vector(1536) на halfvec(1536).
+
+    FP16 вдвое уменьшает размер строки и HNSW индекса. Индекс пересоздаётся
+    с halfvec_cosine_ops (vector_cosine_ops к halfvec неприменим).
+    """
+    op.drop_index(
+        'ix_document_chunks_embedding',
+        table_name='document_chunks',
+        postgresql_using='hnsw',
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
+    op.alter_column(
+        'document_chunks',
+        'embedding',
+        existing_type=Vector(1536),
+        type_=HALFVEC(1536),
+        existing_nullable=False,
+        comment='Vector embedding для RAG поиска (1536 dimensions, halfvec)',
+        existing_comment='Vector embedding для RAG поиска (1536 dimensions)',
+        postgresql_using='embedding::halfvec(1536)',
+    )
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute('SET LOCAL max_parallel_maintenance_workers = 7')
+    op.create_index(
+        'ix_document_chunks_embedding',
+        'document_chunks',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 24, 'ef_construction': 128},
+        postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_document_chunks_embedding',
+        table_name='document_chunks',
+        postgresql_using='hnsw',
+        postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+    )
+    op.alter_column(
+        'document_chunks',
+        'embedding',
+        existing_type=HALFVEC(1536),
+        type_=Vector(1536),
+        existing_nullable=False,
+        comment='Vector embedding для RAG поиска (1536 dimensions)',
+        existing_comment='Vector embedding для RAG поиска (1536 dimensions, halfvec)',
+        postgresql_using='embedding::vector(1536)',
+    )
+    op.create_index(
+        'ix_document_chunks_embedding',
+        'document_chunks',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 24, 'ef_construction': 128},
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
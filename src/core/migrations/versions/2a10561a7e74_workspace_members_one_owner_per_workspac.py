@@ -0,0 +1,46 @@
+"""workspace_members one owner per workspace
+
+Revision ID: 2a10561a7e74
+Revises: e1fb3c9814c3
+Create Date: 2026-10-17 02:25:02.558672
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2a10561a7e74'
+down_revision: Union[str, Sequence[str], None] = 'e1fb3c9814c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Добавляет частичный уникальный индекс: не более одного OWNER на workspace.
+
+    Лишние записи OWNER (пользователь не совпадает с workspaces.owner_id)
+    понижаются до ADMIN, затем индекс строится CONCURRENTLY вне транзакции.
+    """
+    op.execute(
+        """
+        UPDATE workspace_members m
+        SET role = 'admin'
+        FROM workspaces w
+        WHERE m.workspace_id = w.id
+          AND m.role = 'owner'
+          AND m.user_id <> w.owner_id
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_one_owner_per_ws "
+            "ON workspace_members (workspace_id) WHERE role = 'owner'"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_one_owner_per_ws', table_name='workspace_members')
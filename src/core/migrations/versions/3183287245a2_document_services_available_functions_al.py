@@ -0,0 +1,34 @@
+"""document_services available_functions always array
+
+Revision ID: 3183287245a2
+Revises: 8b634e06eac6
+Create Date: 2026-10-17 01:48:37.877466
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3183287245a2'
+down_revision: Union[str, Sequence[str], None] = '8b634e06eac6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Приводит available_functions к JSONB-массиву: строки с объектом/скаляром получают '[]'."""
+    op.execute(
+        """
+        UPDATE document_services
+        SET available_functions = '[]'::jsonb
+        WHERE jsonb_typeof(available_functions) <> 'array'
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Исходная форма некорректных значений не восстанавливается
+    pass
@@ -0,0 +1,80 @@
+"""workspace enum columns to varchar with check constraints
+
+Revision ID: 3b53d3b19253
+Revises: 7de67aec5d3b
+Create Date: 2026-10-17 02:23:59.711620
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3b53d3b19253'
+down_revision: Union[str, Sequence[str], None] = '7de67aec5d3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Переводит workspaces.visibility и workspace_members.role с PG ENUM на VARCHAR(16) + CHECK.
+
+    Метки ENUM ('PUBLIC', 'OWNER', ...) — имена членов; в колонках остаются
+    значения ('public', 'owner', ...). Типы workspace_visibility и
+    workspace_member_role удаляются.
+    """
+    op.alter_column(
+        'workspaces', 'visibility',
+        existing_type=postgresql.ENUM('PUBLIC', 'PRIVATE', name='workspace_visibility'),
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using='lower(visibility::text)',
+    )
+    op.alter_column(
+        'workspace_members', 'role',
+        existing_type=postgresql.ENUM('OWNER', 'ADMIN', 'MEMBER', name='workspace_member_role'),
+        type_=sa.String(length=16),
+        existing_nullable=False,
+        postgresql_using='lower(role::text)',
+    )
+
+    op.execute('DROP TYPE IF EXISTS workspace_visibility')
+    op.execute('DROP TYPE IF EXISTS workspace_member_role')
+
+    op.create_check_constraint(
+        'check_workspaces_visibility_valid',
+        'workspaces',
+        "visibility IN ('public', 'private')",
+    )
+    op.create_check_constraint(
+        'check_workspace_members_role_valid',
+        'workspace_members',
+        "role IN ('owner', 'admin', 'member')",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('check_workspace_members_role_valid', 'workspace_members', type_='check')
+    op.drop_constraint('check_workspaces_visibility_valid', 'workspaces', type_='check')
+
+    op.execute("CREATE TYPE workspace_visibility AS ENUM ('PUBLIC', 'PRIVATE')")
+    op.execute("CREATE TYPE workspace_member_role AS ENUM ('OWNER', 'ADMIN', 'MEMBER')")
+
+    op.alter_column(
+        'workspaces', 'visibility',
+        existing_type=sa.String(length=16),
+        type_=postgresql.ENUM(name='workspace_visibility', create_type=False),
+        existing_nullable=False,
+        postgresql_using='upper(visibility)::workspace_visibility',
+    )
+    op.alter_column(
+        'workspace_members', 'role',
+        existing_type=sa.String(length=16),
+        type_=postgresql.ENUM(name='workspace_member_role', create_type=False),
+        existing_nullable=False,
+        postgresql_using='upper(role)::workspace_member_role',
+    )
@@ -0,0 +1,34 @@
+"""issues custom_fields gin index
+
+Revision ID: 50c1097a0431
+Revises: dea5bf0a3a31
+Create Date: 2026-10-17 01:52:09.684117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '50c1097a0431'
+down_revision: Union[str, Sequence[str], None] = 'dea5bf0a3a31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Добавляет GIN индекс (jsonb_path_ops) на issues.custom_fields."""
+    op.create_index(
+        'ix_issues_custom_fields_gin',
+        'issues',
+        ['custom_fields'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'custom_fields': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issues_custom_fields_gin', table_name='issues')
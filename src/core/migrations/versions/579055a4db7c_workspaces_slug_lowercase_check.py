@@ -0,0 +1,34 @@
+"""workspaces slug lowercase check
+
+Revision ID: 579055a4db7c
+Revises: 824643fe66c7
+Create Date: 2026-10-17 02:28:31.294159
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '579055a4db7c'
+down_revision: Union[str, Sequence[str], None] = '824643fe66c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Добавляет CHECK slug = lower(slug) на workspaces.
+
+    Существующие slug приводятся к нижнему регистру до создания ограничения.
+    """
+    op.execute("UPDATE workspaces SET slug = lower(slug) WHERE slug <> lower(slug)")
+    op.create_check_constraint(
+        'check_workspaces_slug_lowercase', 'workspaces', "slug = lower(slug)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('check_workspaces_slug_lowercase', 'workspaces', type_='check')
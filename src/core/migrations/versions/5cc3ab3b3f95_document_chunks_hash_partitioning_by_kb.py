@@ -0,0 +1,200 @@
+"""document_chunks hash partitioning by kb_id
+
+Revision ID: 5cc3ab3b3f95
+Revises: c4dd46f1a815
+Create Date: 2026-10-17 02:12:34.972542
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import BIT, HALFVEC
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5cc3ab3b3f95'
+down_revision: Union[str, Sequence[str], None] = 'c4dd46f1a815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_PARTITIONS = 16
+
+# Колонки, переносимые между старой и новой таблицей (embedding_bits генерируется)
+_COPY_COLUMNS = (
+    'id, document_id, kb_id, chunk_index, content, embedding, '
+    'token_count, chunk_metadata, created_at, updated_at'
+)
+
+
+def _create_table(**kwargs) -> None:
+    """Создаёт document_chunks без PK, FK и индексов (они добавляются после переноса)."""
+    op.create_table(
+        'document_chunks',
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('document_id', sa.UUID(), nullable=False, comment='UUID документа'),
+        sa.Column(
+            'kb_id',
+            sa.UUID(),
+            nullable=False,
+            comment='UUID knowledge base (копия documents.kb_id)',
+        ),
+        sa.Column(
+            'chunk_index',
+            sa.Integer(),
+            nullable=False,
+            comment='Порядковый номер чанка в документе',
+        ),
+        sa.Column('content', sa.Text(), nullable=False, comment='Текстовое содержимое чанка'),
+        sa.Column(
+            'embedding',
+            HALFVEC(1536),
+            nullable=False,
+            comment='Vector embedding для RAG поиска (1536 dimensions, halfvec)',
+        ),
+        sa.Column(
+            'embedding_bits',
+            BIT(1536),
+            sa.Computed('binary_quantize(embedding)::bit(1536)', persisted=True),
+            nullable=False,
+            comment='binary_quantize(embedding) для двухэтапного ANN поиска',
+        ),
+        sa.Column('token_count', sa.Integer(), nullable=False, comment='Количество токенов в чанке'),
+        sa.Column(
+            'chunk_metadata',
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+            comment='Дополнительные метаданные чанка',
+        ),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.CheckConstraint('chunk_index >= 0', name='check_chunk_index_positive'),
+        sa.CheckConstraint('token_count > 0', name='check_token_count_positive'),
+        **kwargs,
+    )
+
+
+def _create_constraints_and_indexes(unique_columns: list[str]) -> None:
+    """Внешние ключи, индексы и триггеры счётчика chunks_count для document_chunks."""
+    op.create_foreign_key(
+        'document_chunks_document_id_fkey',
+        'document_chunks',
+        'documents',
+        ['document_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+    op.create_foreign_key(
+        'document_chunks_kb_id_fkey',
+        'document_chunks',
+        'knowledge_bases',
+        ['kb_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+    op.create_index(
+        op.f('ix_document_chunks_document_id'), 'document_chunks', ['document_id'], unique=False
+    )
+    op.create_index(
+        'ix_document_chunks_document_index', 'document_chunks', unique_columns, unique=True
+    )
+    op.create_index(
+        'ix_document_chunks_kb_covering',
+        'document_chunks',
+        ['kb_id'],
+        unique=False,
+        postgresql_include=['document_id'],
+    )
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute('SET LOCAL max_parallel_maintenance_workers = 7')
+    op.create_index(
+        'ix_document_chunks_embedding',
+        'document_chunks',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 24, 'ef_construction': 128},
+        postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+    )
+    op.create_index(
+        'ix_document_chunks_embedding_bits',
+        'document_chunks',
+        ['embedding_bits'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding_bits': 'bit_hamming_ops'},
+    )
+    # Функция documents_chunks_count_trg() пережила DROP TABLE, триггеры — нет
+    op.execute(
+        "CREATE TRIGGER documents_chunks_count_insert AFTER INSERT ON document_chunks "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION documents_chunks_count_trg()"
+    )
+    op.execute(
+        "CREATE TRIGGER documents_chunks_count_delete AFTER DELETE ON document_chunks "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION documents_chunks_count_trg()"
+    )
+
+
+def upgrade() -> None:
+    """
+    Партиционирует document_chunks по HASH (kb_id) на 16 партиций.
+
+    - Таблица пересоздаётся как партиционированная, данные переносятся INSERT ... SELECT
+      (embedding_bits генерируется заново).
+    - PK становится (id, kb_id), уникальный индекс — (document_id, chunk_index, kb_id):
+      ограничения уникальности обязаны включать ключ партиционирования.
+    - Индексы, в т.ч. оба HNSW, создаются на родителе и строятся в каждой
+      партиции отдельно: поиск по одной KB обходит граф только своей партиции.
+    - Триггер document_chunks_set_kb_id удаляется: партиция выбирается до
+      BEFORE-триггеров, поэтому kb_id передаёт приложение.
+    """
+    op.execute('DROP TRIGGER IF EXISTS document_chunks_set_kb_id ON document_chunks')
+    op.execute('DROP FUNCTION IF EXISTS document_chunks_set_kb_id()')
+    op.execute('ALTER TABLE document_chunks RENAME TO document_chunks_unpartitioned')
+
+    _create_table(postgresql_partition_by='HASH (kb_id)')
+    for remainder in range(_PARTITIONS):
+        op.execute(
+            f"CREATE TABLE document_chunks_p{remainder} PARTITION OF document_chunks "
+            f"FOR VALUES WITH (MODULUS {_PARTITIONS}, REMAINDER {remainder})"
+        )
+    op.execute(
+        f"INSERT INTO document_chunks ({_COPY_COLUMNS}) "
+        f"SELECT {_COPY_COLUMNS} FROM document_chunks_unpartitioned"
+    )
+    op.drop_table('document_chunks_unpartitioned')
+
+    op.create_primary_key('document_chunks_pkey', 'document_chunks', ['id', 'kb_id'])
+    _create_constraints_and_indexes(['document_id', 'chunk_index', 'kb_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('ALTER TABLE document_chunks RENAME TO document_chunks_partitioned')
+
+    _create_table()
+    op.execute(
+        f"INSERT INTO document_chunks ({_COPY_COLUMNS}) "
+        f"SELECT {_COPY_COLUMNS} FROM document_chunks_partitioned"
+    )
+    op.drop_table('document_chunks_partitioned')
+
+    op.create_primary_key('document_chunks_pkey', 'document_chunks', ['id'])
+    _create_constraints_and_indexes(['document_id', 'chunk_index'])
+    op.execute("""
+        CREATE OR REPLACE FUNCTION document_chunks_set_kb_id() RETURNS trigger AS $$
+        BEGIN
+            SELECT kb_id INTO NEW.kb_id FROM documents WHERE id = NEW.document_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER document_chunks_set_kb_id
+        BEFORE INSERT OR UPDATE OF document_id ON document_chunks
+        FOR EACH ROW EXECUTE FUNCTION document_chunks_set_kb_id()
+    """)
@@ -0,0 +1,56 @@
+"""check constraints for string enum columns
+
+Revision ID: 6f5736468bf2
+Revises: 95f6e899eab9
+Create Date: 2026-10-17 02:03:47.164303
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '6f5736468bf2'
+down_revision: Union[str, Sequence[str], None] = '95f6e899eab9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (таблица, колонка, допустимые значения)
+_CHECKS = (
+    ('knowledge_bases', 'kb_type', ('rag', 'kag')),
+    ('documents', 'status', ('uploaded', 'indexing', 'indexed', 'failed')),
+    (
+        'n8n_workflows',
+        'workflow_type',
+        ('auto_categorize', 'kb_indexing', 'smart_search', 'weekly_digest'),
+    ),
+    ('templates', 'visibility', ('public', 'private', 'team')),
+)
+
+
+def upgrade() -> None:
+    """
+    Добавляет CHECK ограничения на строковые enum-колонки.
+
+    knowledge_bases.kb_type, documents.status, n8n_workflows.workflow_type и
+    templates.visibility хранятся как VARCHAR со значениями Python enum.
+    Перед добавлением ограничений значения приводятся к нижнему регистру
+    (как в миграции issues.status).
+    """
+    for table, column, values in _CHECKS:
+        op.execute(
+            f"UPDATE {table} SET {column} = lower({column}) "
+            f"WHERE {column} <> lower({column})"
+        )
+        op.create_check_constraint(
+            f'check_{table}_{column}_valid',
+            table,
+            f"{column} IN ({', '.join(repr(v) for v in values)})",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, _ in reversed(_CHECKS):
+        op.drop_constraint(f'check_{table}_{column}_valid', table, type_='check')
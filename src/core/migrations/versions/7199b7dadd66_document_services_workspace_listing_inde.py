@@ -0,0 +1,42 @@
+"""document_services workspace listing index
+
+Revision ID: 7199b7dadd66
+Revises: 50c1097a0431
+Create Date: 2026-10-17 01:54:53.079387
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7199b7dadd66'
+down_revision: Union[str, Sequence[str], None] = '50c1097a0431'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Заменяет одиночные индексы document_services на составной для листинга workspace.
+
+    - ix_document_services_workspace_listing (workspace_id, created_at DESC) покрывает
+      фильтр и сортировку get_by_workspace; ix_document_services_workspace_id становится лишним.
+    - ix_document_services_title удаляется: поиск по title идёт через ILIKE '%...%'.
+    """
+    op.create_index(
+        'ix_document_services_workspace_listing',
+        'document_services',
+        ['workspace_id', sa.text('created_at DESC')],
+        unique=False,
+    )
+    op.drop_index('ix_document_services_workspace_id', table_name='document_services')
+    op.drop_index('ix_document_services_title', table_name='document_services')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_document_services_title', 'document_services', ['title'], unique=False)
+    op.create_index('ix_document_services_workspace_id', 'document_services', ['workspace_id'], unique=False)
+    op.drop_index('ix_document_services_workspace_listing', table_name='document_services')
@@ -0,0 +1,67 @@
+"""users primary_role
+
+Revision ID: 7de67aec5d3b
+Revises: c196f134fe93
+Create Date: 2026-10-17 02:21:59.165514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7de67aec5d3b'
+down_revision: Union[str, Sequence[str], None] = 'c196f134fe93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Добавляет users.primary_role — денормализованную основную роль пользователя.
+
+    Заполняется из user_role_assignments (rolecode хранит имена ADMIN/USER,
+    поэтому lower()); приоритет у admin. CHECK ограничивает значения,
+    частичный индекс ix_users_primary_role_admin — поиск администраторов.
+    """
+    op.add_column(
+        'users',
+        sa.Column(
+            'primary_role',
+            sa.String(length=16),
+            server_default='user',
+            nullable=False,
+            comment='Основная роль пользователя (admin/user)',
+        ),
+    )
+    op.execute("""
+        UPDATE users u SET primary_role = r.role
+        FROM (
+            SELECT user_id, min(lower(role_code::text)) AS role
+            FROM user_role_assignments
+            GROUP BY user_id
+        ) r
+        WHERE r.user_id = u.id
+    """)
+    op.create_check_constraint(
+        'check_users_primary_role_valid', 'users', "primary_role IN ('admin', 'user')"
+    )
+    op.create_index(
+        'ix_users_primary_role_admin',
+        'users',
+        ['primary_role'],
+        unique=False,
+        postgresql_where=sa.text("primary_role = 'admin'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_users_primary_role_admin',
+        table_name='users',
+        postgresql_where=sa.text("primary_role = 'admin'"),
+    )
+    op.drop_constraint('check_users_primary_role_valid', 'users', type_='check')
+    op.drop_column('users', 'primary_role')
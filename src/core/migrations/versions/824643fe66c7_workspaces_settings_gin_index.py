@@ -0,0 +1,44 @@
+"""workspaces settings gin index
+
+Revision ID: 824643fe66c7
+Revises: a67dc9a18c11
+Create Date: 2026-10-17 02:27:57.091684
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '824643fe66c7'
+down_revision: Union[str, Sequence[str], None] = 'a67dc9a18c11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Добавляет GIN индекс (jsonb_path_ops) на workspaces.settings.
+
+    Для containment-фильтров `settings @> :settings`
+    (WorkspaceModel.settings_contains).
+    """
+    op.create_index(
+        'ix_workspaces_settings_gin',
+        'workspaces',
+        ['settings'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'settings': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_workspaces_settings_gin',
+        table_name='workspaces',
+        postgresql_using='gin',
+        postgresql_ops={'settings': 'jsonb_path_ops'},
+    )
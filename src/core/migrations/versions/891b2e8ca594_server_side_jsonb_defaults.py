@@ -0,0 +1,51 @@
+"""server side jsonb defaults
+
+Revision ID: 891b2e8ca594
+Revises: 13cdec9c7175
+Create Date: 2026-10-17 02:09:36.045945
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '891b2e8ca594'
+down_revision: Union[str, Sequence[str], None] = '13cdec9c7175'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# JSONB колонки с пустым объектом по умолчанию
+_EMPTY_OBJECT_DEFAULTS = (
+    ('documents', 'doc_metadata'),
+    ('document_chunks', 'chunk_metadata'),
+    ('n8n_workflows', 'trigger_config'),
+)
+
+
+def upgrade() -> None:
+    """
+    Переносит значения по умолчанию JSONB колонок на сторону БД.
+
+    vector_store_config получает конфигурацию первого уровня HNSW,
+    doc_metadata / chunk_metadata / trigger_config — пустой объект.
+    INSERT без этих колонок больше не сериализует JSON в Python.
+    """
+    op.alter_column(
+        'knowledge_bases',
+        'vector_store_config',
+        server_default=sa.text(
+            "'{\"dimension\": 1536, \"metric\": \"cosine\", \"index_type\": \"hnsw\", "
+            "\"m\": 16, \"ef_construction\": 64, \"ef_search\": 40}'::jsonb"
+        ),
+    )
+    for table, column in _EMPTY_OBJECT_DEFAULTS:
+        op.alter_column(table, column, server_default=sa.text("'{}'::jsonb"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in _EMPTY_OBJECT_DEFAULTS:
+        op.alter_column(table, column, server_default=None)
+    op.alter_column('knowledge_bases', 'vector_store_config', server_default=None)
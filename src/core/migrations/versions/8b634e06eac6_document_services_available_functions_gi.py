@@ -0,0 +1,34 @@
+"""document_services available_functions gin index
+
+Revision ID: 8b634e06eac6
+Revises: c827759c3562
+Create Date: 2026-10-17 01:48:10.729154
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8b634e06eac6'
+down_revision: Union[str, Sequence[str], None] = 'c827759c3562'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Добавляет GIN индекс (jsonb_path_ops) на document_services.available_functions."""
+    op.create_index(
+        'ix_document_services_available_functions_gin',
+        'document_services',
+        ['available_functions'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'available_functions': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_document_services_available_functions_gin', table_name='document_services')
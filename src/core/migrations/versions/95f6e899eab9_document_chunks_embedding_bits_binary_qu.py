@@ -0,0 +1,60 @@
+"""document_chunks embedding_bits binary quantized
+
+Revision ID: 95f6e899eab9
+Revises: 28037a0a44fc
+Create Date: 2026-10-17 02:01:47.995593
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import BIT
+
+# revision identifiers, used by Alembic.
+revision: str = '95f6e899eab9'
+down_revision: Union[str, Sequence[str], None] = '28037a0a44fc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Добавляет document_chunks.embedding_bits — бинарно квантованную копию embedding.
+
+    Колонка генерируемая (STORED): binary_quantize(embedding)::bit(1536), поэтому
+    заполняется для существующих строк и не требует изменений на стороне вставки.
+    HNSW индекс с bit_hamming_ops используется первым этапом двухэтапного поиска.
+    """
+    op.add_column(
+        'document_chunks',
+        sa.Column(
+            'embedding_bits',
+            BIT(1536),
+            sa.Computed('binary_quantize(embedding)::bit(1536)', persisted=True),
+            nullable=False,
+            comment='binary_quantize(embedding) для двухэтапного ANN поиска',
+        ),
+    )
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute('SET LOCAL max_parallel_maintenance_workers = 7')
+    op.create_index(
+        'ix_document_chunks_embedding_bits',
+        'document_chunks',
+        ['embedding_bits'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding_bits': 'bit_hamming_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_document_chunks_embedding_bits',
+        table_name='document_chunks',
+        postgresql_using='hnsw',
+        postgresql_ops={'embedding_bits': 'bit_hamming_ops'},
+    )
+    op.drop_column('document_chunks', 'embedding_bits')
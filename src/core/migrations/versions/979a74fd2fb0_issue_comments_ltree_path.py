@@ -0,0 +1,96 @@
+"""issue_comments ltree path
+
+Revision ID: 979a74fd2fb0
+Revises: 7199b7dadd66
+Create Date: 2026-10-17 01:57:26.210220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '979a74fd2fb0'
+down_revision: Union[str, Sequence[str], None] = '7199b7dadd66'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+
+def upgrade() -> None:
+    """
+    Добавляет материализованный путь issue_comments.path (ltree).
+
+    - Включает расширение ltree.
+    - Заполняет path для существующих комментариев рекурсивным CTE.
+    - Триггер BEFORE INSERT вычисляет path из пути родителя.
+    - GiST индекс для запросов поддерева (path <@ :ancestor_path).
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS ltree')
+    op.execute('ALTER TABLE issue_comments ADD COLUMN path ltree')
+    op.execute(
+        "COMMENT ON COLUMN issue_comments.path IS 'ltree-путь от корневого комментария'"
+    )
+
+    # Метка ltree допускает только [A-Za-z0-9_], поэтому дефисы UUID убираются
+    op.execute(
+        """
+        WITH RECURSIVE tree AS (
+            SELECT id, text2ltree(replace(id::text, '-', '')) AS path
+            FROM issue_comments
+            WHERE parent_id IS NULL
+            UNION ALL
+            SELECT c.id, t.path || text2ltree(replace(c.id::text, '-', ''))
+            FROM issue_comments c
+            JOIN tree t ON c.parent_id = t.id
+        )
+        UPDATE issue_comments ic
+        SET path = tree.path
+        FROM tree
+        WHERE ic.id = tree.id
+        """
+    )
+    op.alter_column('issue_comments', 'path', nullable=False)
+
+    # Путь задаётся один раз при вставке: parent_id комментария не меняется
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION issue_comments_set_path() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.parent_id IS NULL THEN
+                NEW.path := text2ltree(replace(NEW.id::text, '-', ''));
+            ELSE
+                SELECT path || text2ltree(replace(NEW.id::text, '-', ''))
+                INTO NEW.path
+                FROM issue_comments
+                WHERE id = NEW.parent_id;
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER issue_comments_set_path
+        BEFORE INSERT ON issue_comments
+        FOR EACH ROW EXECUTE FUNCTION issue_comments_set_path()
+        """
+    )
+
+    op.create_index(
+        'ix_issue_comments_path_gist',
+        'issue_comments',
+        ['path'],
+        unique=False,
+        postgresql_using='gist',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issue_comments_path_gist', table_name='issue_comments')
+    op.execute('DROP TRIGGER IF EXISTS issue_comments_set_path ON issue_comments')
+    op.execute('DROP FUNCTION IF EXISTS issue_comments_set_path()')
+    op.drop_column('issue_comments', 'path')
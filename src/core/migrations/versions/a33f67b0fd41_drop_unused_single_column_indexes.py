@@ -0,0 +1,49 @@
+"""drop unused single column indexes
+
+Revision ID: a33f67b0fd41
+Revises: f84576d6d3d3
+Create Date: 2026-10-17 02:18:49.983734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a33f67b0fd41'
+down_revision: Union[str, Sequence[str], None] = 'f84576d6d3d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (индекс, таблица, колонка)
+_DROPPED_INDEXES = (
+    ('ix_issues_title', 'issues', 'title'),
+    ('ix_issues_category', 'issues', 'category'),
+    ('ix_templates_title', 'templates', 'title'),
+    ('ix_documents_status', 'documents', 'status'),
+    ('ix_n8n_workflows_workflow_type', 'n8n_workflows', 'workflow_type'),
+    ('ix_n8n_workflows_is_active', 'n8n_workflows', 'is_active'),
+)
+
+
+def upgrade() -> None:
+    """
+    Удаляет одноколоночные индексы, не используемые как селективный фильтр.
+
+    - issues.title, templates.title: поиск идёт по ILIKE '%...%' (вместе с
+      description), b-tree его не обслуживает;
+    - issues.category, documents.status: низкая кардинальность; documents.status
+      покрыт ix_documents_kb_status;
+    - n8n_workflows.workflow_type, n8n_workflows.is_active: выборки всегда идут
+      по workspace_id (ix_n8n_workflows_workspace_id), активные — по
+      ix_n8n_workflows_active_triggered.
+    """
+    for name, table_name, _ in _DROPPED_INDEXES:
+        op.drop_index(op.f(name), table_name=table_name)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table_name, column_name in reversed(_DROPPED_INDEXES):
+        op.create_index(op.f(name), table_name, [column_name], unique=False)
@@ -0,0 +1,47 @@
+"""workspaces ai_modules_enabled partial index
+
+Revision ID: a67dc9a18c11
+Revises: 2a10561a7e74
+Create Date: 2026-10-17 02:27:22.038969
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a67dc9a18c11'
+down_revision: Union[str, Sequence[str], None] = '2a10561a7e74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Заменяет индекс по workspaces.ai_modules_enabled частичным индексом по включённым строкам.
+
+    Индекс строится CONCURRENTLY вне транзакции, чтобы не блокировать запись в workspaces.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_workspaces_ai_enabled_partial',
+            'workspaces',
+            ['id'],
+            unique=False,
+            postgresql_where=sa.text('ai_modules_enabled'),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_workspaces_ai_modules_enabled',
+            table_name='workspaces',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'ix_workspaces_ai_modules_enabled', 'workspaces', ['ai_modules_enabled'], unique=False
+    )
+    op.drop_index('ix_workspaces_ai_enabled_partial', table_name='workspaces')
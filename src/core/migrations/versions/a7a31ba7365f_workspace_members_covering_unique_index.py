@@ -0,0 +1,42 @@
+"""workspace_members covering unique index
+
+Revision ID: a7a31ba7365f
+Revises: 579055a4db7c
+Create Date: 2026-10-17 02:29:32.131172
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7a31ba7365f'
+down_revision: Union[str, Sequence[str], None] = '579055a4db7c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Заменяет ограничение uq_workspace_member уникальным индексом с INCLUDE (role).
+
+    Новый индекс строится CONCURRENTLY под временным именем, затем ограничение
+    (вместе со своим индексом) удаляется и новый индекс получает имя
+    uq_workspace_member. Проверка роли участника становится index-only scan.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_workspace_member_new "
+            "ON workspace_members (workspace_id, user_id) INCLUDE (role)"
+        )
+    op.drop_constraint('uq_workspace_member', 'workspace_members', type_='unique')
+    op.execute("ALTER INDEX uq_workspace_member_new RENAME TO uq_workspace_member")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_workspace_member', table_name='workspace_members')
+    op.create_unique_constraint(
+        'uq_workspace_member', 'workspace_members', ['workspace_id', 'user_id']
+    )
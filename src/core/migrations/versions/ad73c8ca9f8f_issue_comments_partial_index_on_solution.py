@@ -0,0 +1,33 @@
+"""issue_comments partial index on solutions
+
+Revision ID: ad73c8ca9f8f
+Revises: 3183287245a2
+Create Date: 2026-10-17 01:49:18.168875
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'ad73c8ca9f8f'
+down_revision: Union[str, Sequence[str], None] = '3183287245a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Добавляет частичный индекс по комментариям-решениям (is_solution = true)."""
+    op.create_index(
+        'ix_issue_comments_solution',
+        'issue_comments',
+        ['issue_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_solution = true'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issue_comments_solution', table_name='issue_comments')
@@ -0,0 +1,133 @@
+"""document_chunks inner product on normalized embeddings
+
+Revision ID: c196f134fe93
+Revises: a33f67b0fd41
+Create Date: 2026-10-17 02:20:20.607231
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c196f134fe93'
+down_revision: Union[str, Sequence[str], None] = 'a33f67b0fd41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _drop_kb_vector_indexes() -> None:
+    """Удаляет частичные индексы KB, созданные KnowledgeBaseRepository.rebuild_vector_index."""
+    op.execute("""
+        DO $$
+        DECLARE
+            index_name text;
+        BEGIN
+            FOR index_name IN
+                SELECT indexname FROM pg_indexes
+                WHERE indexname ~ '^ix_document_chunks_kb_[0-9a-f]{32}(_new)?$'
+            LOOP
+                EXECUTE format('DROP INDEX IF EXISTS %I', index_name);
+            END LOOP;
+        END;
+        $$
+    """)
+
+
+def upgrade() -> None:
+    """
+    Переводит поиск по эмбеддингам на inner product по нормированным векторам.
+
+    - Существующие embedding нормируются l2_normalize() (embedding_bits
+      пересчитывается автоматически, знаки компонент не меняются).
+      HNSW индексы по embedding и embedding_bits на время UPDATE удаляются
+      и строятся заново, чтобы не обновлять графы построчно.
+    - HNSW индекс пересоздаётся с halfvec_ip_ops.
+    - Частичные индексы отдельных KB (ix_document_chunks_kb_<uuid>) построены
+      с halfvec_cosine_ops и удаляются — пересобираются rebuild_vector_index.
+    - vector_store_config.metric = "ip_normalized" для всех KB и в server_default.
+    """
+    op.drop_index(
+        'ix_document_chunks_embedding',
+        table_name='document_chunks',
+        postgresql_using='hnsw',
+        postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+    )
+    op.drop_index(
+        'ix_document_chunks_embedding_bits',
+        table_name='document_chunks',
+        postgresql_using='hnsw',
+        postgresql_ops={'embedding_bits': 'bit_hamming_ops'},
+    )
+    _drop_kb_vector_indexes()
+    # UPDATE без HNSW индексов: графы строятся один раз по уже нормированным данным
+    op.execute("UPDATE document_chunks SET embedding = l2_normalize(embedding)")
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute('SET LOCAL max_parallel_maintenance_workers = 7')
+    op.create_index(
+        'ix_document_chunks_embedding',
+        'document_chunks',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 24, 'ef_construction': 128},
+        postgresql_ops={'embedding': 'halfvec_ip_ops'},
+    )
+    op.create_index(
+        'ix_document_chunks_embedding_bits',
+        'document_chunks',
+        ['embedding_bits'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding_bits': 'bit_hamming_ops'},
+    )
+
+    op.execute(
+        "UPDATE knowledge_bases SET vector_store_config = "
+        "vector_store_config || '{\"metric\": \"ip_normalized\"}'::jsonb"
+    )
+    op.alter_column(
+        'knowledge_bases',
+        'vector_store_config',
+        server_default=sa.text(
+            "'{\"dimension\": 1536, \"metric\": \"ip_normalized\", \"index_type\": \"hnsw\", "
+            "\"m\": 16, \"ef_construction\": 64, \"ef_search\": 40}'::jsonb"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'knowledge_bases',
+        'vector_store_config',
+        server_default=sa.text(
+            "'{\"dimension\": 1536, \"metric\": \"cosine\", \"index_type\": \"hnsw\", "
+            "\"m\": 16, \"ef_construction\": 64, \"ef_search\": 40}'::jsonb"
+        ),
+    )
+    op.execute(
+        "UPDATE knowledge_bases SET vector_store_config = "
+        "vector_store_config || '{\"metric\": \"cosine\"}'::jsonb"
+    )
+
+    op.drop_index(
+        'ix_document_chunks_embedding',
+        table_name='document_chunks',
+        postgresql_using='hnsw',
+        postgresql_ops={'embedding': 'halfvec_ip_ops'},
+    )
+    _drop_kb_vector_indexes()
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute('SET LOCAL max_parallel_maintenance_workers = 7')
+    op.create_index(
+        'ix_document_chunks_embedding',
+        'document_chunks',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 24, 'ef_construction': 128},
+        postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+    )
@@ -0,0 +1,44 @@
+"""n8n_workflows trigger_config gin index
+
+Revision ID: c4dd46f1a815
+Revises: 891b2e8ca594
+Create Date: 2026-10-17 02:10:05.967845
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4dd46f1a815'
+down_revision: Union[str, Sequence[str], None] = '891b2e8ca594'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Добавляет GIN индекс (jsonb_path_ops) на n8n_workflows.trigger_config.
+
+    Для containment-фильтров `trigger_config @> :config`
+    (N8nWorkflowModel.trigger_config_contains).
+    """
+    op.create_index(
+        'ix_n8n_workflows_trigger_config_gin',
+        'n8n_workflows',
+        ['trigger_config'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'trigger_config': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_n8n_workflows_trigger_config_gin',
+        table_name='n8n_workflows',
+        postgresql_using='gin',
+        postgresql_ops={'trigger_config': 'jsonb_path_ops'},
+    )
@@ -0,0 +1,45 @@
+"""ai_modules and workspace_modules partial indexes on active rows
+
+Revision ID: c827759c3562
+Revises: 199d8e71466b
+Create Date: 2026-10-17 01:47:07.874281
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c827759c3562'
+down_revision: Union[str, Sequence[str], None] = '199d8e71466b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Заменяет индексы по boolean-колонкам на частичные индексы по активным строкам."""
+    op.drop_index('ix_ai_modules_is_active', table_name='ai_modules')
+    op.create_index(
+        'ix_ai_modules_active_partial',
+        'ai_modules',
+        ['module_type'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+    op.drop_index('ix_workspace_modules_is_enabled', table_name='workspace_modules')
+    op.create_index(
+        'ix_workspace_modules_enabled_partial',
+        'workspace_modules',
+        ['workspace_id', sa.text('priority DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_enabled'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_workspace_modules_enabled_partial', table_name='workspace_modules')
+    op.create_index('ix_workspace_modules_is_enabled', 'workspace_modules', ['is_enabled'], unique=False)
+    op.drop_index('ix_ai_modules_active_partial', table_name='ai_modules')
+    op.create_index('ix_ai_modules_is_active', 'ai_modules', ['is_active'], unique=False)
@@ -0,0 +1,63 @@
+"""document_chunks embedding hnsw index
+
+Revision ID: da16401a4ee1
+Revises: 979a74fd2fb0
+Create Date: 2026-10-17 01:59:45.474290
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'da16401a4ee1'
+down_revision: Union[str, Sequence[str], None] = '979a74fd2fb0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Заменяет ivfflat индекс document_chunks.embedding на HNSW (vector_cosine_ops).
+
+    ivfflat без параметра lists требует обучения на существующих данных и
+    деградирует при инкрементальных вставках; HNSW (m=24, ef_construction=128)
+    обучения не требует. Параметры сборки выставляются через SET LOCAL —
+    только на время транзакции миграции.
+    """
+    op.drop_index(
+        'ix_document_chunks_embedding',
+        table_name='document_chunks',
+        postgresql_using='ivfflat',
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
+    op.execute("SET LOCAL maintenance_work_mem = '2GB'")
+    op.execute('SET LOCAL max_parallel_maintenance_workers = 7')
+    op.create_index(
+        'ix_document_chunks_embedding',
+        'document_chunks',
+        ['embedding'],
+        unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 24, 'ef_construction': 128},
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_document_chunks_embedding',
+        table_name='document_chunks',
+        postgresql_using='hnsw',
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
+    op.create_index(
+        'ix_document_chunks_embedding',
+        'document_chunks',
+        ['embedding'],
+        unique=False,
+        postgresql_using='ivfflat',
+        postgresql_ops={'embedding': 'vector_cosine_ops'},
+    )
@@ -0,0 +1,33 @@
+"""issues partial index on open issues
+
+Revision ID: dea5bf0a3a31
+Revises: 169008d23ae6
+Create Date: 2026-10-17 01:51:40.319891
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'dea5bf0a3a31'
+down_revision: Union[str, Sequence[str], None] = '169008d23ae6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Добавляет частичный индекс (workspace_id, visibility, category) по открытым проблемам."""
+    op.create_index(
+        'ix_issues_open_triage',
+        'issues',
+        ['workspace_id', 'visibility', 'category'],
+        unique=False,
+        postgresql_where=sa.text("status = 'red'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_issues_open_triage', table_name='issues')
@@ -0,0 +1,60 @@
+"""workspace_members unique workspace_id user_id
+
+Revision ID: e1fb3c9814c3
+Revises: 3b53d3b19253
+Create Date: 2026-10-17 02:24:48.065534
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1fb3c9814c3'
+down_revision: Union[str, Sequence[str], None] = '3b53d3b19253'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Добавляет UNIQUE (workspace_id, user_id) на workspace_members.
+
+    Перед созданием ограничения удаляет дубликаты пар, оставляя запись OWNER,
+    а среди остальных — самую свежую. Уникальный индекс строится
+    CREATE UNIQUE INDEX CONCURRENTLY (вне транзакции, без блокировки записи)
+    и затем привязывается к ограничению через ADD CONSTRAINT ... USING INDEX.
+    Индекс ix_workspace_members_workspace_id удаляется: его покрывает
+    уникальный индекс, где workspace_id — ведущая колонка.
+    """
+    op.execute(
+        """
+        DELETE FROM workspace_members a
+        USING workspace_members b
+        WHERE a.workspace_id = b.workspace_id
+          AND a.user_id = b.user_id
+          AND (a.role = 'owner', a.updated_at, a.id) < (b.role = 'owner', b.updated_at, b.id)
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_workspace_member "
+            "ON workspace_members (workspace_id, user_id)"
+        )
+    op.execute(
+        "ALTER TABLE workspace_members "
+        "ADD CONSTRAINT uq_workspace_member UNIQUE USING INDEX uq_workspace_member"
+    )
+    op.drop_index(op.f('ix_workspace_members_workspace_id'), table_name='workspace_members')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f('ix_workspace_members_workspace_id'),
+        'workspace_members',
+        ['workspace_id'],
+        unique=False,
+    )
+    op.drop_constraint('uq_workspace_member', 'workspace_members', type_='unique')
@@ -0,0 +1,100 @@
+"""knowledge base stats materialized view
+
+Revision ID: f84576d6d3d3
+Revises: 5cc3ab3b3f95
+Create Date: 2026-10-17 02:16:43.504088
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f84576d6d3d3'
+down_revision: Union[str, Sequence[str], None] = '5cc3ab3b3f95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Переносит количество документов KB из счётчика в materialized view.
+
+    - Удаляются триггер knowledge_bases_documents_count и колонка
+      knowledge_bases.documents_count: загрузка документов в одну KB больше
+      не обновляет её строку и не сериализуется на блокировке.
+    - mv_kb_stats (kb_id, indexed_docs, total_docs) с уникальным индексом по kb_id
+      для REFRESH MATERIALIZED VIEW CONCURRENTLY.
+    """
+    for event in ('insert', 'delete'):
+        op.execute(f"DROP TRIGGER IF EXISTS knowledge_bases_documents_count_{event} ON documents")
+    op.execute('DROP FUNCTION IF EXISTS knowledge_bases_documents_count_trg()')
+    op.drop_constraint('check_documents_count_positive', 'knowledge_bases', type_='check')
+    op.drop_column('knowledge_bases', 'documents_count')
+
+    op.execute("""
+        CREATE MATERIALIZED VIEW mv_kb_stats AS
+        SELECT kb_id,
+               count(*) FILTER (WHERE status = 'indexed') AS indexed_docs,
+               count(*) AS total_docs
+        FROM documents
+        GROUP BY kb_id
+    """)
+    op.create_index('ix_mv_kb_stats_kb_id', 'mv_kb_stats', ['kb_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_mv_kb_stats_kb_id', table_name='mv_kb_stats')
+    op.execute('DROP MATERIALIZED VIEW IF EXISTS mv_kb_stats')
+
+    op.add_column(
+        'knowledge_bases',
+        sa.Column(
+            'documents_count',
+            sa.Integer(),
+            server_default='0',
+            nullable=False,
+            comment='Количество документов в KB',
+        ),
+    )
+    op.create_check_constraint(
+        'check_documents_count_positive', 'knowledge_bases', 'documents_count >= 0'
+    )
+    op.execute(
+        "UPDATE knowledge_bases kb SET documents_count = "
+        "(SELECT count(*) FROM documents d WHERE d.kb_id = kb.id)"
+    )
+    op.execute("""
+        CREATE OR REPLACE FUNCTION knowledge_bases_documents_count_trg() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE knowledge_bases p SET documents_count = p.documents_count + c.n
+                FROM (
+                    SELECT kb_id, count(*) AS n FROM new_rows
+                    WHERE kb_id IS NOT NULL GROUP BY kb_id
+                ) c
+                WHERE p.id = c.kb_id;
+            ELSE
+                UPDATE knowledge_bases p SET documents_count = greatest(p.documents_count - c.n, 0)
+                FROM (
+                    SELECT kb_id, count(*) AS n FROM old_rows
+                    WHERE kb_id IS NOT NULL GROUP BY kb_id
+                ) c
+                WHERE p.id = c.kb_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(
+        "CREATE TRIGGER knowledge_bases_documents_count_insert AFTER INSERT ON documents "
+        "REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION knowledge_bases_documents_count_trg()"
+    )
+    op.execute(
+        "CREATE TRIGGER knowledge_bases_documents_count_delete AFTER DELETE ON documents "
+        "REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT EXECUTE FUNCTION knowledge_bases_documents_count_trg()"
+    )
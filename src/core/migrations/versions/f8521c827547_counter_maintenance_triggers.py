@@ -0,0 +1,104 @@
+"""counter maintenance triggers
+
+Revision ID: f8521c827547
+Revises: 03eaca2ec919
+Create Date: 2026-10-17 02:06:15.768967
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8521c827547'
+down_revision: Union[str, Sequence[str], None] = '03eaca2ec919'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (имя триггера, родительская таблица, счётчик, дочерняя таблица, FK, события)
+_COUNTERS = (
+    ('knowledge_bases_documents_count', 'knowledge_bases', 'documents_count',
+     'documents', 'kb_id', ('INSERT', 'DELETE')),
+    ('documents_chunks_count', 'documents', 'chunks_count',
+     'document_chunks', 'document_id', ('INSERT', 'DELETE')),
+    ('templates_usage_count', 'templates', 'usage_count',
+     'issues', 'template_id', ('INSERT',)),
+)
+
+
+def _trigger_function_sql(name: str, parent: str, counter: str, fk: str) -> str:
+    """Функция триггера: +count(new_rows) на INSERT, -count(old_rows) на DELETE."""
+    return f"""
+        CREATE OR REPLACE FUNCTION {name}_trg() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE {parent} p SET {counter} = p.{counter} + c.n
+                FROM (
+                    SELECT {fk}, count(*) AS n FROM new_rows
+                    WHERE {fk} IS NOT NULL GROUP BY {fk}
+                ) c
+                WHERE p.id = c.{fk};
+            ELSE
+                UPDATE {parent} p SET {counter} = greatest(p.{counter} - c.n, 0)
+                FROM (
+                    SELECT {fk}, count(*) AS n FROM old_rows
+                    WHERE {fk} IS NOT NULL GROUP BY {fk}
+                ) c
+                WHERE p.id = c.{fk};
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """
+
+
+def upgrade() -> None:
+    """
+    Переносит обслуживание денормализованных счётчиков в триггеры БД.
+
+    - knowledge_bases.documents_count — INSERT/DELETE documents;
+    - documents.chunks_count — INSERT/DELETE document_chunks;
+    - templates.usage_count — INSERT issues с template_id.
+
+    Триггеры уровня STATEMENT с transition tables: пакетная вставка N строк
+    даёт один UPDATE на родителя, а не N. Счётчики документов и чанков
+    пересчитываются по фактическим данным; usage_count хранит историю
+    использований и не пересчитывается.
+    """
+    for name, parent, counter, child, fk, events in _COUNTERS:
+        op.execute(_trigger_function_sql(name, parent, counter, fk))
+        for event in events:
+            transition = (
+                'NEW TABLE AS new_rows' if event == 'INSERT' else 'OLD TABLE AS old_rows'
+            )
+            op.execute(
+                f"CREATE TRIGGER {name}_{event.lower()} AFTER {event} ON {child} "
+                f"REFERENCING {transition} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION {name}_trg()"
+            )
+
+    op.alter_column('knowledge_bases', 'documents_count', server_default='0')
+    op.alter_column('documents', 'chunks_count', server_default='0')
+    op.alter_column('templates', 'usage_count', server_default='0')
+
+    op.execute(
+        "UPDATE knowledge_bases kb SET documents_count = "
+        "(SELECT count(*) FROM documents d WHERE d.kb_id = kb.id)"
+    )
+    op.execute(
+        "UPDATE documents d SET chunks_count = "
+        "(SELECT count(*) FROM document_chunks c WHERE c.document_id = d.id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('templates', 'usage_count', server_default=None)
+    op.alter_column('documents', 'chunks_count', server_default=None)
+    op.alter_column('knowledge_bases', 'documents_count', server_default=None)
+
+    for name, _, _, child, _, events in reversed(_COUNTERS):
+        for event in events:
+            op.execute(f"DROP TRIGGER IF EXISTS {name}_{event.lower()} ON {child}")
+        op.execute(f"DROP FUNCTION IF EXISTS {name}_trg()")
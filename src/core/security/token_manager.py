@@ -110,8 +110,8 @@ class TokenManager:
 
         return jwt.encode(
             payload,
-            key=settings.TOKEN_SECRET_KEY.get_secret_value(),
-            algorithm=settings.TOKEN_ALGORITHM,
+            key=settings.snapshot["TOKEN_SECRET_KEY"].get_secret_value(),
+            algorithm=settings.snapshot["TOKEN_ALGORITHM"],
         )
 
     @staticmethod
@@ -136,8 +136,8 @@ class TokenManager:
         try:
             payload = jwt.decode(
                 token,
-                key=settings.TOKEN_SECRET_KEY.get_secret_value(),
-                algorithms=[settings.TOKEN_ALGORITHM],
+                key=settings.snapshot["TOKEN_SECRET_KEY"].get_secret_value(),
+                algorithms=[settings.snapshot["TOKEN_ALGORITHM"]],
             )
         except ExpiredSignatureError as exc:
             raise TokenExpiredError(detail="Токен просрочен") from exc
@@ -15,10 +15,12 @@
 
 import logging
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, ClassVar, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, ClassVar, Mapping, Optional
 
-from pydantic import PostgresDsn, RedisDsn, AmqpDsn, SecretStr, EmailStr, field_validator
+from pydantic import PostgresDsn, RedisDsn, AmqpDsn, SecretStr, EmailStr, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -26,6 +28,9 @@ from src.core.lifespan import lifespan
 
 logger = logging.getLogger(__name__)
 
+# Одна запись ADMINS: "username:email:password" (разделитель записей — запятая)
+_ADMIN_RE = re.compile(r"\s*([^:,]+?)\s*:\s*([^:,]+?)\s*:\s*([^,]+?)\s*(?:,|$)")
+
 
 class PathSettings(BaseSettings):
     """
@@ -128,6 +133,7 @@ class LoggingSettings(BaseSettings):
         ENCODING (str): Кодировка файла логов.
         FILE_MODE (str): Режим открытия файла логов.
         CONSOLE_ENABLED (bool): Включено ли логирование в консоль.
+        FORMAT_STYLE (str): Стиль шаблонов форматирования ("{" — str.format).
         FILE_FORMAT (str): Формат для файлового логирования.
         PRETTY_FORMAT (str): Цветной формат для консоли.
         SIMPLE_FORMAT (str): Краткий формат для консоли.
@@ -153,22 +159,25 @@ class LoggingSettings(BaseSettings):
 
     CONSOLE_ENABLED: bool = True
 
-    FILE_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    # Все шаблоны в {}-стиле (str.format), см. FORMAT_STYLE
+    FORMAT_STYLE: str = "{"
+
+    FILE_FORMAT: str = "{asctime} - {name} - {levelname} - {message}"
 
     PRETTY_FORMAT: str = (
-        "\033[1;36m%(asctime)s\033[0m - \033[1;32m%(name)s\033[0m - "
-        "\033[1;33m%(levelname)s\033[0m - %(message)s"
+        "\033[1;36m{asctime}\033[0m - \033[1;32m{name}\033[0m - "
+        "\033[1;33m{levelname}\033[0m - {message}"
     )
 
     JSON_FORMAT: dict = {
-        "timestamp": "%(asctime)s",
-        "level": "%(levelname)s",
-        "module": "%(module)s",
-        "func": "%(funcName)s",
-        "message": "%(message)s",
+        "timestamp": "{asctime}",
+        "level": "{levelname}",
+        "module": "{module}",
+        "func": "{funcName}",
+        "message": "{message}",
     }
 
-    SIMPLE_FORMAT: str = "%(levelname)s - %(name)s - %(message)s"
+    SIMPLE_FORMAT: str = "{levelname} - {name} - {message}"
 
     @property
     def current_format(self) -> str:
@@ -238,6 +247,7 @@ class LoggingSettings(BaseSettings):
             "formatters": {
                 "default": {
                     "format": self.current_format,
+                    "style": self.FORMAT_STYLE,
                 },
             },
             "handlers": {},
@@ -300,10 +310,33 @@ class Settings(BaseSettings):
         PORT (int): Порт для запуска (обычно 8000).
 
     Свойства:
+        snapshot (Mapping): Read-only снимок полей настроек для горячих путей.
         app_params (dict): Параметры для FastAPI.
         uvicorn_params (dict): Параметры для запуска uvicorn (только для разработки).
     """
 
+    # Read-only снимок значений полей, собирается один раз в model_post_init
+    _snapshot: Mapping[str, Any] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Собирает read-only снимок настроек после валидации."""
+        self._snapshot = MappingProxyType(
+            self.model_dump(exclude={"logging", "paths"})
+        )
+
+    @property
+    def snapshot(self) -> Mapping[str, Any]:
+        """
+        Read-only снимок полей настроек.
+
+        Для кода на пути запроса (куки, токены, CORS): чтение из снимка —
+        обычный поиск в словаре, без обращения к полям pydantic-модели.
+
+        Returns:
+            Mapping[str, Any]: Значения полей (без logging и paths).
+        """
+        return self._snapshot
+
     # Виртуальное окружение приложения
     app_env: str = app_env
 
@@ -355,6 +388,10 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: int = 5432
     POSTGRES_DATABASE: str
+    # Dev/CI: ленивая загрузка relationship (N+1) поднимает исключение
+    DB_RAISE_ON_LAZY_LOAD: bool = False
+    # Период REFRESH MATERIALIZED VIEW CONCURRENTLY mv_kb_stats (секунды, 0 — выключено)
+    KB_STATS_REFRESH_INTERVAL: int = 60
 
     @property
     def database_dsn(self) -> PostgresDsn:
@@ -393,6 +430,7 @@ class Settings(BaseSettings):
         """
         return {
             "echo": False,  # Логирование SQL-запросов (для отладки)
+            "insertmanyvalues_page_size": 1000,  # Строк в одном INSERT ... RETURNING при bulk_insert
         }
 
     @property
@@ -631,24 +669,26 @@ class Settings(BaseSettings):
     @property
     def access_token_cookie_params(self) -> Dict[str, Any]:
         """Параметры для access_token куки."""
+        snapshot = self.snapshot
         return {
-            "domain": self.COOKIE_DOMAIN,
-            "secure": self.COOKIE_SECURE,
-            "samesite": self.COOKIE_SAMESITE,
-            "httponly": self.COOKIE_HTTPONLY,
-            "path": self.ACCESS_TOKEN_PATH,
+            "domain": snapshot["COOKIE_DOMAIN"],
+            "secure": snapshot["COOKIE_SECURE"],
+            "samesite": snapshot["COOKIE_SAMESITE"],
+            "httponly": snapshot["COOKIE_HTTPONLY"],
+            "path": snapshot["ACCESS_TOKEN_PATH"],
             "max_age": self.ACCESS_TOKEN_MAX_AGE,
         }
 
     @property
     def refresh_token_cookie_params(self) -> Dict[str, Any]:
         """Параметры для refresh_token куки."""
+        snapshot = self.snapshot
         return {
-            "domain": self.COOKIE_DOMAIN,
-            "secure": self.COOKIE_SECURE,
-            "samesite": self.COOKIE_SAMESITE,
-            "httponly": self.COOKIE_HTTPONLY,
-            "path": self.REFRESH_TOKEN_PATH,
+            "domain": snapshot["COOKIE_DOMAIN"],
+            "secure": snapshot["COOKIE_SECURE"],
+            "samesite": snapshot["COOKIE_SAMESITE"],
+            "httponly": snapshot["COOKIE_HTTPONLY"],
+            "path": snapshot["REFRESH_TOKEN_PATH"],
             "max_age": self.REFRESH_TOKEN_MAX_AGE,
         }
 
@@ -694,20 +734,19 @@ class Settings(BaseSettings):
         if not self.ADMINS:
             return []
 
-        admins = []
-        for admin_str in self.ADMINS.split(","):
-            parts = admin_str.strip().split(":")
-            if len(parts) == 3:
-                admins.append({
-                    "username": parts[0].strip(),
-                    "email": parts[1].strip(),
-                    "password": parts[2].strip(),
-                })
-            else:
-                logger.warning(
-                    "⚠️ Неверный формат админа: '%s'. Ожидается 'username:email:password'",
-                    admin_str
-                )
+        admins = [
+            {"username": m[1], "email": m[2], "password": m[3]}
+            for m in _ADMIN_RE.finditer(self.ADMINS)
+        ]
+
+        expected = self.ADMINS.count(",") + 1
+        if len(admins) != expected:
+            logger.warning(
+                "⚠️ Неверный формат ADMINS: распознано %d из %d записей. "
+                "Ожидается 'username:email:password,...'",
+                len(admins),
+                expected,
+            )
         return admins
 
     # Настройки доступа в docs/redoc
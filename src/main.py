@@ -1,9 +1,12 @@
 """Main FastAPI application."""
 
+from types import MappingProxyType
+
 from fastapi import FastAPI
 
 
 import src.core.lifespan.admin_init_handler  # noqa: F401
+import src.core.lifespan.kb_stats  # noqa: F401  # до database: задача останавливается раньше закрытия БД
 import src.core.lifespan.database   # noqa: F401
 import src.core.lifespan.cache   # noqa: F401
 import src.core.lifespan.fixtures  # noqa: F401
@@ -15,6 +18,10 @@ from src.core.middlewares import setup_middlewares
 from src.core.settings import settings
 from src.routers import setup_routers
 
+# Параметры FastAPI собираются один раз на процесс; read-only, чтобы
+# случайная мутация падала с TypeError, а не меняла конфиг приложения
+FASTAPI_KWARGS = MappingProxyType(dict(settings.app_params))
+
 
 def create_application() -> FastAPI:
     """
@@ -26,7 +33,7 @@ def create_application() -> FastAPI:
     Returns:
         FastAPI: Настроенный экземпляр приложения FastAPI.
     """
-    app = FastAPI(**settings.app_params)
+    app = FastAPI(**FASTAPI_KWARGS)
     setup_logging()
     register_exception_handlers(app=app)
     setup_middlewares(app)
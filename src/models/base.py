@@ -7,6 +7,8 @@
 Модуль обеспечивает удобную работу с моделями данных и их преобразование в различные форматы.
 """
 
+import os
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Type, TypeVar
@@ -18,6 +20,26 @@ from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 T = TypeVar("T", bound="BaseModel")
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Генерирует UUIDv7 (RFC 9562): 48 бит Unix-времени в мс + 74 случайных бита.
+
+    Ключи растут во времени, поэтому вставки ложатся в правый край b-tree
+    первичного ключа, а не в случайные страницы, как у uuid4.
+    В stdlib uuid.uuid7 появился только в Python 3.14.
+
+    Returns:
+        uuid.UUID: UUID версии 7.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(
+        os.urandom(10), "big"
+    )
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # variant RFC 9562
+    return uuid.UUID(int=value)
+
+
 class BaseModel(DeclarativeBase):
     """
     Базовый класс, используемый для определения моделей.
@@ -39,7 +61,7 @@ class BaseModel(DeclarativeBase):
     __abstract__ = True
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False
+        UUID(as_uuid=True), primary_key=True, default=uuid7, nullable=False
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
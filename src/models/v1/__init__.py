@@ -11,78 +11,101 @@
     - KnowledgeBaseModel, DocumentModel, DocumentChunkModel, KnowledgeBaseType, DocumentStatus (KB)
     - N8nWorkflowModel, N8nWorkflowType (n8n workflows)
     - DocumentServiceModel, ServiceFunctionType, DocumentFileType, CoverType (document services)
+
+Note:
+    Подмодули импортируются лениво (PEP 562): `from src.models.v1 import IssueModel`
+    загружает только issues.py. Перед конфигурацией мапперов SQLAlchemy все
+    подмодули подгружаются через load_models(), чтобы строковые цели relationship
+    ("UserModel", "WorkspaceModel", ...) разрешались независимо от порядка импорта.
 """
 
-from .ai_modules import AIModuleModel, AIModuleType, WorkspaceModuleModel
-from .document_processing import (
-    DocumentProcessingModel,
-    ExtractionMethod,
-    ProcessingStatus,
-)
-from .document_services import (
-    CoverType,
-    DocumentFileType,
-    DocumentServiceModel,
-    ServiceFunctionType,
-)
-from .issue_comments import IssueCommentModel
-from .issues import IssueModel, IssueStatus
-from .knowledge_bases import (
-    DocumentChunkModel,
-    DocumentModel,
-    DocumentStatus,
-    KnowledgeBaseModel,
-    KnowledgeBaseType,
-)
-from .n8n_workflows import N8nWorkflowModel, N8nWorkflowType
-from .roles import RoleCode, UserRoleModel
-from .templates import TemplateModel, TemplateVisibility
-from .users import UserModel
-from .workspaces import (
-    WorkspaceMemberModel,
-    WorkspaceMemberRole,
-    WorkspaceModel,
-    WorkspaceVisibility,
-)
-
-__all__ = [
+from importlib import import_module
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+
+# Имя экспортируемого объекта -> подмодуль, в котором он определён
+_dynamic_imports: dict[str, str] = {
     # Users & Roles
-    "UserModel",
-    "UserRoleModel",
-    "RoleCode",
+    "UserModel": "users",
+    "UserRoleModel": "roles",
+    "RoleCode": "roles",
     # Issues
-    "IssueModel",
-    "IssueStatus",
+    "IssueModel": "issues",
+    "IssueStatus": "issues",
     # Issue Comments
-    "IssueCommentModel",
+    "IssueCommentModel": "issue_comments",
     # Templates
-    "TemplateModel",
-    "TemplateVisibility",
+    "TemplateModel": "templates",
+    "TemplateVisibility": "templates",
     # AI Modules
-    "AIModuleModel",
-    "WorkspaceModuleModel",
-    "AIModuleType",
+    "AIModuleModel": "ai_modules",
+    "WorkspaceModuleModel": "ai_modules",
+    "AIModuleType": "ai_modules",
     # Workspaces
-    "WorkspaceModel",
-    "WorkspaceMemberModel",
-    "WorkspaceVisibility",
-    "WorkspaceMemberRole",
+    "WorkspaceModel": "workspaces",
+    "WorkspaceMemberModel": "workspaces",
+    "WorkspaceVisibility": "workspaces",
+    "WorkspaceMemberRole": "workspaces",
     # Knowledge Base
-    "KnowledgeBaseModel",
-    "DocumentModel",
-    "DocumentChunkModel",
-    "KnowledgeBaseType",
-    "DocumentStatus",
+    "KnowledgeBaseModel": "knowledge_bases",
+    "DocumentModel": "knowledge_bases",
+    "DocumentChunkModel": "knowledge_bases",
+    "KnowledgeBaseType": "knowledge_bases",
+    "DocumentStatus": "knowledge_bases",
     # n8n Workflows
-    "N8nWorkflowModel",
-    "N8nWorkflowType",
+    "N8nWorkflowModel": "n8n_workflows",
+    "N8nWorkflowType": "n8n_workflows",
     # Document Services
-    "DocumentServiceModel",
-    "ServiceFunctionType",
-    "DocumentFileType",
-    "CoverType",
+    "DocumentServiceModel": "document_services",
+    "ServiceFunctionType": "document_services",
+    "DocumentFileType": "document_services",
+    "CoverType": "document_services",
     # Document Processing
-    "DocumentProcessingModel",
-    "ProcessingStatus",
-    "ExtractionMethod",
-]
+    "DocumentProcessingModel": "document_processing",
+    "ProcessingStatus": "document_processing",
+    "ExtractionMethod": "document_processing",
+}
+
+# Единственный источник правды — _dynamic_imports
+__all__ = tuple(_dynamic_imports)
+
+
+def __getattr__(name: str):
+    """
+    Лениво импортирует экспортируемый объект при первом обращении.
+
+    Найденное значение кэшируется в globals() модуля, поэтому повторные
+    обращения не проходят через __getattr__.
+
+    Raises:
+        AttributeError: Если имя не экспортируется пакетом.
+    """
+    module_name = _dynamic_imports.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
+
+
+def load_models() -> None:
+    """
+    Импортирует все подмодули с моделями.
+
+    Нужен там, где требуется полный набор таблиц/мапперов: конфигурация
+    мапперов SQLAlchemy и autogenerate в Alembic.
+    """
+    for module_name in set(_dynamic_imports.values()):
+        import_module(f".{module_name}", __name__)
+
+
+@event.listens_for(Mapper, "before_configured")
+def _load_models_before_configure() -> None:
+    """Подгружает все модели до разрешения строковых relationship."""
+    load_models()
@@ -15,8 +15,17 @@ import enum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import Boolean, Enum, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import (
+    Boolean,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import BaseModel
@@ -25,7 +34,8 @@ if TYPE_CHECKING:
     from src.models.v1.workspaces import WorkspaceModel
 
 
-class AIModuleType(str, enum.Enum):
+@enum.verify(enum.UNIQUE)
+class AIModuleType(enum.StrEnum):
     """
     Типы AI модулей в системе.
 
@@ -44,6 +54,10 @@ class AIModuleType(str, enum.Enum):
     SEARCH = "search"
 
 
+# Единственный экземпляр PG-типа ai_module_type (тип создан миграцией)
+AI_MODULE_TYPE_ENUM = ENUM(AIModuleType, name="ai_module_type", create_type=False)
+
+
 class AIModuleModel(BaseModel):
     """
     Модель AI модуля (глобальный реестр).
@@ -83,7 +97,7 @@ class AIModuleModel(BaseModel):
     __tablename__ = "ai_modules"
 
     module_type: Mapped[AIModuleType] = mapped_column(
-        Enum(AIModuleType, name="ai_module_type", create_type=True),
+        AI_MODULE_TYPE_ENUM,
         nullable=False,
         index=True,
         comment="Тип модуля (RAG/N8N_WORKFLOW/и т.д.)",
@@ -122,7 +136,6 @@ class AIModuleModel(BaseModel):
         nullable=False,
         default=True,
         server_default="true",
-        index=True,
         comment="Доступен ли модуль",
     )
 
@@ -135,6 +148,15 @@ class AIModuleModel(BaseModel):
         "WorkspaceModuleModel", back_populates="module", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Частичный индекс вместо b-tree по boolean: индексируются только активные модули
+        Index(
+            "ix_ai_modules_active_partial",
+            "module_type",
+            postgresql_where=text("is_active"),
+        ),
+    )
+
     def __repr__(self) -> str:
         """Строковое представление модуля."""
         return f"<AIModule({self.name}, {self.module_type}, provider={self.provider})>"
@@ -154,6 +176,11 @@ class WorkspaceModuleModel(BaseModel):
         config (dict): Конфигурация модуля (перекрывает default_config)
         priority (int): Приоритет модуля (для ранжирования результатов)
 
+    Constraints:
+        Unique constraint на (workspace_id, module_id) - модуль подключается к workspace один раз.
+        Частичный индекс (workspace_id, priority DESC) WHERE is_enabled - для выборки
+        включённых модулей; отдельного индекса по is_enabled нет.
+
     Relationships:
         workspace: Workspace к которому подключён модуль
         module: AI модуль из глобального реестра
@@ -175,10 +202,10 @@ class WorkspaceModuleModel(BaseModel):
 
     __tablename__ = "workspace_modules"
 
+    # Отдельный индекс не нужен: workspace_id — ведущая колонка uq_workspace_module
     workspace_id: Mapped[UUID] = mapped_column(
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         comment="ID workspace",
     )
 
@@ -194,7 +221,6 @@ class WorkspaceModuleModel(BaseModel):
         nullable=False,
         default=True,
         server_default="true",
-        index=True,
         comment="Включён ли модуль",
     )
 
@@ -206,19 +232,42 @@ class WorkspaceModuleModel(BaseModel):
         comment="Конфигурация модуля для workspace",
     )
 
-    priority: Mapped[int | None] = mapped_column(
-        nullable=True, default=0, comment="Приоритет для ранжирования (выше = важнее)"
+    priority: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Приоритет для ранжирования (выше = важнее)",
     )
 
     # Relationships
+    # Полное имя: цель разрешается при configure_mappers() без порядка импорта
     workspace: Mapped["WorkspaceModel"] = relationship(
-        "WorkspaceModel", back_populates="ai_modules"
+        "src.models.v1.workspaces.WorkspaceModel", back_populates="ai_modules"
     )
 
     module: Mapped["AIModuleModel"] = relationship(
         "AIModuleModel", back_populates="workspace_modules"
     )
 
+    __table_args__ = (
+        # Модуль подключается к workspace не более одного раза
+        UniqueConstraint("workspace_id", "module_id", name="uq_workspace_module"),
+        # Модули workspace по убыванию приоритета — прямой index scan без сортировки
+        Index(
+            "ix_workspace_modules_ws_prio",
+            "workspace_id",
+            text("priority DESC"),
+        ),
+        # Включённые модули workspace по приоритету; выключенные в индекс не попадают
+        Index(
+            "ix_workspace_modules_enabled_partial",
+            "workspace_id",
+            text("priority DESC"),
+            postgresql_where=text("is_enabled"),
+        ),
+    )
+
     def __repr__(self) -> str:
         """Строковое представление подключения."""
         return f"<WorkspaceModule(workspace={self.workspace_id}, module={self.module_id}, enabled={self.is_enabled})>"
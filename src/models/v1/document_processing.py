@@ -12,7 +12,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..base import BaseModel
@@ -21,7 +22,8 @@ if TYPE_CHECKING:
     from .document_services import DocumentServiceModel
 
 
-class ProcessingStatus(str, enum.Enum):
+@enum.verify(enum.UNIQUE)
+class ProcessingStatus(enum.StrEnum):
     """
     Enum для статусов обработки документов.
 
@@ -43,7 +45,8 @@ class ProcessingStatus(str, enum.Enum):
     FAILED = "failed"
 
 
-class ExtractionMethod(str, enum.Enum):
+@enum.verify(enum.UNIQUE)
+class ExtractionMethod(enum.StrEnum):
     """
     Enum для методов извлечения текста из PDF.
 
@@ -61,6 +64,11 @@ class ExtractionMethod(str, enum.Enum):
     OCR = "ocr"
 
 
+# Единственные экземпляры PG-типов (типы созданы миграцией)
+PROCESSING_STATUS_ENUM = ENUM(ProcessingStatus, name="processingstatus", create_type=False)
+EXTRACTION_METHOD_ENUM = ENUM(ExtractionMethod, name="extractionmethod", create_type=False)
+
+
 class DocumentProcessingModel(BaseModel):
     """
     Модель для хранения результатов обработки документов.
@@ -82,6 +90,12 @@ class DocumentProcessingModel(BaseModel):
 
         document_service: Relationship с DocumentServiceModel (1-to-1).
 
+    Note:
+        extracted_text и error_message отложены (deferred) и не попадают в обычный
+        SELECT; обращение без undefer() вызывает ошибку, а не скрытый запрос.
+        Нужные колонки запрашиваются явно:
+        `select(DocumentProcessingModel).options(undefer(DocumentProcessingModel.extracted_text))`.
+
     Example:
         >>> processing = DocumentProcessingModel(
         ...     document_service_id=doc_id,
@@ -106,23 +120,27 @@ class DocumentProcessingModel(BaseModel):
 
     # Processing metadata
     status: Mapped[ProcessingStatus] = mapped_column(
-        Enum(ProcessingStatus),
+        PROCESSING_STATUS_ENUM,
         nullable=False,
         default=ProcessingStatus.PENDING,
-        server_default=ProcessingStatus.PENDING.value,
+        server_default=ProcessingStatus.PENDING.name,  # в PG-типе хранятся имена членов
         doc="Статус обработки",
     )
 
     extraction_method: Mapped[Optional[ExtractionMethod]] = mapped_column(
-        Enum(ExtractionMethod),
+        EXTRACTION_METHOD_ENUM,
         nullable=True,
         doc="Метод извлечения текста",
     )
 
     # Extracted content
+    # Может занимать мегабайты — загружается только через undefer()
     extracted_text: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_group="content",
+        deferred_raiseload=True,
         doc="Полный извлечённый текст документа",
     )
 
@@ -149,6 +167,8 @@ class DocumentProcessingModel(BaseModel):
     error_message: Mapped[Optional[str]] = mapped_column(
         Text,
         nullable=True,
+        deferred=True,
+        deferred_raiseload=True,
         doc="Текст ошибки (если status=FAILED)",
     )
 
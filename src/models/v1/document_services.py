@@ -9,12 +9,26 @@
 """
 
 import enum
+from functools import cached_property
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
-from sqlalchemy import ARRAY, BigInteger, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    CheckConstraint,
+    ColumnElement,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.ext.hybrid import hybrid_method
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from ..base import BaseModel
 
@@ -113,11 +127,13 @@ class DocumentServiceModel(BaseModel):
         cover_type (CoverType): Тип обложки (GENERATED/ICON/IMAGE).
         cover_url (Optional[str]): URL обложки (для GENERATED и IMAGE).
         cover_icon (Optional[str]): Emoji или SVG иконка (для ICON).
-        available_functions (dict): JSONB с настройками доступных функций.
+        available_functions (List[dict]): JSONB-массив с настройками доступных функций.
         author_id (UUID): Foreign Key на users.id (создатель сервиса).
         workspace_id (Optional[UUID]): Foreign Key на workspaces.id (опционально).
         is_public (bool): Публичный доступ без аутентификации (default: False).
         view_count (int): Счётчик просмотров сервиса.
+        has_ai_chat (Optional[bool]): Флаг включённой функции ai_chat, вычисляемый
+            в SQL через with_expression (None, если запрос его не запрашивал).
 
         author (UserModel): Relationship к пользователю-автору.
         workspace (Optional[WorkspaceModel]): Relationship к workspace (опционально).
@@ -168,7 +184,7 @@ class DocumentServiceModel(BaseModel):
 
     # Основные поля
     title: Mapped[str] = mapped_column(
-        String(255), nullable=False, index=True, doc="Название документного сервиса"
+        String(255), nullable=False, doc="Название документного сервиса"
     )
 
     description: Mapped[Optional[str]] = mapped_column(
@@ -192,8 +208,9 @@ class DocumentServiceModel(BaseModel):
         BigInteger, nullable=False, doc="Размер файла в байтах"
     )
 
+    # VARCHAR + CHECK (check_document_services_file_type_valid) вместо PG ENUM
     file_type: Mapped[str] = mapped_column(
-        Enum("pdf", "spreadsheet", "text", "image", name="documentfiletype", create_constraint=True),
+        String(16),
         nullable=False,
         index=True,
         doc="Тип файла (PDF/SPREADSHEET/TEXT/IMAGE)",
@@ -201,7 +218,7 @@ class DocumentServiceModel(BaseModel):
 
     # Обложка
     cover_type: Mapped[str] = mapped_column(
-        Enum("generated", "icon", "image", name="covertype", create_constraint=True),
+        String(16),
         nullable=False,
         default="generated",
         server_default="generated",
@@ -217,12 +234,12 @@ class DocumentServiceModel(BaseModel):
     )
 
     # Функции сервиса
-    available_functions: Mapped[dict] = mapped_column(
+    available_functions: Mapped[List[dict]] = mapped_column(
         JSONB,
         nullable=False,
-        default=dict,
+        default=list,
         server_default="[]",
-        doc="JSONB с настройками доступных функций",
+        doc="JSONB-массив с настройками доступных функций",
     )
 
     # Связи с пользователем и workspace
@@ -233,10 +250,10 @@ class DocumentServiceModel(BaseModel):
         doc="ID автора сервиса",
     )
 
+    # Отдельный индекс не нужен: workspace_id — ведущая колонка ix_document_services_workspace_listing
     workspace_id: Mapped[Optional[UUID]] = mapped_column(
         ForeignKey("workspaces.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
         doc="ID workspace (опционально)",
     )
 
@@ -257,6 +274,10 @@ class DocumentServiceModel(BaseModel):
         doc="Счётчик просмотров",
     )
 
+    # Вычисляется в SELECT только по запросу:
+    # .options(with_expression(DocumentServiceModel.has_ai_chat, ...)), иначе None
+    has_ai_chat: Mapped[Optional[bool]] = query_expression()
+
     # Relationships
     author: Mapped["UserModel"] = relationship(
         "UserModel",
@@ -280,6 +301,30 @@ class DocumentServiceModel(BaseModel):
         doc="Метаданные обработки документа (1-to-1)",
     )
 
+    __table_args__ = (
+        CheckConstraint(
+            "file_type IN ('pdf', 'doc', 'docx', 'txt', 'md', 'spreadsheet', 'text', 'image')",
+            name="check_document_services_file_type_valid",
+        ),
+        CheckConstraint(
+            "cover_type IN ('generated', 'icon', 'image')",
+            name="check_document_services_cover_type_valid",
+        ),
+        # Листинг workspace (get_by_workspace): фильтр + ORDER BY created_at DESC по индексу
+        Index(
+            "ix_document_services_workspace_listing",
+            "workspace_id",
+            text("created_at DESC"),
+        ),
+        # GIN по available_functions для containment-запросов (@>) из has_function
+        Index(
+            "ix_document_services_available_functions_gin",
+            "available_functions",
+            postgresql_using="gin",
+            postgresql_ops={"available_functions": "jsonb_path_ops"},
+        ),
+    )
+
     @property
     def is_pdf(self) -> bool:
         """
@@ -290,10 +335,28 @@ class DocumentServiceModel(BaseModel):
         """
         return self.file_type == "pdf"
 
+    @cached_property
+    def _function_index(self) -> dict[str, dict]:
+        """
+        Индекс available_functions по имени функции.
+
+        Строится один раз на экземпляр и сбрасывается при присваивании
+        available_functions, а также при expire/refresh (см. события ниже).
+        """
+        return {
+            func["name"]: func
+            for func in self.available_functions or ()
+            if isinstance(func, dict) and "name" in func
+        }
+
+    @hybrid_method
     def has_function(self, function_name: str) -> bool:
         """
         Проверяет наличие и активность функции в available_functions.
 
+        На загруженном экземпляре проверка выполняется в Python; на уровне
+        класса возвращает SQL-выражение для where() (см. _has_function_expr).
+
         Args:
             function_name: Название функции (например: "view_pdf")
 
@@ -303,17 +366,25 @@ class DocumentServiceModel(BaseModel):
         Example:
             >>> doc.has_function("view_pdf")
             True
-            >>> doc.has_function("ai_chat")
-            False
+            >>> select(DocumentServiceModel).where(
+            ...     DocumentServiceModel.has_function("ai_chat")
+            ... )
         """
-        if not isinstance(self.available_functions, list):
-            return False
+        entry = self._function_index.get(function_name)
+        return bool(entry and entry.get("enabled"))
 
-        for func in self.available_functions:
-            if func.get("name") == function_name and func.get("enabled"):
-                return True
+    @has_function.inplace.expression
+    @classmethod
+    def _has_function_expr(cls, function_name: str) -> ColumnElement[bool]:
+        """
+        SQL-вариант has_function: `available_functions @> '[{"name": ..., "enabled": true}]'`.
 
-        return False
+        Использует GIN индекс ix_document_services_available_functions_gin,
+        значение передаётся bound-параметром.
+        """
+        return cls.available_functions.contains(
+            [{"name": function_name, "enabled": True}]
+        )
 
     def __repr__(self) -> str:
         """Строковое представление документного сервиса."""
@@ -321,8 +392,26 @@ class DocumentServiceModel(BaseModel):
             f"<DocumentServiceModel("
             f"id={self.id}, "
             f"title='{self.title}', "
-            f"file_type={self.file_type.value}, "
+            f"file_type={self.file_type}, "
             f"author_id={self.author_id}, "
             f"is_public={self.is_public}"
             f")>"
         )
+
+
+@event.listens_for(DocumentServiceModel.available_functions, "set")
+def _reset_function_index_on_set(target, value, oldvalue, initiator) -> None:
+    """Сбрасывает кэш _function_index при присваивании available_functions."""
+    target.__dict__.pop("_function_index", None)
+
+
+@event.listens_for(DocumentServiceModel, "expire")
+def _reset_function_index_on_expire(target, attrs) -> None:
+    """Сбрасывает кэш _function_index при expire экземпляра."""
+    target.__dict__.pop("_function_index", None)
+
+
+@event.listens_for(DocumentServiceModel, "refresh")
+def _reset_function_index_on_refresh(target, context, attrs) -> None:
+    """Сбрасывает кэш _function_index при refresh экземпляра."""
+    target.__dict__.pop("_function_index", None)
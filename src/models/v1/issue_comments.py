@@ -8,8 +8,9 @@
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, ForeignKey, Text
+from sqlalchemy import Boolean, FetchedValue, ForeignKey, Index, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.types import UserDefinedType
 
 from ..base import BaseModel
 
@@ -18,6 +19,15 @@ if TYPE_CHECKING:
     from .users import UserModel
 
 
+class LtreeType(UserDefinedType):
+    """Тип PostgreSQL ltree (расширение ltree) — материализованный путь в дереве."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw) -> str:
+        return "LTREE"
+
+
 class IssueCommentModel(BaseModel):
     """
     Модель комментария к проблеме с поддержкой вложенности (threaded comments).
@@ -30,6 +40,7 @@ class IssueCommentModel(BaseModel):
         author_id (UUID): ID автора комментария.
         content (str): Текстовое содержимое комментария.
         parent_id (Optional[UUID]): ID родительского комментария для вложенности.
+        path (str): ltree-путь от корня ветки (заполняется триггером БД).
         is_solution (bool): Флаг, отмечающий комментарий как решение.
         created_at (datetime): Дата и время создания.
         updated_at (datetime): Дата и время последнего обновления.
@@ -62,6 +73,8 @@ class IssueCommentModel(BaseModel):
         >>> await session.commit()
 
     Note:
+        issue и author загружаются через selectin (отдельный IN-запрос), а не JOIN:
+        ветка из N комментариев не дублирует строки issues/users N раз.
         При удалении родительского комментария все дочерние комментарии также удаляются
         (cascade="all, delete-orphan"). При создании корневого комментария parent_id = None.
     """
@@ -99,6 +112,16 @@ class IssueCommentModel(BaseModel):
         comment="ID родительского комментария для вложенности",
     )
 
+    # Материализованный путь: метки — id предков и самого комментария (без дефисов).
+    # Заполняется триггером issue_comments_set_path при INSERT; поддерево —
+    # `path <@ :ancestor_path` по GiST индексу, независимо от глубины.
+    path: Mapped[str] = mapped_column(
+        LtreeType(),
+        nullable=False,
+        server_default=FetchedValue(),
+        comment="ltree-путь от корневого комментария",
+    )
+
     # Флаг решения
     is_solution: Mapped[bool] = mapped_column(
         Boolean,
@@ -112,13 +135,13 @@ class IssueCommentModel(BaseModel):
     issue: Mapped["IssueModel"] = relationship(
         "IssueModel",
         back_populates="comments",
-        lazy="joined",
+        lazy="selectin",
     )
 
     author: Mapped["UserModel"] = relationship(
         "UserModel",
         back_populates="comments",
-        lazy="joined",
+        lazy="selectin",
     )
 
     # Self-referencing relationship для вложенности
@@ -136,6 +159,17 @@ class IssueCommentModel(BaseModel):
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        # Решения проблемы: индексируются только строки с is_solution = true
+        Index(
+            "ix_issue_comments_solution",
+            "issue_id",
+            text("created_at DESC"),
+            postgresql_where=text("is_solution = true"),
+        ),
+        Index("ix_issue_comments_path_gist", "path", postgresql_using="gist"),
+    )
+
     def __repr__(self) -> str:
         """
         Строковое представление комментария.
@@ -143,14 +177,24 @@ class IssueCommentModel(BaseModel):
         Returns:
             str: Строка с информацией о комментарии.
 
+        Note:
+            content берётся из __dict__ экземпляра: для expired/незагруженного
+            атрибута repr не инициирует загрузку (в async-сессии это была бы
+            ошибка MissingGreenlet в логах и traceback'ах).
+
         Example:
             >>> comment = IssueCommentModel(issue_id=uuid, author_id=uuid)
             >>> repr(comment)
             "IssueCommentModel(id=..., issue_id=..., parent_id=None)"
         """
-        content_preview = (
-            self.content[:50] + "..." if len(self.content) > 50 else self.content
-        )
+        # Читаем только уже загруженное значение: repr не должен вызывать запрос
+        content = self.__dict__.get("content")
+        if content is None:
+            content_preview = "<not loaded>"
+        elif len(content) > 50:
+            content_preview = content[:50] + "..."
+        else:
+            content_preview = content
         return (
             f"IssueCommentModel(id={self.id}, issue_id={self.issue_id}, "
             f"author_id={self.author_id}, parent_id={self.parent_id}, "
@@ -11,7 +11,16 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text
+from sqlalchemy import (
+    CheckConstraint,
+    ColumnElement,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -33,7 +42,7 @@ class IssueStatus(str, enum.Enum):
 
     Example:
         >>> issue = IssueModel(status=IssueStatus.RED)
-        >>> issue.status
+        >>> issue.status_enum
         <IssueStatus.RED: 'red'>
         >>> issue.status = IssueStatus.GREEN
         >>> issue.is_resolved
@@ -60,7 +69,7 @@ class IssueVisibility(str, enum.Enum):
 
     Example:
         >>> issue = IssueModel(visibility=IssueVisibility.PUBLIC)
-        >>> issue.visibility
+        >>> issue.visibility_enum
         <IssueVisibility.PUBLIC: 'public'>
         >>> issue.visibility = IssueVisibility.WORKSPACE
     """
@@ -79,8 +88,9 @@ class IssueModel(BaseModel):
         description (str): Подробное описание проблемы.
         category (str): Категория проблемы (hardware/software/process/documentation/
             safety/quality/maintenance/training/other).
-        status (IssueStatus): Текущий статус проблемы (RED/GREEN).
-        visibility (IssueVisibility): Видимость проблемы (PUBLIC/WORKSPACE/PRIVATE).
+        status (str): Текущий статус проблемы (значение IssueStatus: red/green).
+        visibility (str): Видимость проблемы (значение IssueVisibility:
+            public/workspace/private).
         solution (Optional[str]): Текст решения проблемы (заполняется при закрытии).
         author_id (UUID): Foreign Key на users.id (автор проблемы).
         workspace_id (UUID): Foreign Key на workspaces.id (рабочее пространство).
@@ -94,6 +104,8 @@ class IssueModel(BaseModel):
 
     Properties:
         is_resolved (bool): Проверяет, решена ли проблема (status == GREEN).
+        status_enum (IssueStatus): status как IssueStatus.
+        visibility_enum (IssueVisibility): visibility как IssueVisibility.
 
     Note:
         При создании проблемы статус по умолчанию RED.
@@ -105,6 +117,16 @@ class IssueModel(BaseModel):
         template_id и custom_fields опциональны - используются, если issue создана по шаблону.
         custom_fields хранит значения динамических полей (например, {"equipment_model": "CNC-1000"}).
 
+        status и visibility — обычные VARCHAR колонки: при загрузке строк
+        значение остаётся str без преобразования в Enum; сравнение с членами
+        IssueStatus/IssueVisibility работает, т.к. это str-enum.
+
+        author загружается через selectin (одним запросом на пачку проблем, без
+        LEFT JOIN users в каждом SELECT issues) — он нужен IssueResponseSchema.
+        template и comments объявлены с lazy="raise_on_sql": списки проблем их не
+        тянут, а код, которому они нужны, загружает их явно:
+        `select(IssueModel).options(selectinload(IssueModel.comments))`.
+
     Example:
         >>> # Создание новой проблемы
         >>> issue = IssueModel(
@@ -128,23 +150,20 @@ class IssueModel(BaseModel):
 
     __tablename__ = "issues"
 
-    title: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    category: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
-    status: Mapped[IssueStatus] = mapped_column(
-        Enum(IssueStatus, name="issue_status"),
+    category: Mapped[str] = mapped_column(String(50), nullable=False)
+    # VARCHAR + CHECK вместо PG ENUM: в колонке хранятся значения ('red', 'public', ...)
+    status: Mapped[str] = mapped_column(
+        String(16),
         nullable=False,
-        default=IssueStatus.RED,
+        default=IssueStatus.RED.value,
         index=True,
     )
-    visibility: Mapped[IssueVisibility] = mapped_column(
-        Enum(
-            IssueVisibility,
-            name="issue_visibility",
-            values_callable=lambda x: [e.value for e in x],
-        ),
+    visibility: Mapped[str] = mapped_column(
+        String(16),
         nullable=False,
-        default=IssueVisibility.PUBLIC,
+        default=IssueVisibility.PUBLIC.value,
         server_default="public",
         index=True,
     )
@@ -169,22 +188,69 @@ class IssueModel(BaseModel):
     author: Mapped["UserModel"] = relationship(
         "UserModel",
         back_populates="issues",
-        lazy="joined",
+        lazy="selectin",
     )
 
     template: Mapped[Optional["TemplateModel"]] = relationship(
         "TemplateModel",
         back_populates="issues",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
 
     comments: Mapped[list["IssueCommentModel"]] = relationship(
         "IssueCommentModel",
         back_populates="issue",
-        lazy="selectin",
+        lazy="raise_on_sql",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('red', 'green')",
+            name="check_issues_status_valid",
+        ),
+        CheckConstraint(
+            "visibility IN ('public', 'workspace', 'private')",
+            name="check_issues_visibility_valid",
+        ),
+        # Список открытых проблем workspace: индексируются только status = 'red'
+        Index(
+            "ix_issues_open_triage",
+            "workspace_id",
+            "visibility",
+            "category",
+            postgresql_where=text("status = 'red'"),
+        ),
+        # Containment-фильтры по custom_fields (см. custom_fields_contains)
+        Index(
+            "ix_issues_custom_fields_gin",
+            "custom_fields",
+            postgresql_using="gin",
+            postgresql_ops={"custom_fields": "jsonb_path_ops"},
+        ),
+    )
+
+    @classmethod
+    def custom_fields_contains(cls, fields: dict) -> ColumnElement[bool]:
+        """
+        SQL-условие `custom_fields @> :fields` для фильтрации по полям шаблона.
+
+        Использует GIN индекс ix_issues_custom_fields_gin (jsonb_path_ops).
+
+        Args:
+            fields: Пары ключ-значение, которые должны присутствовать в custom_fields.
+
+        Returns:
+            ColumnElement[bool]: Условие для where().
+
+        Example:
+            >>> select(IssueModel).where(
+            ...     IssueModel.custom_fields_contains({"equipment_model": "CNC-1000"})
+            ... )
+        """
+        return cls.custom_fields.contains(fields)
+
     @property
     def is_resolved(self) -> bool:
         """
@@ -201,7 +267,27 @@ class IssueModel(BaseModel):
             >>> issue.is_resolved
             True
         """
-        return self.status == IssueStatus.GREEN
+        return self.status == "green"
+
+    @property
+    def status_enum(self) -> IssueStatus:
+        """
+        Статус проблемы как IssueStatus.
+
+        Returns:
+            IssueStatus: Член enum для значения колонки status.
+        """
+        return IssueStatus(self.status)
+
+    @property
+    def visibility_enum(self) -> IssueVisibility:
+        """
+        Видимость проблемы как IssueVisibility.
+
+        Returns:
+            IssueVisibility: Член enum для значения колонки visibility.
+        """
+        return IssueVisibility(self.visibility)
 
     def __repr__(self) -> str:
         """
@@ -212,5 +298,5 @@ class IssueModel(BaseModel):
         """
         return (
             f"IssueModel(id={self.id}, title='{self.title}', "
-            f"status={self.status.value}, category='{self.category}')"
+            f"status={self.status}, category='{self.category}')"
         )
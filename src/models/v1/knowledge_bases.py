@@ -10,20 +10,30 @@
 """
 
 import enum
+import json
+import math
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from pgvector.sqlalchemy import Vector
+import numpy as np
+from pgvector import HalfVector
+from pgvector.sqlalchemy import BIT, HALFVEC
 from sqlalchemy import (
     CheckConstraint,
+    Computed,
+    DateTime,
     ForeignKey,
     Index,
+    Integer,
     String,
     Text,
+    column,
+    table,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from src.models.base import BaseModel
 
@@ -31,6 +41,60 @@ if TYPE_CHECKING:
     from src.models.v1.workspaces import WorkspaceModel
 
 
+def normalize_embedding(embedding) -> np.ndarray:
+    """L2-нормирует вектор: для единичных векторов inner product == cosine similarity."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0 or math.isclose(norm, 1.0, rel_tol=1e-6):
+        return vector
+    return vector / norm
+
+
+class BinaryHalfVec(HALFVEC):
+    """
+    HALFVEC, передающий значения через бинарный кодек asyncpg.
+
+    Стандартный HALFVEC сериализует вектор в текст '[...]' (~25KB на 1536
+    измерений) и разбирает его обратно в Python float. Этот тип отдаёт драйверу
+    HalfVector, который кодек pgvector.asyncpg.register_vector (регистрируется
+    в DatabaseClient) пишет в бинарном формате — 3KB на вектор, а из БД
+    возвращает np.ndarray float16 без разбора текста.
+
+    Записываемые векторы L2-нормируются (normalize_embedding): индекс
+    halfvec_ip_ops и метрика "ip_normalized" предполагают единичную длину,
+    поэтому нормирование выполняется на любом пути записи (create_item,
+    bulk_create, bulk_copy, upsert) и для векторов запроса.
+    """
+
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        dim = self.dim
+
+        def process(value):
+            if value is None:
+                return None
+            if isinstance(value, HalfVector):
+                value = value.to_numpy()
+            value = HalfVector(normalize_embedding(value))
+            if dim is not None and value.dimensions() != dim:
+                raise ValueError(f"expected {dim} dimensions, not {value.dimensions()}")
+            return value
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            if value is None:
+                return None
+            # Бинарный кодек asyncpg отдаёт HalfVector, текстовый протокол — '[...]'
+            if not isinstance(value, HalfVector):
+                value = HalfVector.from_text(value)
+            return value.to_numpy()
+
+        return process
+
+
 class KnowledgeBaseType(str, enum.Enum):
     """
     Типы Knowledge Base.
@@ -41,7 +105,7 @@ class KnowledgeBaseType(str, enum.Enum):
 
     Example:
         >>> kb = KnowledgeBaseModel(kb_type=KnowledgeBaseType.RAG)
-        >>> kb.kb_type.value
+        >>> kb.kb_type_enum.value
         'rag'
     """
 
@@ -63,6 +127,8 @@ class DocumentStatus(str, enum.Enum):
         >>> doc = DocumentModel(status=DocumentStatus.UPLOADED)
         >>> doc.status == DocumentStatus.UPLOADED
         True
+        >>> doc.status_enum
+        <DocumentStatus.UPLOADED: 'uploaded'>
     """
 
     UPLOADED = "uploaded"
@@ -71,6 +137,47 @@ class DocumentStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+# Уровни параметров HNSW по числу векторов: (верхняя граница, параметры).
+# m/ef_construction — параметры сборки, ef_search — глубина поиска в запросе,
+# binary_prefilter — двухэтапный поиск через embedding_bits (большие KB)
+_HNSW_TIERS: tuple[tuple[int | None, dict], ...] = (
+    (100_000, {"m": 16, "ef_construction": 64, "ef_search": 40}),
+    (1_000_000, {"m": 24, "ef_construction": 100, "ef_search": 100}),
+    (
+        None,
+        {"m": 32, "ef_construction": 128, "ef_search": 200, "binary_prefilter": True},
+    ),
+)
+
+# IVFFlat (index_type="ivfflat") — для write-heavy и очень больших KB, где сборка
+# HNSW слишком долгая: lists = max(100, sqrt(N)), probes = sqrt(lists)
+IVFFLAT_MIN_LISTS = 100
+
+# Число HASH партиций document_chunks по kb_id (партиции создаёт миграция)
+DOCUMENT_CHUNK_PARTITIONS = 16
+
+# Конфигурация новой KB (первый уровень HNSW) — server_default колонки.
+# metric "ip_normalized": эмбеддинги L2-нормированы, поиск по inner product (<#>)
+_DEFAULT_VECTOR_STORE_CONFIG = {
+    "dimension": 1536,
+    "metric": "ip_normalized",
+    "index_type": "hnsw",
+    **_HNSW_TIERS[0][1],
+}
+
+
+# Материализованное представление со статистикой документов по KB.
+# Не входит в metadata (autogenerate его не трогает), создаётся миграцией;
+# обновляется KnowledgeBaseRepository.refresh_stats() (REFRESH CONCURRENTLY)
+# фоновой задачей src.core.lifespan.kb_stats раз в KB_STATS_REFRESH_INTERVAL секунд
+KB_STATS_VIEW = table(
+    "mv_kb_stats",
+    column("kb_id"),
+    column("indexed_docs", Integer),
+    column("total_docs", Integer),
+)
+
+
 class KnowledgeBaseModel(BaseModel):
     """
     Модель Knowledge Base.
@@ -80,11 +187,15 @@ class KnowledgeBaseModel(BaseModel):
 
     Attributes:
         workspace_id: UUID workspace, которому принадлежит KB
-        kb_type: Тип KB (RAG/KAG)
+        kb_type: Тип KB (значение KnowledgeBaseType: rag/kag, str)
         name: Название knowledge base
         description: Описание KB (опционально)
         vector_store_config: Конфигурация vector store в JSONB
-        documents_count: Количество документов в KB
+            (см. default_vector_store_config)
+        documents_count: Количество документов в KB из mv_kb_stats
+            (with_expression, None если не запрошено)
+        indexed_documents_count: Количество документов в статусе indexed
+            из mv_kb_stats (with_expression, None если не запрошено)
         is_active: Активна ли KB
         workspace: Связь с WorkspaceModel (Many-to-One)
         documents: Связь с DocumentModel (One-to-Many)
@@ -94,8 +205,13 @@ class KnowledgeBaseModel(BaseModel):
         ...     workspace_id=workspace_id,
         ...     kb_type=KnowledgeBaseType.RAG,
         ...     name="Product Documentation",
-        ...     vector_store_config={"dimension": 1536, "metric": "cosine"}
+        ...     vector_store_config={"dimension": 1536, "metric": "ip_normalized"}
         ... )
+
+    Note:
+        Связи workspace/documents объявлены с lazy="raise_on_sql": загрузка KB
+        (например, в RAG поиске) не тянет документы и их чанки с embeddings.
+        Где связь нужна — загружать явно через selectinload().
     """
 
     __tablename__ = "knowledge_bases"
@@ -107,10 +223,10 @@ class KnowledgeBaseModel(BaseModel):
         comment="UUID workspace, которому принадлежит KB",
     )
 
-    kb_type: Mapped[KnowledgeBaseType] = mapped_column(
+    kb_type: Mapped[str] = mapped_column(
         String(10),
         nullable=False,
-        default=KnowledgeBaseType.RAG,
+        default=KnowledgeBaseType.RAG.value,
         comment="Тип knowledge base (rag/kag)",
     )
 
@@ -129,19 +245,15 @@ class KnowledgeBaseModel(BaseModel):
     vector_store_config: Mapped[dict] = mapped_column(
         JSONB,
         nullable=False,
-        default=lambda: {
-            "dimension": 1536,
-            "metric": "cosine",
-            "index_type": "ivfflat",
-        },
-        comment="Конфигурация vector store (dimension, metric, index_type)",
+        server_default=text(f"'{json.dumps(_DEFAULT_VECTOR_STORE_CONFIG)}'::jsonb"),
+        comment="Конфигурация vector store (dimension, metric, index_type, HNSW)",
     )
 
-    documents_count: Mapped[int] = mapped_column(
-        nullable=False,
-        default=0,
-        comment="Количество документов в KB",
-    )
+    # Счётчиков в строке KB нет: параллельная загрузка документов не конкурирует
+    # за UPDATE одной строки knowledge_bases. Значения берутся из mv_kb_stats
+    # только по запросу (KnowledgeBaseRepository.get_with_stats), иначе None
+    documents_count: Mapped[Optional[int]] = query_expression()
+    indexed_documents_count: Mapped[Optional[int]] = query_expression()
 
     is_active: Mapped[bool] = mapped_column(
         nullable=False,
@@ -153,20 +265,21 @@ class KnowledgeBaseModel(BaseModel):
     workspace: Mapped["WorkspaceModel"] = relationship(
         "WorkspaceModel",
         back_populates="knowledge_bases",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     documents: Mapped[list["DocumentModel"]] = relationship(
         "DocumentModel",
         back_populates="knowledge_base",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     __table_args__ = (
         CheckConstraint(
-            "documents_count >= 0",
-            name="check_documents_count_positive",
+            "kb_type IN ('rag', 'kag')",
+            name="check_knowledge_bases_kb_type_valid",
         ),
         Index(
             "ix_knowledge_bases_workspace_active",
@@ -175,6 +288,47 @@ class KnowledgeBaseModel(BaseModel):
         ),
     )
 
+    @classmethod
+    def default_vector_store_config(
+        cls, vector_count: int, index_type: str = "hnsw"
+    ) -> dict:
+        """
+        Подбирает конфигурацию vector store по количеству векторов.
+
+        Args:
+            vector_count: Количество векторов (чанков) в knowledge base.
+            index_type: Тип ANN индекса: "hnsw" (default) или "ivfflat".
+
+        Returns:
+            dict: dimension, metric, index_type и параметры индекса:
+                для HNSW — m, ef_construction, ef_search[, binary_prefilter]
+                соответствующего уровня; для IVFFlat — lists, probes.
+
+        Example:
+            >>> KnowledgeBaseModel.default_vector_store_config(0)["ef_search"]
+            40
+            >>> KnowledgeBaseModel.default_vector_store_config(2_000_000)["m"]
+            32
+            >>> KnowledgeBaseModel.default_vector_store_config(4_000_000, "ivfflat")
+            {'dimension': 1536, 'metric': 'ip_normalized', 'index_type': 'ivfflat', 'lists': 2000, 'probes': 44}
+        """
+        if index_type == "ivfflat":
+            lists = max(IVFFLAT_MIN_LISTS, math.isqrt(vector_count))
+            return {
+                "dimension": _DEFAULT_VECTOR_STORE_CONFIG["dimension"],
+                "metric": _DEFAULT_VECTOR_STORE_CONFIG["metric"],
+                "index_type": "ivfflat",
+                "lists": lists,
+                "probes": math.isqrt(lists),
+            }
+
+        tier = next(
+            params
+            for upper_bound, params in _HNSW_TIERS
+            if upper_bound is None or vector_count < upper_bound
+        )
+        return {**_DEFAULT_VECTOR_STORE_CONFIG, **tier}
+
     def __repr__(self) -> str:
         """
         Строковое представление KnowledgeBaseModel.
@@ -184,9 +338,19 @@ class KnowledgeBaseModel(BaseModel):
         """
         return (
             f"KnowledgeBase(id={self.id}, name='{self.name}', "
-            f"kb_type={self.kb_type.value}, documents={self.documents_count})"
+            f"kb_type={self.kb_type})"
         )
 
+    @property
+    def kb_type_enum(self) -> KnowledgeBaseType:
+        """
+        Тип KB как KnowledgeBaseType.
+
+        Returns:
+            KnowledgeBaseType: Член enum для значения колонки kb_type.
+        """
+        return KnowledgeBaseType(self.kb_type)
+
 
 class DocumentModel(BaseModel):
     """
@@ -201,7 +365,8 @@ class DocumentModel(BaseModel):
         file_path: Путь к файлу в storage (опционально)
         file_size: Размер файла в байтах
         mime_type: MIME тип файла
-        status: Статус обработки (uploaded/indexing/indexed/failed)
+        status: Статус обработки (значение DocumentStatus:
+            uploaded/indexing/indexed/failed, str)
         chunks_count: Количество чанков документа
         doc_metadata: Дополнительные метаданные документа (JSONB)
         indexed_at: Дата завершения индексации
@@ -251,28 +416,31 @@ class DocumentModel(BaseModel):
         comment="MIME тип файла",
     )
 
-    status: Mapped[DocumentStatus] = mapped_column(
+    status: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
-        default=DocumentStatus.UPLOADED,
-        index=True,
+        default=DocumentStatus.UPLOADED.value,
         comment="Статус обработки документа",
     )
 
+    # Поддерживается триггером documents_chunks_count (INSERT/DELETE document_chunks)
     chunks_count: Mapped[int] = mapped_column(
         nullable=False,
         default=0,
+        server_default="0",
+        info={"readonly": True},
         comment="Количество чанков документа",
     )
 
     doc_metadata: Mapped[dict] = mapped_column(
         JSONB,
         nullable=False,
-        default=dict,
+        server_default=text("'{}'::jsonb"),
         comment="Дополнительные метаданные документа",
     )
 
     indexed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
         nullable=True,
         comment="Дата завершения индексации",
     )
@@ -287,14 +455,15 @@ class DocumentModel(BaseModel):
     knowledge_base: Mapped["KnowledgeBaseModel"] = relationship(
         "KnowledgeBaseModel",
         back_populates="documents",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     chunks: Mapped[list["DocumentChunkModel"]] = relationship(
         "DocumentChunkModel",
         back_populates="document",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
     __table_args__ = (
@@ -306,6 +475,10 @@ class DocumentModel(BaseModel):
             "chunks_count >= 0",
             name="check_chunks_count_positive",
         ),
+        CheckConstraint(
+            "status IN ('uploaded', 'indexing', 'indexed', 'failed')",
+            name="check_documents_status_valid",
+        ),
         Index(
             "ix_documents_kb_status",
             "kb_id",
@@ -322,9 +495,19 @@ class DocumentModel(BaseModel):
         """
         return (
             f"Document(id={self.id}, filename='{self.filename}', "
-            f"status={self.status.value}, chunks={self.chunks_count})"
+            f"status={self.status}, chunks={self.chunks_count})"
         )
 
+    @property
+    def status_enum(self) -> DocumentStatus:
+        """
+        Статус документа как DocumentStatus.
+
+        Returns:
+            DocumentStatus: Член enum для значения колонки status.
+        """
+        return DocumentStatus(self.status)
+
 
 class DocumentChunkModel(BaseModel):
     """
@@ -335,9 +518,12 @@ class DocumentChunkModel(BaseModel):
 
     Attributes:
         document_id: UUID документа, которому принадлежит чанк
+        kb_id: UUID knowledge base (копия documents.kb_id, ключ партиционирования)
         chunk_index: Порядковый номер чанка в документе
         content: Текстовое содержимое чанка
-        embedding: Vector embedding (1536 dimensions для OpenAI ada-002)
+        embedding: Vector embedding halfvec (1536 dimensions для OpenAI ada-002),
+            np.ndarray float16 (бинарный кодек asyncpg), L2-нормирован при вставке
+        embedding_bits: binary_quantize(embedding), генерируется БД (STORED)
         token_count: Количество токенов в чанке
         chunk_metadata: Дополнительные метаданные чанка (JSONB)
         document: Связь с DocumentModel (Many-to-One)
@@ -345,11 +531,20 @@ class DocumentChunkModel(BaseModel):
     Example:
         >>> chunk = DocumentChunkModel(
         ...     document_id=doc_id,
+        ...     kb_id=kb_id,
         ...     chunk_index=0,
         ...     content="This is the first paragraph...",
         ...     embedding=[0.1, 0.2, ...],  # 1536 dimensions
         ...     token_count=150
         ... )
+
+    Note:
+        Таблица партиционирована HASH (kb_id) на DOCUMENT_CHUNK_PARTITIONS
+        партиций (создаются миграцией): у каждой свой HNSW граф, а запрос с
+        kb_id = :kb_id сканирует одну партицию. Поэтому первичный ключ —
+        (id, kb_id), а kb_id должен передаваться при вставке (routing
+        выполняется до BEFORE-триггеров); DocumentChunkRepository.bulk_upsert
+        и copy_chunks подставляют его из documents.
     """
 
     __tablename__ = "document_chunks"
@@ -361,6 +556,14 @@ class DocumentChunkModel(BaseModel):
         comment="UUID документа",
     )
 
+    # Денормализовано из documents.kb_id: фильтр RAG поиска по KB без JOIN
+    # documents и ключ HASH партиционирования (входит в первичный ключ)
+    kb_id: Mapped[UUID] = mapped_column(
+        ForeignKey("knowledge_bases.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="UUID knowledge base (копия documents.kb_id)",
+    )
+
     chunk_index: Mapped[int] = mapped_column(
         nullable=False,
         comment="Порядковый номер чанка в документе",
@@ -372,10 +575,20 @@ class DocumentChunkModel(BaseModel):
         comment="Текстовое содержимое чанка",
     )
 
-    embedding: Mapped[Vector] = mapped_column(
-        Vector(1536),
+    # halfvec (FP16): вдвое меньше байт на строку и в HNSW графе,
+    # потеря точности для ada-002 эмбеддингов в пределах шума recall
+    embedding: Mapped[np.ndarray] = mapped_column(
+        BinaryHalfVec(1536),
         nullable=False,
-        comment="Vector embedding для RAG поиска (1536 dimensions)",
+        comment="Vector embedding для RAG поиска (1536 dimensions, halfvec)",
+    )
+
+    # Бинарно квантованная копия embedding для первого этапа поиска (hamming)
+    embedding_bits: Mapped[str] = mapped_column(
+        BIT(1536),
+        Computed("binary_quantize(embedding)::bit(1536)", persisted=True),
+        nullable=False,
+        comment="binary_quantize(embedding) для двухэтапного ANN поиска",
     )
 
     token_count: Mapped[int] = mapped_column(
@@ -386,7 +599,7 @@ class DocumentChunkModel(BaseModel):
     chunk_metadata: Mapped[dict] = mapped_column(
         JSONB,
         nullable=False,
-        default=dict,
+        server_default=text("'{}'::jsonb"),
         comment="Дополнительные метаданные чанка",
     )
 
@@ -394,7 +607,7 @@ class DocumentChunkModel(BaseModel):
     document: Mapped["DocumentModel"] = relationship(
         "DocumentModel",
         back_populates="chunks",
-        lazy="joined",
+        lazy="raise_on_sql",
     )
 
     __table_args__ = (
@@ -410,15 +623,34 @@ class DocumentChunkModel(BaseModel):
             "ix_document_chunks_document_index",
             "document_id",
             "chunk_index",
+            "kb_id",  # уникальный индекс партиционированной таблицы включает ключ
             unique=True,
         ),
-        # Vector similarity search index
+        Index(
+            "ix_document_chunks_kb_covering",
+            "kb_id",
+            postgresql_include=["document_id"],
+        ),
+        # Vector similarity search index: HNSW не требует обучения на данных
+        # (в отличие от ivfflat) и держит recall при инкрементальных вставках.
+        # Глубина поиска задаётся GUC hnsw.ef_search в DocumentChunkRepository.
+        # Эмбеддинги L2-нормированы при вставке, поэтому inner product (<#>)
+        # равен cosine similarity без нормирования на каждое сравнение.
         Index(
             "ix_document_chunks_embedding",
             "embedding",
-            postgresql_using="ivfflat",
-            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_using="hnsw",
+            postgresql_with={"m": 24, "ef_construction": 128},
+            postgresql_ops={"embedding": "halfvec_ip_ops"},
+        ),
+        Index(
+            "ix_document_chunks_embedding_bits",
+            "embedding_bits",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding_bits": "bit_hamming_ops"},
         ),
+        {"postgresql_partition_by": "HASH (kb_id)"},
     )
 
     def __repr__(self) -> str:
@@ -12,10 +12,20 @@ n8n workflows используются для автоматизации:
 """
 
 import enum
+from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import (
+    CheckConstraint,
+    ColumnElement,
+    DateTime,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -37,7 +47,7 @@ class N8nWorkflowType(str, enum.Enum):
 
     Example:
         >>> workflow = N8nWorkflowModel(workflow_type=N8nWorkflowType.AUTO_CATEGORIZE)
-        >>> workflow.workflow_type.value
+        >>> workflow.workflow_type_enum.value
         'auto_categorize'
     """
 
@@ -120,10 +130,9 @@ class N8nWorkflowModel(BaseModel):
         comment="Название workflow",
     )
 
-    workflow_type: Mapped[N8nWorkflowType] = mapped_column(
+    workflow_type: Mapped[str] = mapped_column(
         String(50),
         nullable=False,
-        index=True,
         comment="Тип workflow (auto_categorize/kb_indexing/smart_search/weekly_digest)",
     )
 
@@ -143,18 +152,18 @@ class N8nWorkflowModel(BaseModel):
     trigger_config: Mapped[dict] = mapped_column(
         JSONB,
         nullable=False,
-        default=dict,
+        server_default=text("'{}'::jsonb"),
         comment="Конфигурация триггера workflow (JSONB)",
     )
 
     is_active: Mapped[bool] = mapped_column(
         nullable=False,
         default=True,
-        index=True,
         comment="Активен ли workflow",
     )
 
-    last_triggered_at: Mapped[str | None] = mapped_column(
+    last_triggered_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
         nullable=True,
         comment="Дата последнего запуска workflow",
     )
@@ -169,9 +178,63 @@ class N8nWorkflowModel(BaseModel):
     workspace: Mapped["WorkspaceModel"] = relationship(
         "WorkspaceModel",
         back_populates="n8n_workflows",
-        lazy="joined",
+        lazy="raise_on_sql",
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "workflow_type IN "
+            "('auto_categorize', 'kb_indexing', 'smart_search', 'weekly_digest')",
+            name="check_n8n_workflows_workflow_type_valid",
+        ),
+        # Выборка активных workflows по времени последнего запуска (планировщик)
+        Index(
+            "ix_n8n_workflows_active_triggered",
+            "is_active",
+            "last_triggered_at",
+            postgresql_where=text("is_active = true"),
+        ),
+        # Containment-фильтры по trigger_config (см. trigger_config_contains)
+        Index(
+            "ix_n8n_workflows_trigger_config_gin",
+            "trigger_config",
+            postgresql_using="gin",
+            postgresql_ops={"trigger_config": "jsonb_path_ops"},
+        ),
     )
 
+    @classmethod
+    def trigger_config_contains(cls, config: dict) -> ColumnElement[bool]:
+        """
+        SQL-условие `trigger_config @> :config` для выборки workflows по настройкам.
+
+        Использует GIN индекс ix_n8n_workflows_trigger_config_gin (jsonb_path_ops).
+
+        Args:
+            config: Фрагмент конфигурации, который должен содержаться в trigger_config.
+
+        Returns:
+            ColumnElement[bool]: Условие для where().
+
+        Example:
+            >>> select(N8nWorkflowModel).where(
+            ...     N8nWorkflowModel.trigger_config_contains(
+            ...         {"weekly_digest": {"schedule": "0 9 * * MON"}}
+            ...     )
+            ... )
+        """
+        return cls.trigger_config.contains(config)
+
+    @property
+    def workflow_type_enum(self) -> N8nWorkflowType:
+        """
+        Тип workflow как N8nWorkflowType.
+
+        Returns:
+            N8nWorkflowType: Член enum для значения колонки workflow_type.
+        """
+        return N8nWorkflowType(self.workflow_type)
+
     def __repr__(self) -> str:
         """
         Строковое представление N8nWorkflowModel.
@@ -181,5 +244,5 @@ class N8nWorkflowModel(BaseModel):
         """
         return (
             f"N8nWorkflow(id={self.id}, name='{self.workflow_name}', "
-            f"type={self.workflow_type.value}, active={self.is_active})"
+            f"type={self.workflow_type}, active={self.is_active})"
         )
@@ -31,7 +31,7 @@ import enum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import Boolean, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, CheckConstraint, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -75,7 +75,7 @@ class TemplateModel(BaseModel):
         description: Описание назначения шаблона (опционально).
         category: Категория проблем (hardware, software, process).
         fields: JSONB структура с определением полей формы.
-        visibility: Видимость шаблона (public/private/team).
+        visibility: Видимость шаблона (значение TemplateVisibility: public/private/team).
         author_id: UUID создателя шаблона (FK users.id).
         usage_count: Счётчик использований шаблона.
         is_active: Флаг активности (можно деактивировать старые шаблоны).
@@ -153,7 +153,7 @@ class TemplateModel(BaseModel):
 
     # Основная информация
     title: Mapped[str] = mapped_column(
-        String(255), nullable=False, index=True, comment="Название шаблона"
+        String(255), nullable=False, comment="Название шаблона"
     )
 
     description: Mapped[str | None] = mapped_column(
@@ -175,10 +175,10 @@ class TemplateModel(BaseModel):
     )
 
     # Видимость и владение
-    visibility: Mapped[TemplateVisibility] = mapped_column(
+    visibility: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
-        default=TemplateVisibility.PRIVATE,
+        default=TemplateVisibility.PRIVATE.value,
         index=True,
         comment="Видимость шаблона (public/private/team)",
     )
@@ -191,10 +191,13 @@ class TemplateModel(BaseModel):
     )
 
     # Метрики
+    # Поддерживается триггером templates_usage_count (INSERT issues с template_id)
     usage_count: Mapped[int] = mapped_column(
         Integer,
         nullable=False,
         default=0,
+        server_default="0",
+        info={"readonly": True},
         comment="Счётчик использований шаблона",
     )
 
@@ -221,6 +224,18 @@ class TemplateModel(BaseModel):
         cascade="save-update, merge",
     )
 
+    __table_args__ = (
+        CheckConstraint(
+            "visibility IN ('public', 'private', 'team')",
+            name="check_templates_visibility_valid",
+        ),
+    )
+
+    @property
+    def visibility_enum(self) -> TemplateVisibility:
+        """Видимость шаблона как TemplateVisibility."""
+        return TemplateVisibility(self.visibility)
+
     def __repr__(self) -> str:
         """Строковое представление шаблона."""
         return (
@@ -228,7 +243,7 @@ class TemplateModel(BaseModel):
             f"id={self.id}, "
             f"title={self.title!r}, "
             f"category={self.category!r}, "
-            f"visibility={self.visibility.value}, "
+            f"visibility={self.visibility}, "
             f"usage_count={self.usage_count}"
             f")>"
         )
@@ -1,7 +1,13 @@
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, FrozenSet, List, Optional
 
-from sqlalchemy import Boolean, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Boolean, CheckConstraint, Index, String, event, text
+from sqlalchemy.orm import (
+    Mapped,
+    WriteOnlyMapped,
+    mapped_column,
+    reconstructor,
+    relationship,
+)
 
 from ..base import BaseModel
 
@@ -23,17 +29,21 @@ class UserModel(BaseModel):
         phone (Optional[str]): Контактный телефон пользователя (заполняется в профиле).
         password_hash (Optional[str]): Bcrypt хеш пароля для аутентификации.
         is_active (bool): Флаг активности аккаунта (деактивированные не могут входить).
+        primary_role (str): Основная роль ("admin"/"user") — денормализованная
+            копия роли из user_roles для чтения без загрузки коллекции.
 
         user_roles (List[UserRoleModel]): Список ролей пользователя (admin/user).
         issues (List[IssueModel]): Список проблем, созданных пользователем.
         owned_workspaces (List[WorkspaceModel]): Список workspace, где user - владелец.
         workspace_memberships (List[WorkspaceMemberModel]): Участие в workspace.
+        member_workspaces (List[WorkspaceModel]): Workspace, где user - участник (read-only).
 
     Relationships:
         user_roles: One-to-Many связь с UserRoleModel (роли пользователя).
         issues: One-to-Many связь с IssueModel (проблемы автора).
         owned_workspaces: One-to-Many связь с WorkspaceModel (владение workspace).
         workspace_memberships: One-to-Many связь с WorkspaceMemberModel (участие).
+        member_workspaces: Many-to-Many (viewonly) с WorkspaceModel через workspace_members.
 
     Properties:
         role: Основная роль пользователя для API ("admin" или "user").
@@ -41,6 +51,10 @@ class UserModel(BaseModel):
     Note:
         При регистрации создается пользователь с минимальными данными (username, email, password).
         Поле phone заполняется позже в профиле.
+        Коллекции issues, templates, owned_workspaces, workspace_memberships,
+        comments и document_services объявлены как write_only: целиком не
+        загружаются, читать их нужно явным select() с пагинацией
+        (`await session.scalars(user.issues.select().limit(20))`).
 
     Example:
         >>> # Регистрация с минимальными данными
@@ -96,62 +110,127 @@ class UserModel(BaseModel):
         Boolean, default=True, nullable=False, comment="Активен ли пользователь"
     )
 
+    # Записывается вместе с UserRoleModel (UserRepository.create_user_with_role);
+    # user_roles остаётся источником для множественных ролей
+    primary_role: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default="user",
+        server_default="user",
+        comment="Основная роль пользователя (admin/user)",
+    )
+
+    # selectin: роли всех загруженных пользователей подтягиваются одним
+    # SELECT ... WHERE user_id IN (...) — без N+1 и MissingGreenlet на role/has_role
     user_roles: Mapped[List["UserRoleModel"]] = relationship(
         "UserRoleModel",
         foreign_keys="[UserRoleModel.user_id]",
         back_populates="user",
         passive_deletes=True,
         cascade="all, delete-orphan",
+        lazy="selectin",
     )
 
-    issues: Mapped[List["IssueModel"]] = relationship(
+    # passive_deletes="all": при удалении пользователя дочерние строки удаляет
+    # БД (ON DELETE CASCADE), SQLAlchemy их не загружает и не удаляет поштучно
+    issues: WriteOnlyMapped["IssueModel"] = relationship(
         "IssueModel",
         foreign_keys="[IssueModel.author_id]",
         back_populates="author",
-        passive_deletes=True,
-        cascade="all, delete-orphan",
+        passive_deletes="all",
+        cascade="save-update, merge",
+        lazy="write_only",
     )
 
-    templates: Mapped[List["TemplateModel"]] = relationship(
+    templates: WriteOnlyMapped["TemplateModel"] = relationship(
         "TemplateModel",
         foreign_keys="[TemplateModel.author_id]",
         back_populates="author",
-        passive_deletes=True,
-        cascade="all, delete-orphan",
+        passive_deletes="all",
+        cascade="save-update, merge",
+        lazy="write_only",
     )
 
-    owned_workspaces: Mapped[List["WorkspaceModel"]] = relationship(
+    owned_workspaces: WriteOnlyMapped["WorkspaceModel"] = relationship(
         "WorkspaceModel",
         foreign_keys="[WorkspaceModel.owner_id]",
         back_populates="owner",
-        passive_deletes=True,
-        cascade="all, delete-orphan",
+        passive_deletes="all",
+        cascade="save-update, merge",
+        lazy="write_only",
     )
 
-    workspace_memberships: Mapped[List["WorkspaceMemberModel"]] = relationship(
+    workspace_memberships: WriteOnlyMapped["WorkspaceMemberModel"] = relationship(
         "WorkspaceMemberModel",
         foreign_keys="[WorkspaceMemberModel.user_id]",
         back_populates="user",
-        passive_deletes=True,
-        cascade="all, delete-orphan",
+        passive_deletes="all",
+        cascade="save-update, merge",
+        lazy="write_only",
+    )
+
+    # Workspace пользователя одним запросом users -> workspace_members -> workspaces,
+    # без обхода membership.workspace по каждой записи. Только чтение и только явно:
+    # selectinload(UserModel.member_workspaces)
+    member_workspaces: Mapped[List["WorkspaceModel"]] = relationship(
+        "WorkspaceModel",
+        secondary="workspace_members",
+        viewonly=True,
+        lazy="raise",
     )
 
-    comments: Mapped[List["IssueCommentModel"]] = relationship(
+    comments: WriteOnlyMapped["IssueCommentModel"] = relationship(
         "IssueCommentModel",
         foreign_keys="[IssueCommentModel.author_id]",
         back_populates="author",
-        passive_deletes=True,
-        cascade="all, delete-orphan",
+        passive_deletes="all",
+        cascade="save-update, merge",
+        lazy="write_only",
     )
 
-    document_services: Mapped[List["DocumentServiceModel"]] = relationship(
+    document_services: WriteOnlyMapped["DocumentServiceModel"] = relationship(
         "DocumentServiceModel",
         foreign_keys="[DocumentServiceModel.author_id]",
         back_populates="author",
-        passive_deletes=True,
-        cascade="all, delete-orphan",
+        passive_deletes="all",
+        cascade="save-update, merge",
+        lazy="write_only",
+    )
+
+    __table_args__ = (
+        CheckConstraint(
+            "primary_role IN ('admin', 'user')",
+            name="check_users_primary_role_valid",
+        ),
+        # Поиск администраторов: индексируются только строки с primary_role = 'admin'
+        Index(
+            "ix_users_primary_role_admin",
+            "primary_role",
+            postgresql_where=text("primary_role = 'admin'"),
+        ),
     )
 
+    @reconstructor
+    def _init_role_cache(self) -> None:
+        """Сбрасывает кэш кодов ролей при загрузке экземпляра из БД."""
+        self._role_cache: Optional[FrozenSet[str]] = None
+
+    def _role_codes(self) -> FrozenSet[str]:
+        """
+        Коды ролей пользователя, собранные один раз на экземпляр.
+
+        Кэш сбрасывается при изменении коллекции user_roles (append/remove)
+        и при refresh экземпляра — см. обработчики событий ниже.
+
+        Returns:
+            FrozenSet[str]: Множество кодов ролей ("admin", "user").
+        """
+        role_cache = getattr(self, "_role_cache", None)
+        if role_cache is None:
+            role_cache = frozenset(ur.role_code.value for ur in self.user_roles)
+            self._role_cache = role_cache
+        return role_cache
+
     def has_role(self, role_code: str) -> bool:
         """
         Проверяет наличие роли у пользователя.
@@ -168,15 +247,15 @@ class UserModel(BaseModel):
             >>> user.has_role("user")
             True
         """
-        return any(ur.role_code.value == role_code for ur in self.user_roles)
+        return role_code == self.primary_role or role_code in self._role_codes()
 
     @property
     def role(self) -> str:
         """
         Возвращает основную роль пользователя для API.
 
-        Используется для сериализации в API responses. Если у пользователя
-        несколько ролей, возвращается первая из списка. По умолчанию "user".
+        Используется для сериализации в API responses (/me, выдача JWT).
+        Читает колонку primary_role, поэтому не требует загрузки user_roles.
 
         Returns:
             Код роли: "admin" или "user".
@@ -185,10 +264,29 @@ class UserModel(BaseModel):
             В текущей реализации у пользователя может быть только одна роль,
             но модель поддерживает множественные роли для будущего расширения.
         """
-        if self.user_roles:
-            return self.user_roles[0].role_code.value
-        return "user"
+        return self.primary_role
 
     def __repr__(self) -> str:
-        """Строковое представление модели для отладки."""
-        return f"<UserModel(username={self.username}, email={self.email}, role={self.role})>"
+        """
+        Строковое представление модели для отладки.
+
+        Читает только колонки (primary_role, а не role/user_roles), поэтому
+        не вызывает загрузку атрибутов и запросов к БД.
+        """
+        return (
+            f"<UserModel(username={self.username}, email={self.email}, "
+            f"role={self.primary_role})>"
+        )
+
+
+@event.listens_for(UserModel.user_roles, "append")
+@event.listens_for(UserModel.user_roles, "remove")
+def _reset_role_cache(target: UserModel, value, initiator) -> None:
+    """Инвалидирует кэш кодов ролей при изменении user_roles."""
+    target._role_cache = None
+
+
+@event.listens_for(UserModel, "refresh")
+def _reset_role_cache_on_refresh(target: UserModel, context, attrs) -> None:
+    """Инвалидирует кэш кодов ролей при перезагрузке атрибутов из БД."""
+    target._role_cache = None
@@ -2,7 +2,16 @@ from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
-from sqlalchemy import Boolean, Enum as SQLEnum, ForeignKey, String, Text
+from sqlalchemy import (
+    Boolean,
+    CheckConstraint,
+    ColumnElement,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -71,8 +80,8 @@ class WorkspaceMemberRole(str, Enum):
         ... )
         >>> member.role == WorkspaceMemberRole.ADMIN
         True
-        >>> member.role.value
-        'admin'
+        >>> member.role_enum
+        <WorkspaceMemberRole.ADMIN: 'admin'>
     """
 
     OWNER = "owner"
@@ -80,6 +89,53 @@ class WorkspaceMemberRole(str, Enum):
     MEMBER = "member"
 
 
+# Значение колонки -> член enum: прямой dict lookup вместо Enum.__call__
+_VISIBILITY_BY_VALUE: dict[str, WorkspaceVisibility] = {
+    member.value: member for member in WorkspaceVisibility
+}
+_ROLE_BY_VALUE: dict[str, WorkspaceMemberRole] = {
+    member.value: member for member in WorkspaceMemberRole
+}
+
+
+def to_visibility(value: str) -> WorkspaceVisibility:
+    """
+    Преобразует значение колонки visibility в WorkspaceVisibility.
+
+    Args:
+        value: Значение ('public' или 'private').
+
+    Returns:
+        WorkspaceVisibility: Член enum.
+
+    Raises:
+        ValueError: Если значение не является допустимой видимостью.
+    """
+    try:
+        return _VISIBILITY_BY_VALUE[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid WorkspaceVisibility") from None
+
+
+def to_member_role(value: str) -> WorkspaceMemberRole:
+    """
+    Преобразует значение колонки role в WorkspaceMemberRole.
+
+    Args:
+        value: Значение ('owner', 'admin' или 'member').
+
+    Returns:
+        WorkspaceMemberRole: Член enum.
+
+    Raises:
+        ValueError: Если значение не является допустимой ролью.
+    """
+    try:
+        return _ROLE_BY_VALUE[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid WorkspaceMemberRole") from None
+
+
 class WorkspaceModel(BaseModel):
     """
     Модель workspace - группы проблем для изоляции по командам.
@@ -91,13 +147,14 @@ class WorkspaceModel(BaseModel):
         name (str): Название workspace (например, "Marketing Team").
         slug (str): Уникальный URL-friendly идентификатор (например, "marketing-team").
         description (Optional[str]): Описание назначения workspace.
-        visibility (WorkspaceVisibility): Видимость (PUBLIC/PRIVATE).
+        visibility (str): Видимость ('public'/'private').
         owner_id (UUID): UUID владельца workspace (FK users.id).
         settings (dict): JSONB настройки workspace (JSON Schema валидация).
         ai_modules_enabled (bool): Флаг активации AI модулей (RAG, n8n, search).
 
         owner (UserModel): Владелец workspace.
         members (List[WorkspaceMemberModel]): Список участников с ролями.
+        visibility_enum (WorkspaceVisibility): visibility как WorkspaceVisibility.
         ai_modules (List[WorkspaceModuleModel]): Подключенные AI модули.
 
     Relationships:
@@ -154,6 +211,32 @@ class WorkspaceModel(BaseModel):
 
     __tablename__ = "workspaces"
 
+    __table_args__ = (
+        CheckConstraint(
+            "visibility IN ('public', 'private')",
+            name="check_workspaces_visibility_valid",
+        ),
+        # slug хранится только в нижнем регистре: поиск идёт по уникальному
+        # индексу ix_workspaces_slug без lower(slug) в WHERE
+        CheckConstraint(
+            "slug = lower(slug)",
+            name="check_workspaces_slug_lowercase",
+        ),
+        # Выборка workspace с включёнными AI модулями; выключенные в индекс не попадают
+        Index(
+            "ix_workspaces_ai_enabled_partial",
+            "id",
+            postgresql_where=text("ai_modules_enabled"),
+        ),
+        # Containment-фильтры по settings (см. settings_contains)
+        Index(
+            "ix_workspaces_settings_gin",
+            "settings",
+            postgresql_using="gin",
+            postgresql_ops={"settings": "jsonb_path_ops"},
+        ),
+    )
+
     # Основная информация
     name: Mapped[str] = mapped_column(
         String(100),
@@ -176,17 +259,13 @@ class WorkspaceModel(BaseModel):
         comment="Описание назначения workspace",
     )
 
-    visibility: Mapped[WorkspaceVisibility] = mapped_column(
-        SQLEnum(
-            WorkspaceVisibility,
-            name="workspace_visibility",
-            create_constraint=True,
-            validate_strings=True,
-        ),
+    # VARCHAR + CHECK вместо PG ENUM: в колонке хранятся значения ('public', 'private')
+    visibility: Mapped[str] = mapped_column(
+        String(16),
         nullable=False,
         index=True,
-        default=WorkspaceVisibility.PRIVATE,
-        comment="Видимость workspace (PUBLIC/PRIVATE)",
+        default=WorkspaceVisibility.PRIVATE.value,
+        comment="Видимость workspace (public/private)",
     )
 
     # Владение
@@ -210,58 +289,97 @@ class WorkspaceModel(BaseModel):
         Boolean,
         nullable=False,
         default=False,
-        index=True,
         comment="Флаг активации AI модулей (RAG, n8n, search)",
     )
 
     # Relationships
+    # lazy="raise": owner грузится только явно (joinedload в WorkspaceRepository),
+    # списки workspace читаются одной таблицей без JOIN на users
     owner: Mapped["UserModel"] = relationship(
         "UserModel",
         back_populates="owned_workspaces",
-        lazy="joined",
+        lazy="raise",
     )
 
+    # Коллекции не грузятся вместе с workspace: lazy="raise_on_sql" требует явного
+    # selectinload(...) в репозитории. passive_deletes="all": при удалении workspace
+    # дочерние строки обрабатывает БД (ON DELETE CASCADE, для document_services —
+    # SET NULL), SQLAlchemy не выдаёт DELETE/UPDATE по каждой загруженной записи
     members: Mapped[List["WorkspaceMemberModel"]] = relationship(
         "WorkspaceMemberModel",
         back_populates="workspace",
-        cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes="all",
+        cascade="save-update, merge",
+        lazy="raise_on_sql",
     )
 
     ai_modules: Mapped[List["WorkspaceModuleModel"]] = relationship(
         "WorkspaceModuleModel",
         back_populates="workspace",
-        cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes="all",
+        cascade="save-update, merge",
+        lazy="raise_on_sql",
     )
 
     knowledge_bases: Mapped[List["KnowledgeBaseModel"]] = relationship(
         "KnowledgeBaseModel",
         back_populates="workspace",
-        cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes="all",
+        cascade="save-update, merge",
+        lazy="raise_on_sql",
     )
 
     n8n_workflows: Mapped[List["N8nWorkflowModel"]] = relationship(
         "N8nWorkflowModel",
         back_populates="workspace",
-        cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes="all",
+        cascade="save-update, merge",
+        lazy="raise_on_sql",
     )
 
     document_services: Mapped[List["DocumentServiceModel"]] = relationship(
         "DocumentServiceModel",
         foreign_keys="[DocumentServiceModel.workspace_id]",
         back_populates="workspace",
-        passive_deletes=True,
-        cascade="all, delete-orphan",
+        passive_deletes="all",
+        cascade="save-update, merge",
     )
 
+    @classmethod
+    def settings_contains(cls, settings: dict) -> ColumnElement[bool]:
+        """
+        SQL-условие `settings @> :settings` для выборки workspace по настройкам.
+
+        Использует GIN индекс ix_workspaces_settings_gin (jsonb_path_ops).
+
+        Args:
+            settings: Фрагмент настроек, который должен содержаться в settings.
+
+        Returns:
+            ColumnElement[bool]: Условие для where().
+
+        Example:
+            >>> select(WorkspaceModel).where(
+            ...     WorkspaceModel.settings_contains({"auto_categorize": True})
+            ... )
+        """
+        return cls.settings.contains(settings)
+
+    @property
+    def visibility_enum(self) -> WorkspaceVisibility:
+        """
+        Видимость workspace как WorkspaceVisibility.
+
+        Returns:
+            WorkspaceVisibility: Член enum для значения колонки visibility.
+        """
+        return to_visibility(self.visibility)
+
     def __repr__(self) -> str:
         """Представление модели для отладки."""
         return (
             f"<WorkspaceModel(id={self.id}, name='{self.name}', "
-            f"slug='{self.slug}', visibility={self.visibility.value}, "
+            f"slug='{self.slug}', visibility={self.visibility}, "
             f"ai_enabled={self.ai_modules_enabled})>"
         )
 
@@ -276,7 +394,8 @@ class WorkspaceMemberModel(BaseModel):
     Attributes:
         workspace_id (UUID): UUID workspace (FK workspaces.id).
         user_id (UUID): UUID пользователя (FK users.id).
-        role (WorkspaceMemberRole): Роль в workspace (OWNER/ADMIN/MEMBER).
+        role (str): Роль в workspace ('owner'/'admin'/'member').
+        role_enum (WorkspaceMemberRole): role как WorkspaceMemberRole.
 
         workspace (WorkspaceModel): Workspace, в котором участник состоит.
         user (UserModel): Пользователь-участник.
@@ -287,7 +406,7 @@ class WorkspaceMemberModel(BaseModel):
 
     Constraints:
         Unique constraint на (workspace_id, user_id) - один user = одна роль в workspace.
-        Один workspace может иметь только одного OWNER.
+        Один workspace может иметь только одного OWNER (частичный уникальный индекс).
 
     Note:
         При создании workspace автор автоматически добавляется с ролью OWNER.
@@ -306,18 +425,41 @@ class WorkspaceMemberModel(BaseModel):
         True
         >>>
         >>> # Повышение до админа
-        >>> member.role = WorkspaceMemberRole.ADMIN
-        >>> member.role.value
-        'admin'
+        >>> member.role = WorkspaceMemberRole.ADMIN.value
+        >>> member.role_enum
+        <WorkspaceMemberRole.ADMIN: 'admin'>
     """
 
     __tablename__ = "workspace_members"
 
+    __table_args__ = (
+        CheckConstraint(
+            "role IN ('owner', 'admin', 'member')",
+            name="check_workspace_members_role_valid",
+        ),
+        # Один пользователь = одна роль в workspace. INCLUDE (role): проверка роли
+        # (get_user_role) выполняется index-only scan без чтения heap
+        Index(
+            "uq_workspace_member",
+            "workspace_id",
+            "user_id",
+            unique=True,
+            postgresql_include=["role"],
+        ),
+        # Не более одного OWNER на workspace: второй owner отклоняется самой БД
+        Index(
+            "uq_one_owner_per_ws",
+            "workspace_id",
+            unique=True,
+            postgresql_where=text("role = 'owner'"),
+        ),
+    )
+
     # Связи
+    # Отдельный индекс не нужен: workspace_id — ведущая колонка uq_workspace_member
     workspace_id: Mapped[UUID] = mapped_column(
         ForeignKey("workspaces.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
         comment="UUID workspace",
     )
 
@@ -329,34 +471,41 @@ class WorkspaceMemberModel(BaseModel):
     )
 
     # Роль
-    role: Mapped[WorkspaceMemberRole] = mapped_column(
-        SQLEnum(
-            WorkspaceMemberRole,
-            name="workspace_member_role",
-            create_constraint=True,
-            validate_strings=True,
-        ),
+    role: Mapped[str] = mapped_column(
+        String(16),
         nullable=False,
         index=True,
-        comment="Роль в workspace (OWNER/ADMIN/MEMBER)",
+        comment="Роль в workspace (owner/admin/member)",
     )
 
     # Relationships
+    # lazy="raise": проверки членства (get_member) читают только workspace_members;
+    # user подгружается явно там, где нужен в ответе
     workspace: Mapped["WorkspaceModel"] = relationship(
         "WorkspaceModel",
         back_populates="members",
-        lazy="joined",
+        lazy="raise",
     )
 
     user: Mapped["UserModel"] = relationship(
         "UserModel",
         back_populates="workspace_memberships",
-        lazy="joined",
+        lazy="raise",
     )
 
+    @property
+    def role_enum(self) -> WorkspaceMemberRole:
+        """
+        Роль участника как WorkspaceMemberRole.
+
+        Returns:
+            WorkspaceMemberRole: Член enum для значения колонки role.
+        """
+        return to_member_role(self.role)
+
     def __repr__(self) -> str:
         """Представление модели для отладки."""
         return (
             f"<WorkspaceMemberModel(id={self.id}, workspace_id={self.workspace_id}, "
-            f"user_id={self.user_id}, role={self.role.value})>"
+            f"user_id={self.user_id}, role={self.role})>"
         )
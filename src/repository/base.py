@@ -4,10 +4,28 @@
 
 # pylint: disable=not-callable  # func.count() is callable in SQLAlchemy
 import logging
+from operator import eq, ge, gt, le, lt, ne
 from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar
 from uuid import UUID
 
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import (
+    Boolean,
+    DefaultClause,
+    Integer,
+    UniqueConstraint,
+    and_,
+    bindparam,
+    delete,
+    exists,
+    func,
+    insert,
+    inspect,
+    literal,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import Executable
@@ -17,6 +35,85 @@ from src.models.base import BaseModel
 # Generic types
 M = TypeVar("M", bound=BaseModel)
 
+# Операторы фильтрации в формате field__operator=value (см. filter_by):
+# оператор -> функция (поле, значение) -> SQLAlchemy условие
+_FILTER_OPERATORS = {
+    "eq": eq,
+    "ne": ne,
+    "gt": gt,
+    "lt": lt,
+    "gte": ge,
+    "lte": le,
+    "in": lambda field, value: field.in_(value),
+    "not_in": lambda field, value: ~field.in_(value),
+    "like": lambda field, value: field.like(value),
+    "ilike": lambda field, value: field.ilike(value),
+    "is_null": lambda field, value: field.is_(None) if value else field.isnot(None),
+}
+
+# (модель, вид запроса, сигнатура фильтров) -> statement с bindparam вместо значений.
+# Повторные вызовы с той же формой фильтров берут готовый statement: без повторной
+# сборки условий и с уже вычисленным cache key для кэша компиляции SQLAlchemy.
+_FILTER_STATEMENT_CACHE: Dict[Tuple, Executable] = {}
+
+# Модель -> {имя атрибута: InstrumentedAttribute / hybrid expression}
+_MODEL_FIELDS: Dict[type, Dict[str, Any]] = {}
+
+
+def _model_fields(model: type) -> Dict[str, Any]:
+    """
+    Возвращает ORM-атрибуты модели (колонки, relationship, hybrid) по имени.
+
+    Набор атрибутов модели не меняется после маппинга, поэтому словарь
+    строится один раз на класс и переиспользуется всеми репозиториями.
+    """
+    fields = _MODEL_FIELDS.get(model)
+    if fields is None:
+        fields = {
+            key: getattr(model, key) for key in inspect(model).all_orm_descriptors.keys()
+        }
+        _MODEL_FIELDS[model] = fields
+    return fields
+
+
+# Модель -> наборы атрибутов, по которым есть PK / UNIQUE (цели ON CONFLICT)
+_MODEL_UNIQUE_KEYS: Dict[type, set] = {}
+
+
+def _model_unique_keys(model: type) -> set:
+    """
+    Возвращает наборы атрибутов модели, покрытые PK, UNIQUE-ограничением
+    или полным (не частичным) уникальным индексом.
+
+    Только по таким наборам Postgres принимает ON CONFLICT (...) без
+    index_where, поэтому upsert в get_or_create/update_or_create
+    включается лишь для фильтров, совпадающих с одним из них.
+    """
+    unique_keys = _MODEL_UNIQUE_KEYS.get(model)
+    if unique_keys is None:
+        mapper = inspect(model)
+        table = mapper.local_table
+        column_sets = [table.primary_key.columns]
+        column_sets.extend(
+            constraint.columns
+            for constraint in table.constraints
+            if isinstance(constraint, UniqueConstraint)
+        )
+        column_sets.extend(
+            index.columns
+            for index in table.indexes
+            if index.unique and index.dialect_options["postgresql"]["where"] is None
+        )
+        column_sets.extend([column] for column in table.columns if column.unique)
+
+        unique_keys = {
+            frozenset(mapper.get_property_by_column(column).key for column in columns)
+            for columns in column_sets
+            if len(columns)
+        }
+        _MODEL_UNIQUE_KEYS[model] = unique_keys
+    return unique_keys
+
 
 class SessionMixin:
     """
@@ -42,8 +139,11 @@ class BaseRepository(SessionMixin, Generic[M]):
     Attributes:
         session (AsyncSession): Асинхронная сессия базы данных.
         model (Type[M]): Тип SQLAlchemy модели.
+        BULK_CHUNK (int): Размер пачки строк на один INSERT в bulk_create.
     """
 
+    BULK_CHUNK = 1000
+
     def __init__(
         self,
         session: AsyncSession,
@@ -58,6 +158,7 @@ class BaseRepository(SessionMixin, Generic[M]):
         """
         super().__init__(session)
         self.model = model
+        self._fields = _model_fields(model)
         self.logger = logging.getLogger(self.__class__.__name__)
 
     async def create_item(self, data: Dict[str, Any]) -> M:
@@ -124,12 +225,12 @@ class BaseRepository(SessionMixin, Generic[M]):
             Optional[M]: SQLAlchemy модель или None, если не найдена.
         """
         try:
-            if not hasattr(self.model, field_name):
+            if field_name not in self._fields:
                 raise ValueError(
                     f"Поле '{field_name}' не существует в модели {self.model.__name__}"
                 )
 
-            field = getattr(self.model, field_name)
+            field = self._fields[field_name]
             statement = select(self.model).where(field == field_value)
             result = await self.session.execute(statement)
             return result.scalar()
@@ -156,6 +257,9 @@ class BaseRepository(SessionMixin, Generic[M]):
         Returns:
             List[M]: Список SQLAlchemy моделей.
         """
+        if limit == 0:
+            return []
+
         try:
             statement = select(self.model)
 
@@ -192,12 +296,14 @@ class BaseRepository(SessionMixin, Generic[M]):
             List[M]: Список SQLAlchemy моделей.
         """
         try:
-            if not hasattr(self.model, field_name):
+            if field_name not in self._fields:
                 raise ValueError(
                     f"Поле '{field_name}' не существует в модели {self.model.__name__}"
                 )
+            if limit == 0:
+                return []
 
-            field = getattr(self.model, field_name)
+            field = self._fields[field_name]
             statement = select(self.model).where(field == field_value)
 
             if offset is not None:
@@ -230,18 +336,31 @@ class BaseRepository(SessionMixin, Generic[M]):
 
         Raises:
             SQLAlchemyError: Если произошла ошибка при обновлении.
+
+        Note:
+            Один UPDATE ... RETURNING вместо SELECT + UPDATE + refresh.
+            Обновляются только колонки модели (ID не обновляется),
+            остальные ключи data игнорируются.
         """
+        columns = inspect(self.model).column_attrs
+        values = {
+            key: value for key, value in data.items() if key != "id" and key in columns
+        }
+        if not values:
+            return await self.get_item_by_id(item_id)
+
         try:
-            instance = await self.get_item_by_id(item_id)
-            if not instance:
+            statement = (
+                update(self.model)
+                .where(self.model.id == item_id)
+                .values(**values)
+                .returning(self.model)
+            )
+            instance = (await self.session.scalars(statement)).first()
+            if instance is None:
                 return None
 
-            for key, value in data.items():
-                if hasattr(instance, key) and key != "id":  # Не обновляем ID
-                    setattr(instance, key, value)
-
             await self.session.commit()
-            await self.session.refresh(instance)
 
             self.logger.info(
                 "Обновлена запись %s",
@@ -270,11 +389,16 @@ class BaseRepository(SessionMixin, Generic[M]):
             SQLAlchemyError: Если произошла ошибка при удалении.
         """
         try:
-            instance = await self.get_item_by_id(item_id)
-            if not instance:
+            # Один DELETE ... RETURNING; дочерние строки удаляет ON DELETE CASCADE
+            statement = (
+                delete(self.model)
+                .where(self.model.id == item_id)
+                .returning(self.model.id)
+            )
+            result = await self.session.execute(statement)
+            if result.scalar() is None:
                 return False
 
-            await self.session.delete(instance)
             await self.session.commit()
 
             self.logger.info(
@@ -308,19 +432,39 @@ class BaseRepository(SessionMixin, Generic[M]):
             >>> count = await repo.count_items(sort_order__gte=10, parent_id__is_null=True)
         """
         try:
-            statement = select(func.count()).select_from(self.model)
-
-            # Используем централизованную логику фильтрации
-            conditions = self._build_filter_conditions(**filters)
-            if conditions:
-                statement = statement.where(and_(*conditions))
-
-            result = await self.session.execute(statement)
+            statement, params = self._filter_statement(("count",), filters)
+            result = await self.session.execute(statement, params)
             return result.scalar() or 0
         except SQLAlchemyError as e:
             self.logger.error("Ошибка при подсчете %s: %s", self.model.__name__, e)
             return 0
 
+    async def exists(self, **filters) -> bool:
+        """
+        Проверяет, есть ли хотя бы одна запись, подходящая под фильтры.
+
+        В отличие от count_items(...) > 0 не считает все строки:
+        SELECT EXISTS завершается на первой найденной.
+
+        Args:
+            **filters: Фильтры (поддерживает операторы как в filter_by).
+
+        Returns:
+            bool: True, если запись существует, False иначе.
+
+        Example:
+            >>> has_solution = await repo.exists(issue_id=issue_id, is_solution=True)
+        """
+        try:
+            statement, params = self._filter_statement(("exists",), filters)
+            result = await self.session.execute(statement, params)
+            return bool(result.scalar())
+        except SQLAlchemyError as e:
+            self.logger.error(
+                "Ошибка при проверке существования %s: %s", self.model.__name__, e
+            )
+            return False
+
     async def exists_by_field(self, field_name: str, field_value: Any) -> bool:
         """
         Проверяет существование записи по полю.
@@ -333,16 +477,12 @@ class BaseRepository(SessionMixin, Generic[M]):
             bool: True, если запись существует, False иначе.
         """
         try:
-            if not hasattr(self.model, field_name):
+            if field_name not in self._fields:
                 return False
 
-            field = getattr(self.model, field_name)
-            statement = (
-                select(func.count()).select_from(self.model).where(field == field_value)
-            )
-            result = await self.session.execute(statement)
-            count = result.scalar() or 0
-            return count > 0
+            field = self._fields[field_name]
+            statement = select(exists().where(field == field_value))
+            return bool(await self.session.scalar(statement))
         except SQLAlchemyError as e:
             self.logger.error(
                 "Ошибка при проверке существования %s по полю %s=%s: %s",
@@ -353,15 +493,29 @@ class BaseRepository(SessionMixin, Generic[M]):
             )
             return False
 
-    async def bulk_create(self, models: List[M]) -> List[M]:
+    async def bulk_create(
+        self, models: List[M], copy_threshold: Optional[int] = None
+    ) -> List[M]:
         """
         Массовое создание записей в базе данных.
 
+        Значения колонок переданных моделей вставляются ORM
+        INSERT ... RETURNING пачками по BULK_CHUNK строк в одной транзакции,
+        поэтому server-side значения приходят сразу, без refresh каждой записи,
+        а буфер параметров драйвера не растёт вместе с размером списка.
+        Незаданные (None) атрибуты не передаются — для них срабатывают
+        default/server_default колонок.
+
         Args:
             models (List[M]): Список моделей SQLAlchemy для добавления.
+            copy_threshold (Optional[int]): Начиная с этого размера пачки
+                записи загружаются через bulk_copy (COPY). None — всегда INSERT.
 
         Returns:
-            List[M]: Список добавленных SQLAlchemy моделей.
+            List[M]: Созданные модели, загруженные из RETURNING (новые
+                экземпляры в сессии, а не переданные объекты). При COPY —
+                переданные модели с заполненными default-значениями, не
+                привязанные к сессии (server_default в них не попадают).
 
         Raises:
             SQLAlchemyError: Если произошла ошибка при массовом добавлении.
@@ -373,20 +527,39 @@ class BaseRepository(SessionMixin, Generic[M]):
             ... ]
             >>> created = await repo.bulk_create(categories)
         """
+        if not models:
+            return []
+
+        if copy_threshold is not None and len(models) >= copy_threshold:
+            await self.bulk_copy(models)
+            return models
+
+        keys = [attr.key for attr in inspect(self.model).column_attrs]
+        statement = insert(self.model).returning(self.model)
+        created: List[M] = []
+
         try:
-            self.session.add_all(models)
-            await self.session.commit()
+            for start in range(0, len(models), self.BULK_CHUNK):
+                payloads = [
+                    {
+                        key: value
+                        for key in keys
+                        if (value := getattr(model, key, None)) is not None
+                    }
+                    for model in models[start : start + self.BULK_CHUNK]
+                ]
+                result = await self.session.scalars(statement, payloads)
+                created.extend(result.all())
 
-            for model in models:
-                await self.session.refresh(model)
+            await self.session.commit()
 
             self.logger.info(
                 "Создано %s записей %s",
-                len(models),
+                len(created),
                 self.model.__name__,
-                extra={"model": self.model.__name__, "count": len(models)},
+                extra={"model": self.model.__name__, "count": len(created)},
             )
-            return models
+            return created
         except SQLAlchemyError as e:
             await self.session.rollback()
             self.logger.error(
@@ -394,10 +567,182 @@ class BaseRepository(SessionMixin, Generic[M]):
             )
             raise
 
+    async def bulk_copy(self, models: List[M]) -> int:
+        """
+        Массовая загрузка записей через COPY FROM STDIN (бинарный протокол asyncpg).
+
+        Для больших пачек быстрее INSERT: строки уходят одним потоком COPY без
+        разбора и планирования INSERT. COPY не применяет Python-side default,
+        поэтому незаданные атрибуты с default (id, created_at, ...) заполняются
+        здесь и проставляются в переданные модели. Значения проходят через
+        bind-процессоры типов колонок (JSONB -> строка, halfvec -> HalfVector).
+        Колонки со значением None в COPY не передаются — для них срабатывает
+        server_default: модели группируются по набору заданных колонок, и
+        каждая группа загружается отдельным COPY со своим списком колонок.
+        Computed-колонки и колонки, вычисляемые БД (FetchedValue), не передаются.
+
+        Args:
+            models (List[M]): Список моделей SQLAlchemy для загрузки.
+
+        Returns:
+            int: Количество загруженных записей.
+
+        Raises:
+            SQLAlchemyError: Если не удалось получить соединение или выполнить commit.
+            asyncpg.PostgresError: Если COPY отклонён БД (например, нарушение
+                уникальности) — транзакция откатывается.
+
+        Example:
+            >>> count = await repo.bulk_copy(
+            ...     [CategoryModel(name=name, code=code) for name, code in rows]
+            ... )
+        """
+        if not models:
+            return 0
+
+        # column_attrs содержат и query_expression (Label без default),
+        # поэтому колонки берутся из таблицы, а из маппера — только их ключи
+        keys = {attr.columns[0]: attr.key for attr in inspect(self.model).column_attrs}
+        attrs = [
+            (keys[column], column)
+            for column in self.model.__table__.columns
+            if column in keys
+            and column.computed is None
+            and column.identity is None
+            and (
+                column.server_default is None
+                or isinstance(column.server_default, DefaultClause)
+            )
+        ]
+        for model in models:
+            for key, column in attrs:
+                if getattr(model, key, None) is None and column.default is not None:
+                    if column.default.is_callable:
+                        setattr(model, key, column.default.arg(None))
+                    elif column.default.is_scalar:
+                        setattr(model, key, column.default.arg)
+
+        # Набор заданных колонок -> модели: None не передаётся как NULL,
+        # чтобы не перекрывать server_default в строках, где значение не задано
+        groups: Dict[Tuple[int, ...], List[M]] = {}
+        for model in models:
+            present = tuple(
+                index
+                for index, (key, _) in enumerate(attrs)
+                if getattr(model, key, None) is not None
+            )
+            groups.setdefault(present, []).append(model)
+
+        try:
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            for present, group in groups.items():
+                group_attrs = [attrs[index] for index in present]
+                processors = [
+                    column.type.bind_processor(connection.dialect)
+                    for _, column in group_attrs
+                ]
+                records = [
+                    tuple(
+                        processor(value) if processor else value
+                        for value, processor in zip(
+                            (getattr(model, key) for key, _ in group_attrs),
+                            processors,
+                            strict=True,
+                        )
+                    )
+                    for model in group
+                ]
+                await raw_connection.driver_connection.copy_records_to_table(
+                    self.model.__tablename__,
+                    records=records,
+                    columns=[column.name for _, column in group_attrs],
+                    schema_name=self.model.__table__.schema,
+                )
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            self.logger.error("Ошибка при COPY %s: %s", self.model.__name__, e)
+            raise
+
+        self.logger.info(
+            "COPY %s записей %s",
+            len(models),
+            self.model.__name__,
+            extra={"model": self.model.__name__, "count": len(models)},
+        )
+        return len(models)
+
+    async def bulk_insert(
+        self,
+        records: List[Dict[str, Any]],
+        ignore_conflicts: bool = False,
+    ) -> List[UUID]:
+        """
+        Массовая вставка записей из словарей без создания ORM-объектов.
+
+        В отличие от bulk_create, не требует refresh каждой записи: выполняет
+        INSERT ... RETURNING id пачками (insertmanyvalues), т.е. один
+        round-trip на insertmanyvalues_page_size строк вместо одного на запись.
+        Python-side default (id, created_at, updated_at) подставляются как обычно.
+
+        Args:
+            records (List[Dict[str, Any]]): Значения колонок для каждой записи.
+            ignore_conflicts (bool): Пропускать записи, конфликтующие по id
+                (ON CONFLICT (id) DO NOTHING) - для повторных импортов.
+
+        Returns:
+            List[UUID]: id вставленных записей (без пропущенных по конфликту).
+
+        Raises:
+            SQLAlchemyError: Если произошла ошибка при вставке.
+
+        Example:
+            >>> ids = await repo.bulk_insert(
+            ...     [{"issue_id": issue_id, "author_id": user_id, "content": "..."}],
+            ...     ignore_conflicts=True,
+            ... )
+        """
+        if not records:
+            return []
+
+        if ignore_conflicts:
+            statement = pg_insert(self.model).on_conflict_do_nothing(
+                index_elements=[self.model.id]
+            )
+        else:
+            statement = insert(self.model)
+
+        try:
+            result = await self.session.execute(
+                statement.returning(self.model.id), records
+            )
+            ids = list(result.scalars().all())
+            await self.session.commit()
+
+            self.logger.info(
+                "Вставлено %s из %s записей %s",
+                len(ids),
+                len(records),
+                self.model.__name__,
+                extra={"model": self.model.__name__, "count": len(ids)},
+            )
+            return ids
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            self.logger.error(
+                "Ошибка при массовой вставке %s: %s", self.model.__name__, e
+            )
+            raise
+
     async def bulk_update(self, models: List[M]) -> List[M]:
         """
         Массовое обновление записей в базе данных.
 
+        Изменения уже внесены в модели, поэтому достаточно commit: refresh
+        каждой записи не нужен. updated_at заполняется Python-side onupdate
+        при flush и тоже оказывается в модели без дополнительного SELECT.
+
         Args:
             models (List[M]): Список моделей SQLAlchemy для обновления.
 
@@ -416,9 +761,6 @@ class BaseRepository(SessionMixin, Generic[M]):
         try:
             await self.session.commit()
 
-            for model in models:
-                await self.session.refresh(model)
-
             self.logger.info(
                 "Обновлено %s записей %s",
                 len(models),
@@ -458,14 +800,9 @@ class BaseRepository(SessionMixin, Generic[M]):
             ...     print("Категория создана")
         """
         try:
-            # Строим запрос с использованием централизованной логики фильтрации
-            statement = select(self.model)
-            conditions = self._build_filter_conditions(**filters)
-
-            if conditions:
-                statement = statement.where(and_(*conditions))
-
-            result = await self.session.execute(statement)
+            # Запрос по форме фильтров берётся из кэша statement'ов
+            statement, params = self._filter_statement(("select", None, True), filters)
+            result = await self.session.execute(statement, params)
             instance = result.scalar()
 
             if instance:
@@ -479,10 +816,29 @@ class BaseRepository(SessionMixin, Generic[M]):
                     create_data[key] = value
 
             create_data.update(defaults or {})
-            instance = self.model(**create_data)
-            self.session.add(instance)
-            await self.session.commit()
-            await self.session.refresh(instance)
+
+            conflict_target = self._conflict_target(filters)
+            if conflict_target is not None:
+                # INSERT ... ON CONFLICT DO NOTHING: запись, вставленная параллельным
+                # запросом между SELECT и INSERT, не даёт IntegrityError
+                upsert = (
+                    pg_insert(self.model)
+                    .values(**create_data)
+                    .on_conflict_do_nothing(index_elements=conflict_target)
+                    .returning(self.model)
+                )
+                instance = (await self.session.scalars(upsert)).first()
+                if instance is None:
+                    result = await self.session.execute(statement, params)
+                    instance = result.scalar()
+                    await self.session.commit()
+                    return instance, False
+                await self.session.commit()
+            else:
+                instance = self.model(**create_data)
+                self.session.add(instance)
+                await self.session.commit()
+                await self.session.refresh(instance)
 
             self.logger.info(
                 "Создана новая запись %s",
@@ -517,16 +873,21 @@ class BaseRepository(SessionMixin, Generic[M]):
             ...     {"code": "tools"},
             ...     {"name": "Инструменты обновленные", "is_active": True}
             ... )
-        """
-        try:
-            # Строим запрос с использованием централизованной логики фильтрации
-            statement = select(self.model)
-            conditions = self._build_filter_conditions(**filters)
 
-            if conditions:
-                statement = statement.where(and_(*conditions))
+        Note:
+            Если filters — простые равенства по PK / уникальному ключу модели,
+            выполняется один INSERT ... ON CONFLICT DO UPDATE ... RETURNING
+            (атомарно, без гонки SELECT/INSERT). Иначе — SELECT, затем
+            UPDATE или INSERT.
+        """
+        conflict_target = self._conflict_target(filters)
+        if conflict_target is not None:
+            return await self._upsert(filters, defaults, conflict_target)
 
-            result = await self.session.execute(statement)
+        try:
+            # Запрос по форме фильтров берётся из кэша statement'ов
+            statement, params = self._filter_statement(("select", None, True), filters)
+            result = await self.session.execute(statement, params)
             instance = result.scalar()
 
             if instance:
@@ -572,6 +933,79 @@ class BaseRepository(SessionMixin, Generic[M]):
             )
             raise
 
+    def _conflict_target(self, filters: Dict[str, Any]) -> Optional[List[str]]:
+        """
+        Возвращает filters как цель ON CONFLICT, если это простые равенства
+        по PK / уникальному ключу модели, иначе None.
+        """
+        if not filters or any("__" in key for key in filters):
+            return None
+        if frozenset(filters) not in _model_unique_keys(self.model):
+            return None
+        return list(filters)
+
+    async def _upsert(
+        self,
+        filters: Dict[str, Any],
+        defaults: Dict[str, Any],
+        conflict_target: List[str],
+    ) -> Tuple[M, bool]:
+        """
+        INSERT ... ON CONFLICT (conflict_target) DO UPDATE ... RETURNING для
+        update_or_create.
+
+        ON CONFLICT DO UPDATE не применяет Python-side onupdate, поэтому
+        такие колонки (updated_at) добавляются в SET явно. Признак вставки —
+        xmax = 0 у возвращённой версии строки.
+        """
+        mapper = inspect(self.model)
+        values = {
+            key: value
+            for key, value in {**filters, **defaults}.items()
+            if key in mapper.column_attrs
+        }
+        set_ = {
+            mapper.columns[key].name: value
+            for key, value in defaults.items()
+            if key in mapper.column_attrs and key != "id" and key not in filters
+        }
+        for column in mapper.local_table.columns:
+            if column.onupdate is not None and column.name not in set_:
+                if column.onupdate.is_callable:
+                    set_[column.name] = column.onupdate.arg(None)
+                elif column.onupdate.is_scalar or column.onupdate.is_clause_element:
+                    set_[column.name] = column.onupdate.arg
+
+        if not set_:
+            return await self.get_or_create(filters, defaults)
+
+        statement = (
+            pg_insert(self.model)
+            .values(**values)
+            .on_conflict_do_update(index_elements=conflict_target, set_=set_)
+            .returning(self.model, literal_column("xmax = 0", Boolean))
+            .execution_options(populate_existing=True)
+        )
+
+        try:
+            result = await self.session.execute(statement)
+            instance, created = result.one()
+            await self.session.commit()
+
+            self.logger.info(
+                "%s запись %s",
+                "Создана новая" if created else "Обновлена",
+                self.model.__name__,
+                extra={"model": self.model.__name__, "filters": filters},
+            )
+            return instance, created
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            self.logger.error(
+                "Ошибка при update_or_create %s: %s", self.model.__name__, e
+            )
+            raise
+
     def _apply_filter_condition(self, field, operator: str, value):
         """
         Применяет условие фильтрации к полю.
@@ -587,34 +1021,11 @@ class BaseRepository(SessionMixin, Generic[M]):
         Returns:
             SQLAlchemy условие или None если оператор неизвестен
         """
-        if operator == "eq":
-            return field == value
-        elif operator == "ne":
-            return field != value
-        elif operator == "gt":
-            return field > value
-        elif operator == "lt":
-            return field < value
-        elif operator == "gte":
-            return field >= value
-        elif operator == "lte":
-            return field <= value
-        elif operator == "in":
-            return field.in_(value)
-        elif operator == "not_in":
-            return ~field.in_(value)
-        elif operator == "like":
-            return field.like(value)
-        elif operator == "ilike":
-            return field.ilike(value)
-        elif operator == "is_null":
-            if value:
-                return field.is_(None)
-            else:
-                return field.isnot(None)
-        else:
+        apply = _FILTER_OPERATORS.get(operator)
+        if apply is None:
             self.logger.warning("Неизвестный оператор '%s'", operator)
             return None
+        return apply(field, value)
 
     def _build_filter_conditions(self, **kwargs) -> List:
         """
@@ -641,7 +1052,7 @@ class BaseRepository(SessionMixin, Generic[M]):
             else:
                 field_name, operator = key, "eq"
 
-            if not hasattr(self.model, field_name):
+            if field_name not in self._fields:
                 self.logger.warning(
                     "Поле '%s' не существует в модели %s",
                     field_name,
@@ -649,7 +1060,7 @@ class BaseRepository(SessionMixin, Generic[M]):
                 )
                 continue
 
-            field = getattr(self.model, field_name)
+            field = self._fields[field_name]
             condition = self._apply_filter_condition(field, operator, value)
 
             if condition is not None:
@@ -657,6 +1068,128 @@ class BaseRepository(SessionMixin, Generic[M]):
 
         return conditions
 
+    def _filter_signature(
+        self, filters: Dict[str, Any]
+    ) -> Tuple[Tuple[Tuple[str, str, str, Any], ...], Dict[str, Any]]:
+        """
+        Разбирает фильтры на форму запроса (сигнатуру) и значения bind-параметров.
+
+        Значения уходят в bind-параметры f_<ключ> (limit/offset — page_limit/page_offset),
+        поэтому вызовы, отличающиеся только значениями, имеют одну сигнатуру.
+        В сигнатуре как литерал остаются только значения, меняющие SQL:
+        is_null (IS NULL / IS NOT NULL) и сравнение с None.
+
+        Args:
+            filters: Параметры фильтрации в формате field__operator=value
+
+        Returns:
+            Tuple: (сигнатура, параметры). Элемент сигнатуры —
+                (поле, оператор, "param" | "literal", имя параметра | значение).
+        """
+        signature = []
+        params: Dict[str, Any] = {}
+
+        for key, value in filters.items():
+            if key in ("limit", "offset"):
+                if value is not None:
+                    signature.append((key, "page", "param", f"page_{key}"))
+                    params[f"page_{key}"] = value
+                continue
+
+            if "__" in key:
+                field_name, operator = key.rsplit("__", 1)
+            else:
+                field_name, operator = key, "eq"
+
+            if field_name not in self._fields:
+                self.logger.warning(
+                    "Поле '%s' не существует в модели %s",
+                    field_name,
+                    self.model.__name__,
+                )
+                continue
+            if operator not in _FILTER_OPERATORS:
+                self.logger.warning("Неизвестный оператор '%s'", operator)
+                continue
+
+            if operator == "is_null":
+                signature.append((field_name, operator, "literal", bool(value)))
+            elif value is None:
+                signature.append((field_name, operator, "literal", None))
+            else:
+                signature.append((field_name, operator, "param", f"f_{key}"))
+                params[f"f_{key}"] = value
+
+        return tuple(signature), params
+
+    def _filter_statement(
+        self, kind: Tuple, filters: Dict[str, Any]
+    ) -> Tuple[Executable, Dict[str, Any]]:
+        """
+        Возвращает statement для фильтров из кэша или собирает и кэширует его.
+
+        Args:
+            kind: Вид запроса: ("select", order_by | None, ascending),
+                ("count",), ("exists",) или ("delete",)
+            filters: Параметры фильтрации (как в filter_by), включая limit/offset
+
+        Returns:
+            Tuple[Executable, Dict[str, Any]]: Statement и параметры для execute().
+        """
+        signature, params = self._filter_signature(filters)
+        cache_key = (self.model, kind, signature)
+
+        statement = _FILTER_STATEMENT_CACHE.get(cache_key)
+        if statement is not None:
+            return statement, params
+
+        conditions = []
+        pagination = {}
+        for field_name, operator, mode, arg in signature:
+            if operator == "page":
+                pagination[field_name] = bindparam(arg, type_=Integer)
+                continue
+            if mode == "param":
+                value = bindparam(arg, expanding=operator in ("in", "not_in"))
+            else:
+                value = arg
+            conditions.append(
+                self._apply_filter_condition(
+                    self._fields[field_name], operator, value
+                )
+            )
+
+        if kind[0] == "count":
+            statement = select(func.count()).select_from(self.model)
+        elif kind[0] == "exists":
+            statement = select(literal(1)).select_from(self.model)
+        elif kind[0] == "delete":
+            statement = delete(self.model)
+        else:
+            statement = select(self.model)
+
+        if conditions:
+            statement = statement.where(and_(*conditions))
+
+        if kind[0] == "exists":
+            # SELECT EXISTS (...): Postgres останавливается на первой подходящей строке
+            statement = select(statement.exists())
+
+        if kind[0] == "select":
+            _, order_by, ascending = kind
+            if order_by is not None:
+                order_field = self._fields[order_by]
+                statement = statement.order_by(
+                    order_field if ascending else order_field.desc()
+                )
+            if "offset" in pagination:
+                statement = statement.offset(pagination["offset"])
+            if "limit" in pagination:
+                statement = statement.limit(pagination["limit"])
+
+        _FILTER_STATEMENT_CACHE[cache_key] = statement
+        return statement, params
+
     async def filter_by(self, **kwargs) -> List[M]:
         """
         Фильтрует записи по указанным параметрам с поддержкой операторов.
@@ -693,29 +1226,24 @@ class BaseRepository(SessionMixin, Generic[M]):
             ...     parent_id__is_null=True
             ... )
         """
-        try:
-            statement = select(self.model)
-            conditions = self._build_filter_conditions(**kwargs)
-
-            if conditions:
-                statement = statement.where(and_(*conditions))
-
-            # Пагинация
-            limit = kwargs.get("limit")
-            offset = kwargs.get("offset")
-            if offset is not None:
-                statement = statement.offset(offset)
-            if limit is not None:
-                statement = statement.limit(limit)
+        if kwargs.get("limit") == 0:
+            return []
 
-            return await self.execute_and_return_scalars(statement)
+        try:
+            statement, params = self._filter_statement(("select", None, True), kwargs)
+            result = await self.session.execute(statement, params)
+            return list(result.scalars().all())
 
         except (SQLAlchemyError, AttributeError) as e:
             self.logger.error("Ошибка при фильтрации %s: %s", self.model.__name__, e)
             return []
 
     async def filter_by_ordered(
-        self, order_by: str, ascending: bool = True, **kwargs
+        self,
+        order_by: str,
+        ascending: bool = True,
+        load_options: Optional[List] = None,
+        **kwargs,
     ) -> List[M]:
         """
         Фильтрует записи с сортировкой.
@@ -726,6 +1254,7 @@ class BaseRepository(SessionMixin, Generic[M]):
         Args:
             order_by (str): Поле для сортировки.
             ascending (bool): True для ASC, False для DESC. По умолчанию True.
+            load_options (Optional[List]): Опции загрузки (defer/selectinload/...).
             **kwargs: Параметры фильтрации (те же, что в filter_by).
 
         Returns:
@@ -746,36 +1275,26 @@ class BaseRepository(SessionMixin, Generic[M]):
             ...     sort_order__gte=10
             ... )
         """
-        try:
-            statement = select(self.model)
-            conditions = self._build_filter_conditions(**kwargs)
-
-            if conditions:
-                statement = statement.where(and_(*conditions))
+        if kwargs.get("limit") == 0:
+            return []
 
-            # Добавляем сортировку
-            if not hasattr(self.model, order_by):
+        try:
+            if order_by not in self._fields:
                 self.logger.warning(
                     "Поле '%s' для сортировки не существует в модели %s",
                     order_by,
                     self.model.__name__,
                 )
-            else:
-                order_field = getattr(self.model, order_by)
-                if ascending:
-                    statement = statement.order_by(order_field)
-                else:
-                    statement = statement.order_by(order_field.desc())
+                order_by = None
 
-            # Пагинация
-            limit = kwargs.get("limit")
-            offset = kwargs.get("offset")
-            if offset is not None:
-                statement = statement.offset(offset)
-            if limit is not None:
-                statement = statement.limit(limit)
+            statement, params = self._filter_statement(
+                ("select", order_by, ascending), kwargs
+            )
+            if load_options:
+                statement = statement.options(*load_options)
 
-            return await self.execute_and_return_scalars(statement)
+            result = await self.session.execute(statement, params)
+            return list(result.scalars().all())
 
         except (SQLAlchemyError, AttributeError) as e:
             self.logger.error(
@@ -829,16 +1348,8 @@ class BaseRepository(SessionMixin, Generic[M]):
             >>> deleted_count = await repo.delete_by_filters(sort_order__lt=10)
         """
         try:
-            statement = delete(self.model)
-
-            # Используем централизованную логику фильтрации
-            conditions = self._build_filter_conditions(**filters)
-            if conditions:
-                # delete() требует where() с условиями через and_
-                for condition in conditions:
-                    statement = statement.where(condition)
-
-            result = await self.session.execute(statement)
+            statement, params = self._filter_statement(("delete",), filters)
+            result = await self.session.execute(statement, params)
             await self.session.commit()
 
             deleted_count = result.rowcount
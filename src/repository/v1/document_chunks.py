@@ -9,21 +9,58 @@ https://context7.com/pgvector/pgvector-python/llms.txt
 https://github.com/pgvector/pgvector-python
 
 Key concepts:
-- cosine_distance() для семантического поиска (меньше = похожее)
+- max_inner_product() (<#>) для семантического поиска (dot product): эмбеддинги
+  хранятся L2-нормированными, поэтому -inner_product == cosine similarity
+- cosine_distance() для ненормированных векторов (меньше = похожее)
 - l2_distance() для Euclidean distance
-- max_inner_product() для dot product similarity
 - Используем SQLAlchemy ORM методы вместо raw SQL для type safety
 """
 
-from typing import List, Tuple
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from pgvector import HalfVector
+from pgvector.sqlalchemy import BIT
+from sqlalchemy import Integer, Select, bindparam, cast, func, lambda_stmt, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.models.v1.knowledge_bases import DocumentChunkModel, DocumentModel
+from src.models.base import uuid7
+from src.models.v1.knowledge_bases import (
+    BinaryHalfVec,
+    DocumentChunkModel,
+    DocumentModel,
+    normalize_embedding,
+)
 from src.repository.base import BaseRepository
 
+# Размер списка кандидатов HNSW при поиске по умолчанию (pgvector default = 40).
+# Больше — выше recall ценой латентности. Для конкретной KB значение берётся
+# из vector_store_config["ef_search"] (KnowledgeBaseModel.default_vector_store_config)
+HNSW_EF_SEARCH = 100
+
+# Во сколько раз больше кандидатов отбирается по hamming (embedding_bits)
+# перед точным реранком по inner product на halfvec при двухэтапном поиске
+BINARY_PREFILTER_FACTOR = 10
+
+
+# Колонки, передаваемые в COPY (embedding_bits — генерируемая, заполняет БД)
+_COPY_COLUMNS = (
+    "id",
+    "document_id",
+    "kb_id",
+    "chunk_index",
+    "content",
+    "embedding",
+    "token_count",
+    "chunk_metadata",
+    "created_at",
+    "updated_at",
+)
+
 
 class DocumentChunkRepository(BaseRepository[DocumentChunkModel]):
     """Репозиторий для DocumentChunkModel с поддержкой pgvector поиска.
@@ -36,7 +73,9 @@ class DocumentChunkRepository(BaseRepository[DocumentChunkModel]):
         model: DocumentChunkModel class (через BaseRepository)
 
     Methods:
-        vector_search: Cosine similarity search по embedding
+        vector_search: Cosine similarity search по embedding (inner product)
+        bulk_upsert: Пакетный INSERT ... ON CONFLICT (document_id, chunk_index, kb_id)
+        copy_chunks: Загрузка новых чанков через COPY (append-only)
     """
 
     def __init__(self, session: AsyncSession):
@@ -53,18 +92,23 @@ class DocumentChunkRepository(BaseRepository[DocumentChunkModel]):
         kb_id: UUID,
         limit: int = 5,
         min_similarity: float = 0.7,
+        ef_search: int = HNSW_EF_SEARCH,
+        binary_prefilter: bool = False,
+        probes: int | None = None,
     ) -> List[Tuple[UUID, str, int, float, str]]:
         """Выполняет семантический поиск по векторным эмбеддингам.
 
-        Использует pgvector cosine_distance() для поиска похожих чанков.
-        Cosine distance: 0 = идентичные векторы, 2 = противоположные.
-        Similarity = 1 - cosine_distance (чем выше similarity, тем релевантнее).
+        Использует pgvector max_inner_product() (<#>, отрицательное скалярное
+        произведение) для поиска похожих чанков. Эмбеддинги чанков и запрос
+        нормируются BinaryHalfVec при записи/передаче в БД, поэтому similarity = -(embedding <#> query)
+        совпадает с cosine similarity, но без нормирования на каждое сравнение
+        (vector_store_config["metric"] = "ip_normalized").
 
         Процесс:
-        1. JOIN с DocumentModel для получения filename и фильтрации по kb_id
-        2. Вычисление similarity = 1 - cosine_distance(embedding, query)
+        1. Фильтрация по document_chunks.kb_id, JOIN с DocumentModel для filename
+        2. Вычисление similarity = -max_inner_product(embedding, query)
         3. Фильтрация по min_similarity порогу
-        4. Сортировка по distance (ascending = более похожие первыми)
+        4. Сортировка по <#> (ascending = более похожие первыми)
         5. LIMIT для топ-N результатов
 
         Args:
@@ -72,6 +116,12 @@ class DocumentChunkRepository(BaseRepository[DocumentChunkModel]):
             kb_id: UUID Knowledge Base для фильтрации документов
             limit: Максимальное количество результатов (default: 5)
             min_similarity: Минимальный порог similarity 0-1 (default: 0.7)
+            ef_search: Глубина поиска HNSW (SET LOCAL hnsw.ef_search)
+            binary_prefilter: Двухэтапный поиск — сначала limit * BINARY_PREFILTER_FACTOR
+                кандидатов по hamming distance на embedding_bits, затем реранк по
+                inner product
+            probes: Число просматриваемых списков IVFFlat (SET LOCAL ivfflat.probes)
+                для KB с index_type="ivfflat"; None — KB ищется по HNSW
 
         Returns:
             List[Tuple]: Каждый элемент содержит:
@@ -93,36 +143,54 @@ class DocumentChunkRepository(BaseRepository[DocumentChunkModel]):
             >>> for doc_id, filename, idx, sim, content in results:
             ...     print(f"{filename} chunk {idx}: {sim:.4f}")
 
+        Note:
+            ORDER BY embedding <#> query обслуживается HNSW индексом
+            ix_document_chunks_embedding (halfvec_ip_ops); перед запросом
+            выставляется SET LOCAL hnsw.ef_search (ef_search). Запросы строятся
+            _inner_product_search_stmt / _binary_prefilter_search_stmt через
+            lambda_stmt и кэшируются; типы pgvector объявляют cache_ok=True.
+            Для KB с IVFFlat частичный индекс строит rebuild_vector_index; его
+            предикат kb_id = '...' применим только в custom plan, поэтому при
+            probes план подготовленного запроса не обобщается.
+
         References:
-            - pgvector cosine_distance: https://github.com/pgvector/pgvector-python
+            - pgvector max_inner_product: https://github.com/pgvector/pgvector-python
             - SQLAlchemy ORM methods: https://context7.com/pgvector/pgvector-python
         """
-        # Вычисляем distance и similarity используя pgvector методы
-        # cosine_distance() - метод из pgvector.sqlalchemy
-        distance = DocumentChunkModel.embedding.cosine_distance(embedding)
-        similarity = (1 - distance).label("similarity")
+        # SET LOCAL действует до конца текущей транзакции и не "протекает"
+        # в другие запросы через пул соединений
+        await self.session.execute(
+            text(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+        )
+        if probes is not None:
+            await self.session.execute(
+                text(f"SET LOCAL ivfflat.probes = {int(probes)}")
+            )
+            await self.session.execute(
+                text("SET LOCAL plan_cache_mode = force_custom_plan")
+            )
 
-        # Строим запрос с JOIN и фильтрацией
-        # Используем execute_and_return_scalars не подходит (нужны multiple columns)
-        # Поэтому используем session.execute напрямую с select()
-        stmt = (
-            select(
-                DocumentChunkModel.document_id,
-                DocumentModel.filename,
-                DocumentChunkModel.chunk_index,
-                similarity,
-                DocumentChunkModel.content,
+        # lambda_stmt кэширует построенный запрос по месту вызова: SQL не
+        # собирается и не компилируется заново, меняются только параметры
+        if binary_prefilter:
+            stmt = lambda_stmt(
+                lambda: DocumentChunkRepository._binary_prefilter_search_stmt()
+            )
+        else:
+            stmt = lambda_stmt(
+                lambda: DocumentChunkRepository._inner_product_search_stmt()
             )
-            .join(DocumentModel, DocumentChunkModel.document_id == DocumentModel.id)
-            .where(DocumentModel.kb_id == kb_id)
-            .where(DocumentChunkModel.embedding.is_not(None))
-            .where(similarity >= min_similarity)
-            .order_by(distance)  # ORDER BY distance ASC (меньше = похожее)
-            .limit(limit)
-        )
 
         # Выполняем запрос через self.session (наследуется от SessionMixin)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            stmt,
+            {
+                "query_embedding": embedding,
+                "kb_id": kb_id,
+                "min_similarity": min_similarity,
+                "limit": limit,
+            },
+        )
         rows = result.fetchall()
 
         # Преобразуем Row objects в типизированные tuples
@@ -137,3 +205,255 @@ class DocumentChunkRepository(BaseRepository[DocumentChunkModel]):
             )
             for row in rows
         ]
+
+    async def bulk_upsert(
+        self,
+        rows: List[Dict[str, Any]],
+        batch_size: int = 500,
+    ) -> int:
+        """Пакетно вставляет или обновляет чанки документов.
+
+        Строки отправляются пачками по batch_size через executemany
+        (insertmanyvalues): один round-trip на пачку вместо INSERT на каждый
+        чанк. Конфликт по (document_id, chunk_index) обновляет content,
+        embedding, token_count и chunk_metadata — повторная индексация
+        документа не требует предварительного удаления чанков.
+        kb_id (ключ партиционирования) подставляется из documents, если не передан;
+        embedding L2-нормируется (BinaryHalfVec, см. vector_search).
+
+        Args:
+            rows: Значения колонок чанков (document_id, chunk_index, content,
+                embedding, token_count, опционально chunk_metadata)
+            batch_size: Количество строк в одной пачке
+
+        Returns:
+            int: Количество обработанных строк
+
+        Raises:
+            SQLAlchemyError: При ошибке вставки (транзакция откатывается)
+
+        Example:
+            >>> await repo.bulk_upsert([
+            ...     {"document_id": doc_id, "chunk_index": 0, "content": "...",
+            ...      "embedding": vec, "token_count": 150},
+            ... ])
+        """
+        if not rows:
+            return 0
+
+        rows = await self._prepare_rows(rows)
+        statement = pg_insert(self.model)
+        statement = statement.on_conflict_do_update(
+            index_elements=[
+                self.model.document_id,
+                self.model.chunk_index,
+                self.model.kb_id,
+            ],
+            set_={
+                "content": statement.excluded.content,
+                "embedding": statement.excluded.embedding,
+                "token_count": statement.excluded.token_count,
+                "chunk_metadata": statement.excluded.chunk_metadata,
+                "updated_at": func.now(),
+            },
+        )
+
+        try:
+            for start in range(0, len(rows), batch_size):
+                await self.session.execute(statement, rows[start : start + batch_size])
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            self.logger.error("Ошибка при upsert чанков: %s", e)
+            raise
+
+        self.logger.info("Upsert %d чанков пачками по %d", len(rows), batch_size)
+        return len(rows)
+
+    async def copy_chunks(self, rows: List[Dict[str, Any]]) -> int:
+        """Загружает новые чанки через COPY FROM STDIN (append-only).
+
+        Быстрее bulk_upsert для первичной индексации: данные уходят одним
+        потоком COPY без разбора INSERT. Формат бинарный (copy_records_to_table):
+        embedding кодируется кодеком halfvec, зарегистрированным на соединениях
+        пула. Python-side defaults не применяются, поэтому id/created_at/updated_at
+        формируются здесь.
+
+        Args:
+            rows: Значения колонок чанков (как в bulk_upsert)
+
+        Returns:
+            int: Количество загруженных строк
+
+        Raises:
+            asyncpg.UniqueViolationError: Если чанк (document_id, chunk_index)
+                уже существует — для повторной индексации используйте bulk_upsert
+        """
+        if not rows:
+            return 0
+
+        rows = await self._prepare_rows(rows)
+        now = datetime.now(timezone.utc)
+        records = [
+            (
+                uuid7(),
+                row["document_id"],
+                row["kb_id"],
+                row["chunk_index"],
+                row["content"],
+                HalfVector(row["embedding"]),
+                row["token_count"],
+                json.dumps(row.get("chunk_metadata") or {}, ensure_ascii=False),
+                now,
+                now,
+            )
+            for row in rows
+        ]
+
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            self.model.__tablename__,
+            records=records,
+            columns=_COPY_COLUMNS,
+        )
+        await self.session.commit()
+
+        self.logger.info("COPY %d чанков в %s", len(rows), self.model.__tablename__)
+        return len(rows)
+
+    async def _prepare_rows(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Готовит строки чанков к вставке: kb_id из documents и нормированный embedding.
+
+        Нормирование здесь нужно для copy_chunks: COPY идёт мимо
+        BinaryHalfVec.bind_processor, который нормирует остальные записи.
+
+        Args:
+            rows: Значения колонок чанков
+
+        Returns:
+            List[Dict[str, Any]]: Новые строки (исходные словари не меняются)
+        """
+        return [
+            {**row, "embedding": normalize_embedding(row["embedding"])}
+            for row in await self._with_kb_ids(rows)
+        ]
+
+    async def _with_kb_ids(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Дополняет строки чанков kb_id их документов.
+
+        document_chunks партиционирована по kb_id, и партиция выбирается до
+        BEFORE-триггеров, поэтому kb_id должен быть в самой вставке. Для строк
+        без kb_id он берётся из documents одним запросом на всю пачку.
+
+        Args:
+            rows: Значения колонок чанков
+
+        Returns:
+            List[Dict[str, Any]]: Строки с заполненным kb_id
+        """
+        document_ids = {row["document_id"] for row in rows if "kb_id" not in row}
+        if not document_ids:
+            return rows
+
+        result = await self.session.execute(
+            select(DocumentModel.id, DocumentModel.kb_id).where(
+                DocumentModel.id.in_(document_ids)
+            )
+        )
+        kb_ids = dict(result.all())
+        return [
+            row if "kb_id" in row else {**row, "kb_id": kb_ids.get(row["document_id"])}
+            for row in rows
+        ]
+
+    @staticmethod
+    def _inner_product_search_stmt() -> Select:
+        """Строит запрос поиска по inner product (HNSW индекс halfvec_ip_ops).
+
+        Все входные значения — bindparam (query_embedding, kb_id,
+        min_similarity, limit), поэтому запрос кэшируется целиком.
+
+        Returns:
+            Select: Запрос с колонками (document_id, filename, chunk_index,
+                similarity, content)
+        """
+        # max_inner_product() (<#>) возвращает -(a·b): для нормированных векторов
+        # это -cosine similarity, сортировка по возрастанию — самые похожие первыми
+        distance = DocumentChunkModel.embedding.max_inner_product(
+            bindparam("query_embedding", type_=BinaryHalfVec(1536))
+        )
+        similarity = (-distance).label("similarity")
+
+        # Используем execute_and_return_scalars не подходит (нужны multiple columns)
+        # Поэтому используем session.execute напрямую с select()
+        return (
+            select(
+                DocumentChunkModel.document_id,
+                DocumentModel.filename,
+                DocumentChunkModel.chunk_index,
+                similarity,
+                DocumentChunkModel.content,
+            )
+            .join(DocumentModel, DocumentChunkModel.document_id == DocumentModel.id)
+            .where(DocumentChunkModel.kb_id == bindparam("kb_id"))
+            .where(DocumentChunkModel.embedding.is_not(None))
+            .where(similarity >= bindparam("min_similarity"))
+            .order_by(distance)  # ORDER BY distance ASC (меньше = похожее)
+            .limit(bindparam("limit", type_=Integer))
+        )
+
+    @staticmethod
+    def _binary_prefilter_search_stmt() -> Select:
+        """Строит двухэтапный запрос: hamming prefilter + inner product rerank.
+
+        Этап 1 (CTE candidates): limit * BINARY_PREFILTER_FACTOR ближайших чанков
+        по hamming distance между embedding_bits и binary_quantize(query) —
+        HNSW индекс ix_document_chunks_embedding_bits (bit_hamming_ops).
+        Этап 2: точный inner product по halfvec только среди кандидатов.
+
+        CTE помечен MATERIALIZED, а реранк считается по колонке CTE, чтобы
+        планировщик не подменил этап 1 сканом halfvec индекса.
+        Параметры те же, что у _inner_product_search_stmt.
+
+        Returns:
+            Select: Запрос с колонками (document_id, filename, chunk_index,
+                similarity, content) — как в vector_search
+        """
+        query_embedding = bindparam("query_embedding", type_=BinaryHalfVec(1536))
+        limit = bindparam("limit", type_=Integer)
+        # binary_quantize перегружена для vector и halfvec — тип параметра явный
+        query_bits = func.binary_quantize(
+            cast(query_embedding, BinaryHalfVec(1536)), type_=BIT(1536)
+        )
+        candidates = (
+            select(
+                DocumentChunkModel.document_id,
+                DocumentModel.filename,
+                DocumentChunkModel.chunk_index,
+                DocumentChunkModel.content,
+                DocumentChunkModel.embedding,
+            )
+            .join(DocumentModel, DocumentChunkModel.document_id == DocumentModel.id)
+            .where(DocumentChunkModel.kb_id == bindparam("kb_id"))
+            .order_by(DocumentChunkModel.embedding_bits.hamming_distance(query_bits))
+            .limit(limit * BINARY_PREFILTER_FACTOR)
+            .cte("candidates")
+            .prefix_with("MATERIALIZED")
+        )
+
+        distance = candidates.c.embedding.max_inner_product(query_embedding)
+        similarity = (-distance).label("similarity")
+
+        return (
+            select(
+                candidates.c.document_id,
+                candidates.c.filename,
+                candidates.c.chunk_index,
+                similarity,
+                candidates.c.content,
+            )
+            .where(similarity >= bindparam("min_similarity"))
+            .order_by(distance)
+            .limit(limit)
+        )
@@ -19,6 +19,7 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from src.models.v1 import (
     DocumentProcessingModel,
@@ -57,7 +58,8 @@ class DocumentProcessingRepository(BaseRepository[DocumentProcessingModel]):
         """Получает запись обработки по ID документа.
 
         Использует уникальный индекс на document_service_id для быстрого поиска.
-        Применяется для проверки статуса обработки при запросах функций.
+        Применяется для проверки статуса обработки при запросах функций,
+        поэтому загружает error_message, но не extracted_text.
 
         Args:
             document_service_id: UUID документа из document_services таблицы.
@@ -71,9 +73,12 @@ class DocumentProcessingRepository(BaseRepository[DocumentProcessingModel]):
             >>> if processing and processing.status == ProcessingStatus.COMPLETED:
             ...     print(f"Извлечено {processing.page_count} страниц")
         """
-        return await self.get_item_by_field(
-            "document_service_id", document_service_id
+        query = (
+            select(DocumentProcessingModel)
+            .where(DocumentProcessingModel.document_service_id == document_service_id)
+            .options(undefer(DocumentProcessingModel.error_message))
         )
+        return await self.execute_and_return_scalar(query)
 
     async def create_processing_record(
         self,
@@ -245,8 +250,12 @@ class DocumentProcessingRepository(BaseRepository[DocumentProcessingModel]):
             ...     # Можно использовать extracted_text для поиска
             ...     results = search_in_text(processing.extracted_text, query)
         """
-        query = select(DocumentProcessingModel).where(
-            DocumentProcessingModel.document_service_id == document_service_id,
-            DocumentProcessingModel.status == ProcessingStatus.COMPLETED,
+        query = (
+            select(DocumentProcessingModel)
+            .where(
+                DocumentProcessingModel.document_service_id == document_service_id,
+                DocumentProcessingModel.status == ProcessingStatus.COMPLETED,
+            )
+            .options(undefer(DocumentProcessingModel.extracted_text))
         )
         return await self.execute_and_return_scalar(query)
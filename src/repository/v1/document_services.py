@@ -18,18 +18,31 @@ import logging
 from typing import List, Optional, Union
 from uuid import UUID
 
-from sqlalchemy import or_, select
+from sqlalchemy import or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, with_expression
 
 from src.models.v1.document_services import (
     DocumentFileType,
     DocumentServiceModel,
+    ServiceFunctionType,
 )
 from src.repository.base import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Листинги (DocumentServiceListItemSchema) не используют available_functions:
+# JSONB не выбирается и не парсится, случайное обращение — ошибка, а не запрос.
+# Бейдж has_ai_chat считается на сервере тем же @>, что и has_function().
+_LISTING_LOAD_OPTIONS = (
+    defer(DocumentServiceModel.available_functions, raiseload=True),
+    with_expression(
+        DocumentServiceModel.has_ai_chat,
+        DocumentServiceModel.has_function(ServiceFunctionType.AI_CHAT.value),
+    ),
+)
+
 
 class DocumentServiceRepository(BaseRepository[DocumentServiceModel]):
     """
@@ -94,7 +107,10 @@ class DocumentServiceRepository(BaseRepository[DocumentServiceModel]):
             filters["file_type"] = file_type
 
         services = await self.filter_by_ordered(
-            "created_at", ascending=False, **filters
+            "created_at",
+            ascending=False,
+            load_options=_LISTING_LOAD_OPTIONS,
+            **filters,
         )
 
         self.logger.info(
@@ -136,7 +152,10 @@ class DocumentServiceRepository(BaseRepository[DocumentServiceModel]):
             filters["is_public"] = False
 
         services = await self.filter_by_ordered(
-            "created_at", ascending=False, **filters
+            "created_at",
+            ascending=False,
+            load_options=_LISTING_LOAD_OPTIONS,
+            **filters,
         )
 
         self.logger.info(
@@ -170,6 +189,7 @@ class DocumentServiceRepository(BaseRepository[DocumentServiceModel]):
         services = await self.filter_by_ordered(
             "created_at",
             ascending=False,
+            load_options=_LISTING_LOAD_OPTIONS,
             workspace_id=workspace_id,
             limit=limit,
             offset=offset,
@@ -220,7 +240,10 @@ class DocumentServiceRepository(BaseRepository[DocumentServiceModel]):
             filters["is_public"] = is_public
 
         services = await self.filter_by_ordered(
-            "created_at", ascending=False, **filters
+            "created_at",
+            ascending=False,
+            load_options=_LISTING_LOAD_OPTIONS,
+            **filters,
         )
 
         self.logger.info(
@@ -268,7 +291,7 @@ class DocumentServiceRepository(BaseRepository[DocumentServiceModel]):
             - contains (@>) для AND логики (все теги присутствуют)
         """
         try:
-            stmt = select(self.model)
+            stmt = select(self.model).options(*_LISTING_LOAD_OPTIONS)
 
             # PostgreSQL ARRAY operators для поиска по тегам
             if match_all:
@@ -335,6 +358,7 @@ class DocumentServiceRepository(BaseRepository[DocumentServiceModel]):
                     )
                 )
                 .order_by(self.model.view_count.desc(), self.model.created_at.desc())
+                .options(*_LISTING_LOAD_OPTIONS)
             )
 
             if offset:
@@ -392,7 +416,10 @@ class DocumentServiceRepository(BaseRepository[DocumentServiceModel]):
             filters["file_type"] = file_type_enum
 
         services = await self.filter_by_ordered(
-            "view_count", ascending=False, **filters
+            "view_count",
+            ascending=False,
+            load_options=_LISTING_LOAD_OPTIONS,
+            **filters,
         )
 
         self.logger.info(
@@ -402,38 +429,47 @@ class DocumentServiceRepository(BaseRepository[DocumentServiceModel]):
         )
         return services
 
-    async def increment_view_count(self, service_id: UUID) -> Optional[DocumentServiceModel]:
+    async def increment_view_count(self, service_id: UUID) -> Optional[int]:
         """
         Увеличивает счётчик просмотров сервиса.
 
         Вызывается при каждом просмотре документа.
-        Инкрементирует view_count на 1.
+        Выполняет атомарный `UPDATE ... SET view_count = view_count + 1`
+        одним запросом, без предварительного SELECT и без гонки между
+        параллельными просмотрами.
 
         Args:
             service_id: UUID сервиса документа.
 
         Returns:
-            Обновлённая DocumentServiceModel или None, если не найден.
+            Новое значение view_count или None, если сервис не найден.
 
         Example:
-            >>> service = await repository.increment_view_count(service_id)
-            >>> print(f"Просмотров: {service.view_count}")
+            >>> view_count = await repository.increment_view_count(service_id)
+            >>> print(f"Просмотров: {view_count}")
         """
-        service = await self.get_item_by_id(service_id)
-        if not service:
+        statement = (
+            update(self.model)
+            .where(self.model.id == service_id)
+            .values(view_count=self.model.view_count + 1)
+            .returning(self.model.view_count)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(statement)
+        view_count = result.scalar_one_or_none()
+
+        if view_count is None:
             self.logger.warning("Сервис %s не найден для инкремента view_count", service_id)
             return None
 
-        service.view_count += 1
         await self.session.commit()
-        await self.session.refresh(service)
 
         self.logger.info(
             "Увеличен view_count для сервиса %s (новое значение: %d)",
             service_id,
-            service.view_count,
+            view_count,
         )
-        return service
+        return view_count
 
     async def get_recent_services(
         self,
@@ -467,7 +503,10 @@ class DocumentServiceRepository(BaseRepository[DocumentServiceModel]):
             filters["workspace_id"] = workspace_id
 
         services = await self.filter_by_ordered(
-            "created_at", ascending=False, **filters
+            "created_at",
+            ascending=False,
+            load_options=_LISTING_LOAD_OPTIONS,
+            **filters,
         )
 
         self.logger.info(
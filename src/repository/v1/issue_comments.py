@@ -15,12 +15,14 @@ Example:
 """
 
 import logging
-from typing import List
+from collections import defaultdict
+from typing import List, Optional
 from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import noload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.sql import func
 
 from src.models.v1.issue_comments import IssueCommentModel
@@ -38,6 +40,7 @@ class IssueCommentRepository(BaseRepository[IssueCommentModel]):
 
     Methods:
         get_issue_comments: Получить все комментарии проблемы с опциональной загрузкой ответов.
+        get_issue_comment_tree: Загрузить всё дерево комментариев проблемы одним запросом.
         get_comment_tree: Получить дерево комментариев начиная с родительского.
         get_comment_count: Подсчитать количество комментариев у проблемы.
         mark_as_solution: Отметить комментарий как решение.
@@ -63,6 +66,44 @@ class IssueCommentRepository(BaseRepository[IssueCommentModel]):
         self.logger = logging.getLogger(self.__class__.__name__)
         logger.debug("🔍 Инициализирован IssueCommentRepository")
 
+    # Дерево собирается в Python: replies/parent не загружаются ORM
+    _TREE_LOAD_OPTIONS = (
+        selectinload(IssueCommentModel.author),
+        noload(IssueCommentModel.replies),
+        raiseload(IssueCommentModel.parent),
+    )
+
+    @staticmethod
+    def _link_comment_tree(
+        comments: List[IssueCommentModel],
+    ) -> defaultdict[Optional[UUID], List[IssueCommentModel]]:
+        """
+        Связывает загруженные комментарии в дерево.
+
+        Заполняет replies каждого комментария и parent там, где родитель
+        есть среди загруженных (или его нет вовсе), через set_committed_value —
+        без запросов и без пометки объектов как изменённых.
+
+        Args:
+            comments (List[IssueCommentModel]): Комментарии, упорядоченные по created_at.
+
+        Returns:
+            defaultdict: parent_id -> список прямых ответов.
+        """
+        by_id = {comment.id: comment for comment in comments}
+        children: defaultdict[Optional[UUID], List[IssueCommentModel]] = defaultdict(
+            list
+        )
+        for comment in comments:
+            children[comment.parent_id].append(comment)
+
+        for comment in comments:
+            set_committed_value(comment, "replies", children.get(comment.id, []))
+            if comment.parent_id is None or comment.parent_id in by_id:
+                set_committed_value(comment, "parent", by_id.get(comment.parent_id))
+
+        return children
+
     async def get_issue_comments(
         self,
         issue_id: UUID,
@@ -72,7 +113,7 @@ class IssueCommentRepository(BaseRepository[IssueCommentModel]):
         Получить все комментарии проблемы.
 
         Возвращает только корневые комментарии (parent_id IS NULL).
-        Если with_replies=True, загружает вложенные ответы через selectinload.
+        Если with_replies=True, дерево ответов собирается через get_issue_comment_tree.
 
         Args:
             issue_id (UUID): UUID проблемы.
@@ -89,7 +130,8 @@ class IssueCommentRepository(BaseRepository[IssueCommentModel]):
             <UserModel>
 
         Note:
-            Использует joinedload для author и selectinload для replies.
+            Использует selectinload для author; replies при with_replies=True
+            заполняются из одного запроса по всем комментариям проблемы.
             Возвращает только корневые комментарии (parent_id IS NULL).
         """
         logger.debug(
@@ -98,26 +140,20 @@ class IssueCommentRepository(BaseRepository[IssueCommentModel]):
             with_replies,
         )
 
-        query = (
-            select(IssueCommentModel)
-            .where(
-                IssueCommentModel.issue_id == issue_id,
-                IssueCommentModel.parent_id.is_(None),  # Только корневые комментарии
-            )
-            .options(joinedload(IssueCommentModel.author))  # Eager load автора
-            .order_by(IssueCommentModel.created_at)  # Сортировка по времени
-        )
-
         if with_replies:
-            # Рекурсивная загрузка всех ответов
-            query = query.options(
-                selectinload(IssueCommentModel.replies).options(
-                    joinedload(IssueCommentModel.author),
-                    selectinload(IssueCommentModel.replies),  # Вложенные ответы
+            # Всё дерево одним запросом, без selectin-запроса на каждый уровень
+            comments = await self.get_issue_comment_tree(issue_id)
+        else:
+            query = (
+                select(IssueCommentModel)
+                .where(
+                    IssueCommentModel.issue_id == issue_id,
+                    IssueCommentModel.parent_id.is_(None),  # Только корневые комментарии
                 )
+                .options(selectinload(IssueCommentModel.author))  # Eager load автора
+                .order_by(IssueCommentModel.created_at)  # Сортировка по времени
             )
-
-        comments = await self.execute_and_return_scalars(query)
+            comments = await self.execute_and_return_scalars(query)
 
         logger.info(
             "✨ Получено %d корневых комментариев для проблемы %s (with_replies=%s)",
@@ -127,6 +163,51 @@ class IssueCommentRepository(BaseRepository[IssueCommentModel]):
         )
         return comments
 
+    async def get_issue_comment_tree(
+        self,
+        issue_id: UUID,
+    ) -> List[IssueCommentModel]:
+        """
+        Загрузить всё дерево комментариев проблемы одним запросом.
+
+        Выбирает все комментарии проблемы (индекс по issue_id), затем
+        собирает дерево в Python: replies и parent каждого комментария
+        заполняются через set_committed_value, поэтому обращение к ним
+        не порождает дополнительных запросов на каждом уровне вложенности.
+
+        Args:
+            issue_id (UUID): UUID проблемы.
+
+        Returns:
+            List[IssueCommentModel]: Корневые комментарии с заполненными replies.
+
+        Example:
+            >>> roots = await repo.get_issue_comment_tree(issue_id)
+            >>> roots[0].replies[0].replies  # Любая глубина без запросов
+            [<IssueCommentModel>, ...]
+
+        Note:
+            Два запроса независимо от глубины: комментарии + selectin для author.
+        """
+        logger.debug("🔍 Загрузка дерева комментариев проблемы: %s", issue_id)
+
+        query = (
+            select(IssueCommentModel)
+            .where(IssueCommentModel.issue_id == issue_id)
+            .options(*self._TREE_LOAD_OPTIONS)
+            .order_by(IssueCommentModel.created_at)
+        )
+        comments = await self.execute_and_return_scalars(query)
+
+        roots = self._link_comment_tree(comments).get(None, [])
+        logger.info(
+            "✨ Дерево проблемы %s: %d комментариев, %d корневых",
+            issue_id,
+            len(comments),
+            len(roots),
+        )
+        return roots
+
     async def get_comment_tree(
         self,
         parent_id: UUID,
@@ -151,26 +232,32 @@ class IssueCommentRepository(BaseRepository[IssueCommentModel]):
             [<IssueCommentModel>, ...]
 
         Note:
-            Использует joinedload для author и selectinload для рекурсивной загрузки replies.
+            Поддерево выбирается одним запросом `path <@ :parent_path` (ltree),
+            replies связываются в Python; author загружается через selectinload.
         """
         logger.debug(
             "🔍 Получение дерева ответов на комментарий: %s", parent_id
         )
 
+        # Всё поддерево одним запросом по ltree-пути (GiST индекс), без
+        # selectin-запроса на каждый уровень вложенности
+        parent_path = (
+            select(IssueCommentModel.path)
+            .where(IssueCommentModel.id == parent_id)
+            .scalar_subquery()
+        )
         query = (
             select(IssueCommentModel)
-            .where(IssueCommentModel.parent_id == parent_id)
-            .options(
-                joinedload(IssueCommentModel.author),  # Eager load автора
-                selectinload(IssueCommentModel.replies).options(
-                    joinedload(IssueCommentModel.author),
-                    selectinload(IssueCommentModel.replies),  # Рекурсивная загрузка
-                ),
+            .where(
+                IssueCommentModel.path.op("<@")(parent_path),
+                IssueCommentModel.id != parent_id,
             )
+            .options(*self._TREE_LOAD_OPTIONS)
             .order_by(IssueCommentModel.created_at)
         )
+        subtree = await self.execute_and_return_scalars(query)
 
-        replies = await self.execute_and_return_scalars(query)
+        replies = self._link_comment_tree(subtree).get(parent_id, [])
 
         logger.info(
             "✨ Получено %d ответов на комментарий %s", len(replies), parent_id
@@ -261,7 +261,7 @@ class IssueRepository(BaseRepository[IssueModel]):
             ...     solution="Заменён датчик положения"
             ... )
             >>> resolved.status
-            <IssueStatus.GREEN: 'green'>
+            'green'
             >>> resolved.resolved_at
             datetime(2025, 11, 10, 16, 30, 0)
         """
@@ -271,7 +271,7 @@ class IssueRepository(BaseRepository[IssueModel]):
             return None
 
         # Обновляем поля решения
-        issue.status = IssueStatus.GREEN
+        issue.status = IssueStatus.GREEN.value
         issue.solution = solution
         issue.resolved_at = datetime.now(timezone.utc)
 
@@ -293,6 +293,7 @@ class IssueRepository(BaseRepository[IssueModel]):
         current_user_id: Optional[UUID] = None,
         is_admin: bool = False,
         public_only: bool = False,
+        custom_fields: Optional[dict] = None,
         limit: int = 50,
         offset: int = 0,
     ) -> List[IssueModel]:
@@ -317,6 +318,7 @@ class IssueRepository(BaseRepository[IssueModel]):
             current_user_id: UUID текущего пользователя (для PRIVATE visibility).
             is_admin: Флаг админа (bypasses visibility checks).
             public_only: Только PUBLIC issues (для публичного поиска).
+            custom_fields: Фильтр по полям шаблона (containment, GIN индекс).
             limit: Максимальное количество результатов.
             offset: Смещение для пагинации.
 
@@ -355,6 +357,8 @@ class IssueRepository(BaseRepository[IssueModel]):
                     IssueModel.description.ilike(search_pattern),
                 )
             )
+        if custom_fields:
+            conditions.append(IssueModel.custom_fields_contains(custom_fields))
 
         # === Visibility filters ===
         visibility_conditions = []
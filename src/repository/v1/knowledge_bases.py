@@ -4,16 +4,53 @@
 Предоставляет CRUD и специфичные запросы для KnowledgeBaseModel.
 """
 
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func, literal_column, select, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import with_expression
 
-from src.models.v1.knowledge_bases import KnowledgeBaseModel
+from src.models.v1.knowledge_bases import (
+    KB_STATS_VIEW,
+    DocumentChunkModel,
+    KnowledgeBaseModel,
+)
 from src.repository.base import BaseRepository
 
 
+def _kb_stat(stat_column):
+    """Коррелированный подзапрос значения из mv_kb_stats для текущей KB (0, если строки нет)."""
+    return func.coalesce(
+        select(stat_column)
+        .where(KB_STATS_VIEW.c.kb_id == KnowledgeBaseModel.id)
+        .scalar_subquery(),
+        0,
+    )
+
+
+# Заполняет documents_count / indexed_documents_count из mv_kb_stats
+_STATS_LOAD_OPTIONS = (
+    with_expression(
+        KnowledgeBaseModel.documents_count, _kb_stat(KB_STATS_VIEW.c.total_docs)
+    ),
+    with_expression(
+        KnowledgeBaseModel.indexed_documents_count,
+        _kb_stat(KB_STATS_VIEW.c.indexed_docs),
+    ),
+)
+
+
 class KnowledgeBaseRepository(BaseRepository[KnowledgeBaseModel]):
     """Репозиторий для KnowledgeBaseModel.
 
     Предоставляет стандартные CRUD через BaseRepository и дополнительные методы.
+
+    Methods:
+        get_with_stats: KB со счётчиками документов из mv_kb_stats
+        refresh_stats: REFRESH MATERIALIZED VIEW CONCURRENTLY mv_kb_stats
+        rebuild_vector_index: Пересборка ANN индекса KB по vector_store_config
     """
 
     def __init__(self, session: AsyncSession):
@@ -23,3 +60,148 @@ class KnowledgeBaseRepository(BaseRepository[KnowledgeBaseModel]):
             session: Асинхронная сессия SQLAlchemy
         """
         super().__init__(session=session, model=KnowledgeBaseModel)
+
+    async def get_with_stats(self, kb_id: UUID) -> Optional[KnowledgeBaseModel]:
+        """Получает KB с заполненными documents_count и indexed_documents_count.
+
+        Значения берутся из mv_kb_stats и отстают от documents на интервал
+        между вызовами refresh_stats().
+
+        Args:
+            kb_id: UUID knowledge base
+
+        Returns:
+            Optional[KnowledgeBaseModel]: KB или None, если не найдена
+        """
+        statement = (
+            select(self.model)
+            .where(self.model.id == kb_id)
+            .options(*_STATS_LOAD_OPTIONS)
+            .execution_options(populate_existing=True)
+        )
+        return await self.execute_and_return_scalar(statement)
+
+    async def refresh_stats(self) -> None:
+        """Пересчитывает mv_kb_stats без блокировки чтения.
+
+        REFRESH ... CONCURRENTLY (использует уникальный индекс по kb_id) не
+        блокирует SELECT из представления и не трогает строки knowledge_bases.
+        Вызывается периодически (src.core.lifespan.kb_stats, раз в
+        KB_STATS_REFRESH_INTERVAL секунд), а не на каждую вставку документа.
+
+        Raises:
+            SQLAlchemyError: При ошибке обновления (транзакция откатывается)
+        """
+        try:
+            await self.session.execute(
+                text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_kb_stats")
+            )
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            self.logger.error("Ошибка при обновлении mv_kb_stats: %s", e)
+            raise
+
+    async def rebuild_vector_index(self, kb_id: UUID) -> Optional[dict]:
+        """Пересобирает ANN индекс эмбеддингов KB под текущее число векторов.
+
+        Тип индекса берётся из vector_store_config["index_type"], параметры
+        подбирает KnowledgeBaseModel.default_vector_store_config: для HNSW —
+        уровень m/ef_construction, для IVFFlat — lists = max(100, sqrt(N)).
+        Индекс частичный (WHERE kb_id = ...) и строится на партиции
+        document_chunks, в которую попадает KB: новый индекс собирается
+        CREATE INDEX CONCURRENTLY под временным именем и подменяет старый,
+        поэтому запись в партицию не блокируется, а поиск не остаётся без индекса.
+        Итоговые параметры сохраняются в vector_store_config.
+
+        Args:
+            kb_id: UUID knowledge base
+
+        Returns:
+            Optional[dict]: Новая vector_store_config или None, если KB не найдена
+
+        Note:
+            CONCURRENTLY не выполняется внутри транзакции, поэтому DDL идёт
+            через отдельное соединение в режиме AUTOCOMMIT; текущая транзакция
+            сессии перед этим фиксируется.
+        """
+        kb = await self.get_item_by_id(kb_id)
+        if kb is None:
+            return None
+
+        result = await self.session.execute(
+            select(
+                func.count(),
+                func.min(literal_column("tableoid::regclass::text")),
+            ).where(DocumentChunkModel.kb_id == kb_id)
+        )
+        vector_count, partition = result.one()
+
+        config = {
+            **kb.vector_store_config,
+            **KnowledgeBaseModel.default_vector_store_config(
+                vector_count, kb.vector_store_config.get("index_type", "hnsw")
+            ),
+        }
+
+        if partition is not None:
+            await self.session.commit()
+            await self._swap_vector_index(kb_id, partition, config)
+
+        kb.vector_store_config = config
+        await self.session.commit()
+
+        self.logger.info(
+            "Индекс %s KB %s пересобран (%d векторов)",
+            config["index_type"],
+            kb_id,
+            vector_count,
+        )
+        return config
+
+    async def _swap_vector_index(self, kb_id: UUID, partition: str, config: dict) -> None:
+        """Строит частичный индекс KB под временным именем и подменяет им текущий.
+
+        Подмена — два ALTER INDEX ... RENAME в одной транзакции (старый индекс
+        уходит в {name}_old, новый занимает {name}), поэтому партиция ни в
+        какой момент не остаётся без индекса; старый удаляется уже после.
+
+        Args:
+            kb_id: UUID knowledge base (литерал в предикате индекса)
+            partition: Имя партиции document_chunks (tableoid::regclass)
+            config: vector_store_config с index_type и параметрами сборки
+        """
+        name = f"ix_document_chunks_kb_{kb_id.hex}"
+        if config["index_type"] == "ivfflat":
+            method, params = "ivfflat", f"lists = {int(config['lists'])}"
+        else:
+            method, params = "hnsw", (
+                f"m = {int(config['m'])}, "
+                f"ef_construction = {int(config['ef_construction'])}"
+            )
+
+        async with self.session.bind.connect() as connection:
+            await connection.execution_options(isolation_level="AUTOCOMMIT")
+            await connection.execute(text("SET maintenance_work_mem = '2GB'"))
+            try:
+                for leftover in (f"{name}_new", f"{name}_old"):
+                    await connection.execute(
+                        text(f"DROP INDEX CONCURRENTLY IF EXISTS {leftover}")
+                    )
+                await connection.execute(
+                    text(
+                        f"CREATE INDEX CONCURRENTLY {name}_new ON {partition} "
+                        f"USING {method} (embedding halfvec_ip_ops) "
+                        f"WITH ({params}) WHERE kb_id = '{kb_id}'"
+                    )
+                )
+                async with self.session.bind.begin() as swap:
+                    await swap.execute(
+                        text(f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_old")
+                    )
+                    await swap.execute(text(f"ALTER INDEX {name}_new RENAME TO {name}"))
+                await connection.execute(
+                    text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}_old")
+                )
+            finally:
+                await connection.execute(text("RESET maintenance_work_mem"))
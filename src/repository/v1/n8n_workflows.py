@@ -1,8 +1,10 @@
 """Repository для работы с n8n workflows."""
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import func, update
+
 from src.models.v1.n8n_workflows import N8nWorkflowModel
 from src.repository.base import BaseRepository
 
@@ -58,19 +60,33 @@ class N8nWorkflowRepository(BaseRepository[N8nWorkflowModel]):
             workflow_type=workflow_type,
         )
 
-    async def increment_execution_count(self, workflow_id: UUID) -> N8nWorkflowModel:
-        """Увеличить счетчик выполнений workflow.
+    async def increment_execution_count(
+        self, workflow_id: UUID
+    ) -> Optional[N8nWorkflowModel]:
+        """Увеличить счетчик выполнений workflow и отметить время запуска.
+
+        Один атомарный `UPDATE ... SET execution_count = execution_count + 1,
+        last_triggered_at = now() RETURNING *` — без предварительного SELECT
+        и без потери инкрементов при параллельных запусках.
 
         Args:
             workflow_id: UUID workflow.
 
         Returns:
-            N8nWorkflowModel: Обновлённый workflow.
+            Optional[N8nWorkflowModel]: Обновлённый workflow или None, если не найден.
         """
-        workflow = await self.get_item_by_id(workflow_id)
-        if workflow:
-            return await self.update_item(
-                workflow_id,
-                {"execution_count": workflow.execution_count + 1},
+        statement = (
+            update(self.model)
+            .where(self.model.id == workflow_id)
+            .values(
+                execution_count=self.model.execution_count + 1,
+                last_triggered_at=func.now(),
             )
+            .returning(self.model)
+        )
+        result = await self.session.execute(statement)
+        workflow = result.scalar_one_or_none()
+
+        if workflow is not None:
+            await self.session.commit()
         return workflow
@@ -192,44 +192,6 @@ class TemplateRepository(BaseRepository[TemplateModel]):
         )
         return templates
 
-    async def increment_usage_count(self, template_id: UUID) -> TemplateModel:
-        """
-        Увеличивает счётчик использований шаблона.
-
-        Вызывается когда проблема создаётся на основе шаблона.
-        Инкрементирует usage_count на 1.
-
-        Args:
-            template_id: UUID шаблона.
-
-        Returns:
-            Обновлённый TemplateModel с увеличенным usage_count.
-
-        Raises:
-            ValueError: Если шаблон не найден (через get_item_by_id).
-
-        Example:
-            >>> # После создания Issue с template_id
-            >>> template = await repository.increment_usage_count(template_id)
-            >>> print(f"Использован {template.usage_count} раз")
-        """
-        # Получить текущее значение usage_count
-        template = await self.get_item_by_id(template_id)
-        if not template:
-            raise ValueError(f"Шаблон с ID {template_id} не найден")
-
-        # Увеличить счётчик через update_item
-        updated = await self.update_item(
-            template_id, {"usage_count": template.usage_count + 1}
-        )
-
-        self.logger.info(
-            "Увеличен счётчик использований шаблона %s до %d",
-            template_id,
-            updated.usage_count,
-        )
-        return updated
-
     async def deactivate_template(self, template_id: UUID) -> TemplateModel:
         """
         Деактивирует шаблон (soft delete).
@@ -168,8 +168,8 @@ class UserRepository(BaseRepository[UserModel]):
         """
         from src.models.v1.roles import UserRoleModel
 
-        # 1. Создаём пользователя
-        user = await self.create_item(user_data)
+        # 1. Создаём пользователя (primary_role — копия назначаемой роли)
+        user = await self.create_item({**user_data, "primary_role": role_code})
 
         # 2. Создаём связь пользователь-роль
         role = UserRoleModel(
@@ -11,17 +11,24 @@ Repository для работы с Workspace и WorkspaceMember.
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm import joinedload, selectinload
 
 from src.models.v1.workspaces import (
     WorkspaceMemberModel,
     WorkspaceMemberRole,
     WorkspaceModel,
     WorkspaceVisibility,
+    to_member_role,
 )
 from src.repository.base import BaseRepository
 
+# owner и members.user для WorkspaceDetailSchema (relationships объявлены lazy="raise")
+_DETAIL_LOAD_OPTIONS = (
+    joinedload(WorkspaceModel.owner),
+    selectinload(WorkspaceModel.members).joinedload(WorkspaceMemberModel.user),
+)
+
 
 class WorkspaceRepository(BaseRepository[WorkspaceModel]):
     """
@@ -34,9 +41,12 @@ class WorkspaceRepository(BaseRepository[WorkspaceModel]):
         model_class: WorkspaceModel - класс модели для операций
 
     Methods:
-        get_by_slug: Получить workspace по slug
+        get_by_slug: Получить workspace по slug (с owner и участниками)
+        get_with_owner: Получить workspace по ID с owner и участниками
+        list_with_owner: Получить список workspace с owner
         get_user_workspaces: Получить все workspace пользователя (owned + member)
         get_public_workspaces: Получить список публичных workspace
+        get_by_settings: Получить workspace по фрагменту settings (GIN, @>)
         slug_exists: Проверить существование slug
 
     Example:
@@ -52,6 +62,10 @@ class WorkspaceRepository(BaseRepository[WorkspaceModel]):
         """
         Получить workspace по slug.
 
+        slug приводится к нижнему регистру (в БД хранятся только такие,
+        check_workspaces_slug_lowercase), поэтому сравнение идёт напрямую
+        по уникальному индексу.
+
         Args:
             slug: URL-friendly идентификатор workspace
 
@@ -63,7 +77,66 @@ class WorkspaceRepository(BaseRepository[WorkspaceModel]):
             >>> workspace.slug
             'marketing-team'
         """
-        return await self.get_item_by_field("slug", slug)
+        query = (
+            select(WorkspaceModel)
+            .where(WorkspaceModel.slug == slug.lower())
+            .options(*_DETAIL_LOAD_OPTIONS)
+        )
+        return await self.execute_and_return_scalar(query)
+
+    async def get_with_owner(self, workspace_id: UUID) -> Optional[WorkspaceModel]:
+        """
+        Получить workspace по ID с загруженными owner и members.user.
+
+        populate_existing перечитывает объект, уже находящийся в сессии
+        (например, после update_item), чтобы members получили загруженных user.
+
+        Args:
+            workspace_id: UUID workspace
+
+        Returns:
+            Optional[WorkspaceModel]: Workspace если найден, иначе None
+
+        Example:
+            >>> workspace = await repo.get_with_owner(workspace_id)
+            >>> workspace.owner.username
+            'john_doe'
+        """
+        query = (
+            select(WorkspaceModel)
+            .where(WorkspaceModel.id == workspace_id)
+            .options(*_DETAIL_LOAD_OPTIONS)
+            .execution_options(populate_existing=True)
+        )
+        return await self.execute_and_return_scalar(query)
+
+    async def list_with_owner(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[WorkspaceModel]:
+        """
+        Получить список workspace с owner (один запрос, JOIN на users).
+
+        Args:
+            limit: Максимальное количество записей
+            offset: Смещение для пагинации
+
+        Returns:
+            List[WorkspaceModel]: Список workspace с загруженным owner
+
+        Example:
+            >>> workspaces = await repo.list_with_owner(limit=20)
+            >>> [w.owner.username for w in workspaces]
+        """
+        query = (
+            select(WorkspaceModel)
+            .options(joinedload(WorkspaceModel.owner))
+            .order_by(WorkspaceModel.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return await self.execute_and_return_scalars(query)
 
     async def get_user_workspaces(
         self,
@@ -93,7 +166,9 @@ class WorkspaceRepository(BaseRepository[WorkspaceModel]):
         """
         if not include_member:
             # Только owned workspace
-            return await self.filter_by(owner_id=user_id)
+            return await self.get_items_with_relations(
+                [selectinload(WorkspaceModel.members)], owner_id=user_id
+            )
 
         # Owned + member workspace
         query = (
@@ -103,10 +178,7 @@ class WorkspaceRepository(BaseRepository[WorkspaceModel]):
                 (WorkspaceModel.owner_id == user_id)
                 | (WorkspaceMemberModel.user_id == user_id)
             )
-            .options(
-                selectinload(WorkspaceModel.owner),
-                selectinload(WorkspaceModel.members),
-            )
+            .options(selectinload(WorkspaceModel.members))
             .distinct()
         )
 
@@ -134,8 +206,41 @@ class WorkspaceRepository(BaseRepository[WorkspaceModel]):
         """
         query = (
             select(WorkspaceModel)
-            .where(WorkspaceModel.visibility == WorkspaceVisibility.PUBLIC)
-            .options(selectinload(WorkspaceModel.owner))
+            .where(WorkspaceModel.visibility == WorkspaceVisibility.PUBLIC.value)
+            .options(joinedload(WorkspaceModel.owner))
+            .limit(limit)
+            .offset(offset)
+        )
+
+        return await self.execute_and_return_scalars(query)
+
+    async def get_by_settings(
+        self,
+        settings: dict,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[WorkspaceModel]:
+        """
+        Получить workspace, settings которых содержат указанный фрагмент.
+
+        Фильтр строится как `settings @> :settings` (WorkspaceModel.settings_contains)
+        и идёт через GIN индекс ix_workspaces_settings_gin. Условия вида
+        `settings["auto_categorize"].as_boolean() == True` индекс не используют.
+
+        Args:
+            settings: Фрагмент настроек, например {"auto_categorize": True}
+            limit: Максимальное количество записей
+            offset: Смещение для пагинации
+
+        Returns:
+            List[WorkspaceModel]: Список подходящих workspace
+
+        Example:
+            >>> workspaces = await repo.get_by_settings({"smart_search_enabled": True})
+        """
+        query = (
+            select(WorkspaceModel)
+            .where(WorkspaceModel.settings_contains(settings))
             .limit(limit)
             .offset(offset)
         )
@@ -173,6 +278,7 @@ class WorkspaceMemberRepository(BaseRepository[WorkspaceMemberModel]):
     Methods:
         get_workspace_members: Получить всех участников workspace
         get_member: Получить запись участника
+        get_with_user: Получить запись участника по ID с user
         get_user_role: Получить роль пользователя в workspace
         is_member: Проверить членство пользователя
         has_role: Проверить роль пользователя
@@ -231,14 +337,16 @@ class WorkspaceMemberRepository(BaseRepository[WorkspaceMemberModel]):
         Example:
             >>> member = await repo.get_member(workspace_id, user_id)
             >>> if member:
-            ...     print(f"Роль: {member.role.value}")
+            ...     print(f"Роль: {member.role}")
+
+        Note:
+            Запрос собран через lambda_stmt: SQL компилируется один раз
+            на call site, а workspace_id/user_id передаются как bound-параметры.
+            Для проверок доступа используется get_user_role (только role).
         """
-        query = select(WorkspaceMemberModel).where(
-            and_(
-                WorkspaceMemberModel.workspace_id == workspace_id,
-                WorkspaceMemberModel.user_id == user_id,
-            )
-        )
+        query = lambda_stmt(lambda: select(WorkspaceMemberModel))
+        query += lambda s: s.where(WorkspaceMemberModel.workspace_id == workspace_id)
+        query += lambda s: s.where(WorkspaceMemberModel.user_id == user_id)
 
         return await self.execute_and_return_scalar(query)
 
@@ -261,9 +369,19 @@ class WorkspaceMemberRepository(BaseRepository[WorkspaceMemberModel]):
             >>> role = await repo.get_user_role(workspace_id, user_id)
             >>> if role == WorkspaceMemberRole.ADMIN:
             ...     print("Пользователь - администратор")
+
+        Note:
+            Вызывается на каждую проверку доступа (is_member, has_role,
+            _check_admin_permission), поэтому читается только role:
+            uq_workspace_member содержит role в INCLUDE, и запрос выполняется
+            index-only scan без обращения к heap.
         """
-        member = await self.get_member(workspace_id, user_id)
-        return member.role if member else None
+        query = lambda_stmt(lambda: select(WorkspaceMemberModel.role))
+        query += lambda s: s.where(WorkspaceMemberModel.workspace_id == workspace_id)
+        query += lambda s: s.where(WorkspaceMemberModel.user_id == user_id)
+
+        role = await self.execute_and_return_scalar(query)
+        return to_member_role(role) if role is not None else None
 
     async def is_member(
         self,
@@ -284,8 +402,7 @@ class WorkspaceMemberRepository(BaseRepository[WorkspaceMemberModel]):
             >>> if await repo.is_member(workspace_id, user_id):
             ...     print("Пользователь имеет доступ")
         """
-        member = await self.get_member(workspace_id, user_id)
-        return member is not None
+        return await self.get_user_role(workspace_id, user_id) is not None
 
     async def has_role(
         self,
@@ -343,14 +460,35 @@ class WorkspaceMemberRepository(BaseRepository[WorkspaceMemberModel]):
             return None
 
         # Используем update_item из BaseRepository
-        updated = await self.update_item(
+        await self.update_item(
             member.id,
-            {"role": new_role},
+            {"role": new_role.value},
         )
 
         # Загружаем связанный user
-        await self.session.refresh(updated, ["user"])
-        return updated
+        return await self.get_with_user(member.id)
+
+    async def get_with_user(self, member_id: UUID) -> Optional[WorkspaceMemberModel]:
+        """
+        Получить запись участника по ID с загруженным user.
+
+        Args:
+            member_id: UUID записи участника
+
+        Returns:
+            Optional[WorkspaceMemberModel]: Участник с user или None
+
+        Example:
+            >>> member = await repo.get_with_user(member_id)
+            >>> member.user.username
+            'john_doe'
+        """
+        query = (
+            select(WorkspaceMemberModel)
+            .where(WorkspaceMemberModel.id == member_id)
+            .options(joinedload(WorkspaceMemberModel.user))
+        )
+        return await self.execute_and_return_scalar(query)
 
     async def remove_member(
         self,
@@ -231,6 +231,7 @@ class DocumentServiceListItemSchema(BaseSchema):
         workspace_id: UUID workspace.
         is_public: Публичный ли сервис.
         view_count: Количество просмотров.
+        has_ai_chat: Включена ли функция AI-чата (вычисляется в SQL).
         created_at: Дата создания.
 
     Example:
@@ -247,6 +248,7 @@ class DocumentServiceListItemSchema(BaseSchema):
             "workspace_id": "...",
             "is_public": false,
             "view_count": 42,
+            "has_ai_chat": true,
             "created_at": "2025-11-10T08:00:00Z"
         }
     """
@@ -264,6 +266,15 @@ class DocumentServiceListItemSchema(BaseSchema):
     workspace_id: Optional[uuid.UUID] = Field(description="UUID workspace")
     is_public: bool = Field(description="Публичный ли сервис")
     view_count: int = Field(description="Количество просмотров")
+    has_ai_chat: bool = Field(
+        default=False, description="Включена ли функция AI-чата"
+    )
+
+    @field_validator("has_ai_chat", mode="before")
+    @classmethod
+    def none_as_false(cls, value: Optional[bool]) -> bool:
+        """has_ai_chat не вычислялся запросом (None) — считаем False."""
+        return bool(value)
 
 
 class DocumentServiceResponseSchema(BaseResponseSchema):
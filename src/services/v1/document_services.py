@@ -16,6 +16,7 @@ from uuid import UUID
 
 from fastapi import UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.core.exceptions import (
     DocumentAccessDeniedError,
@@ -258,13 +259,10 @@ class DocumentServiceService:
 
         # Инкремент счётчика просмотров
         if increment_views:
-            await self.repository.increment_view_count(service_id)
-            await self.repository.session.refresh(service)
-            # Перезагрузить relationships после refresh
-            await self.repository.session.refresh(
-                service,
-                attribute_names=["author", "workspace"]
-            )
+            view_count = await self.repository.increment_view_count(service_id)
+            if view_count is not None:
+                # Значение уже в БД — обновляем атрибут без повторного SELECT
+                set_committed_value(service, "view_count", view_count)
 
         return service
 
@@ -363,26 +363,9 @@ class IssueService(BaseService):
         if custom_fields:
             issue_data["custom_fields"] = custom_fields
 
+        # usage_count шаблона увеличивает триггер templates_usage_count_insert в БД
         issue = await self.repository.create_item(issue_data)
 
-        # Увеличить usage_count шаблона если указан
-        if template_id:
-            try:
-                template_repo = TemplateRepository(self.session)
-                await template_repo.increment_usage_count(template_id)
-                self.logger.info(
-                    "Увеличен счётчик шаблона %s для проблемы %s",
-                    template_id,
-                    issue.id,
-                )
-            except Exception as e:
-                # Не критично если не удалось обновить счётчик
-                self.logger.warning(
-                    "Не удалось обновить счётчик шаблона %s: %s",
-                    template_id,
-                    str(e),
-                )
-
         self.logger.info("Создана проблема %s пользователем %s", issue.id, author_id)
 
         # Вызов n8n webhook для авто-категоризации (опционально)
@@ -400,6 +383,7 @@ class IssueService(BaseService):
             issue: Созданная Issue для категоризации.
         """
         try:
+            from src.models.v1.n8n_workflows import N8nWorkflowType
             from src.repository.v1.n8n_workflows import N8nWorkflowRepository
             from src.core.integrations.n8n import n8n_webhook_client
 
@@ -408,7 +392,7 @@ class IssueService(BaseService):
             # Ищем активный workflow AUTO_CATEGORIZE для workspace Issue
             workflows = await workflow_repo.filter_by(
                 workspace_id=issue.workspace_id,
-                workflow_type="AUTO_CATEGORIZE",
+                workflow_type=N8nWorkflowType.AUTO_CATEGORIZE.value,
                 is_active=True
             )
 
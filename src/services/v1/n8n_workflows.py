@@ -1,6 +1,5 @@
 """Service для работы с n8n workflows."""
 
-from datetime import datetime
 from typing import List
 from uuid import UUID
 
@@ -156,11 +155,5 @@ class N8nWorkflowService:
         if not workflow.is_active:
             raise ValueError("Workflow неактивен")
 
-        # Обновляем счетчик и время последнего запуска
-        return await self.repository.update_item(
-            workflow_id,
-            {
-                "execution_count": workflow.execution_count + 1,
-                "last_triggered_at": datetime.utcnow(),
-            },
-        )
+        # Обновляем счетчик и время последнего запуска (атомарно в БД)
+        return await self.repository.increment_execution_count(workflow_id)
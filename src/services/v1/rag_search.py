@@ -13,7 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.settings import settings
 from src.core.exceptions import KnowledgeBaseNotFoundError
 from src.core.integrations.ai.embeddings.openrouter import OpenRouterEmbeddings
-from src.repository.v1.document_chunks import DocumentChunkRepository
+from src.repository.v1.document_chunks import HNSW_EF_SEARCH, DocumentChunkRepository
 from src.repository.v1.knowledge_bases import KnowledgeBaseRepository
 
 
@@ -118,12 +118,16 @@ class RAGSearchService:
         # Генерация embedding для запроса
         query_embedding = await self._generate_query_embedding(query)
 
-        # Векторный поиск
+        # Векторный поиск (тип индекса и глубина поиска — из конфигурации KB)
+        config = kb.vector_store_config
         results = await self.similarity_search(
             embedding=query_embedding,
             kb_id=kb_id,
             limit=limit,
             min_similarity=min_similarity,
+            ef_search=config.get("ef_search"),
+            binary_prefilter=config.get("binary_prefilter", False),
+            probes=config.get("probes") if config.get("index_type") == "ivfflat" else None,
         )
 
         return results
@@ -134,6 +138,9 @@ class RAGSearchService:
         kb_id: UUID,
         limit: int | None = None,
         min_similarity: float | None = None,
+        ef_search: int | None = None,
+        binary_prefilter: bool = False,
+        probes: int | None = None,
     ) -> List[RAGSearchResult]:
         """
         Векторный поиск по готовому embedding.
@@ -145,6 +152,9 @@ class RAGSearchService:
             kb_id: UUID Knowledge Base
             limit: Макс. количество результатов (default: из settings.RAG_SEARCH_LIMIT)
             min_similarity: Минимальный порог similarity (0-1, default: из settings.RAG_MIN_SIMILARITY)
+            ef_search: Глубина поиска HNSW (default: HNSW_EF_SEARCH репозитория)
+            binary_prefilter: Двухэтапный поиск (hamming prefilter + cosine rerank)
+            probes: ivfflat.probes для KB с index_type="ivfflat" (None — HNSW)
 
         Returns:
             List[RAGSearchResult]: Результаты поиска
@@ -159,6 +169,9 @@ class RAGSearchService:
             kb_id=kb_id,
             limit=limit,
             min_similarity=min_similarity,
+            ef_search=ef_search or HNSW_EF_SEARCH,
+            binary_prefilter=binary_prefilter,
+            probes=probes,
         )
 
         # Преобразуем в domain objects
@@ -313,7 +313,7 @@ class SearchService(BaseService):
                         score=score,
                         metadata={
                             "category": issue.category,
-                            "status": issue.status.value,
+                            "status": issue.status,
                             "author_id": str(issue.author_id),
                             "created_at": issue.created_at.isoformat(),
                             "resolved_at": issue.resolved_at.isoformat() if issue.resolved_at else None,
@@ -31,6 +31,7 @@ from src.models.v1.workspaces import (
     WorkspaceMemberModel,
     WorkspaceMemberRole,
     WorkspaceModel,
+    to_member_role,
 )
 from src.repository.v1.users import UserRepository
 from src.repository.v1.workspaces import (
@@ -138,12 +139,12 @@ class WorkspaceService:
         member_data = {
             "workspace_id": workspace.id,
             "user_id": user_id,
-            "role": WorkspaceMemberRole.OWNER,
+            "role": WorkspaceMemberRole.OWNER.value,
         }
         await self.member_repo.create_item(member_data)
         logger.info("Добавлен OWNER-участник %s в workspace %s", user_id, workspace.id)
 
-        return workspace
+        return await self.workspace_repo.get_with_owner(workspace.id)
 
     async def get_workspace(
         self,
@@ -173,7 +174,7 @@ class WorkspaceService:
             ...     user_id=current_user.id
             ... )
         """
-        workspace = await self.workspace_repo.get_item_by_id(workspace_id)
+        workspace = await self.workspace_repo.get_with_owner(workspace_id)
         if not workspace:
             logger.warning("Workspace %s не найден", workspace_id)
             raise WorkspaceNotFoundError(workspace_id=workspace_id)
@@ -290,10 +291,10 @@ class WorkspaceService:
 
         # Обновление
         update_data = data.model_dump(exclude_unset=True)
-        updated = await self.workspace_repo.update_item(workspace_id, update_data)
+        await self.workspace_repo.update_item(workspace_id, update_data)
 
         logger.info("Обновлён workspace %s пользователем %s", workspace_id, user_id)
-        return updated
+        return await self.workspace_repo.get_with_owner(workspace_id)
 
     async def add_member(
         self,
@@ -369,9 +370,10 @@ class WorkspaceService:
         member_data = {
             "workspace_id": workspace_id,
             "user_id": data.user_id,
-            "role": WorkspaceMemberRole(data.role.lower()),
+            "role": to_member_role(data.role.lower()).value,
         }
         member = await self.member_repo.create_item(member_data)
+        member = await self.member_repo.get_with_user(member.id)
 
         logger.info(
             "Добавлен участник %s с ролью %s в workspace %s",